@@ -0,0 +1,56 @@
+"""Shared helpers for the offline benchmarks.
+
+Benchmarks run from a source checkout without network access:
+``python benchmarks/<name>.py``. They reuse the test stand-ins from ``tests/``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for _p in (ROOT / "src", ROOT / "tests"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+from synthetic import clause_text, make_synthetic_pdf, synthetic_page_text  # noqa: E402
+
+# The offline test embeddings are not unit length, so L2-based relevance scores fall
+# outside [0, 1]; only their order matters here.
+warnings.filterwarnings("ignore", message="Relevance scores must be between")
+
+__all__ = ["Timer", "clause_text", "make_synthetic_pdf", "report", "synthetic_page_text"]
+
+
+class Timer:
+    """``with Timer() as t: ...`` then read ``t.elapsed`` (seconds)."""
+
+    def __enter__(self) -> Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self._start
+
+
+def report(title: str, rows: list[dict[str, object]]) -> None:
+    """Print rows as an aligned plain-text table."""
+
+    print(f"\n## {title}")
+    if not rows:
+        print("(no rows)")
+        return
+    cols = list(rows[0])
+    widths = {c: max(len(c), *(len(_fmt(r.get(c))) for r in rows)) for c in cols}
+    print("  ".join(c.ljust(widths[c]) for c in cols))
+    for r in rows:
+        print("  ".join(_fmt(r.get(c)).ljust(widths[c]) for c in cols))
+
+
+def _fmt(v: object) -> str:
+    if isinstance(v, float):
+        return f"{v:,.3f}" if abs(v) < 100 else f"{v:,.0f}"
+    return str(v)
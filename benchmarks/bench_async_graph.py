@@ -0,0 +1,106 @@
+"""Concurrent-question throughput: sync graph on worker threads vs async graph.
+
+``--users`` questions arrive at once. The sync path runs ``build_graph(...).invoke``
+on a pool of ``--workers`` threads (one blocked thread per in-flight question, like
+the Streamlit server); the async path awaits ``build_async_graph(...).ainvoke`` for
+all of them on one event loop. Both use ``ChatOpenAI`` against the local OpenAI
+stand-in, which takes ``--latency`` seconds per call (two calls per question).
+Latencies run from arrival, so they include time spent waiting for a free worker;
+``client_threads`` counts the threads serving questions (not the stand-in's).
+
+Usage: python benchmarks/bench_async_graph.py [--users 16,64,128] [--workers 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+from langchain_openai import ChatOpenAI
+from openai_stub import OpenAIStub
+
+from uae_legal_rag.graph.legal_graph import LegalState, build_async_graph, build_graph
+
+DOCS = [
+    Document(
+        page_content="The Supplier shall indemnify the Buyer against all claims.",
+        metadata={"source": "msa.pdf", "page": 3},
+    )
+]
+
+
+def timed(fn, question: LegalState, arrived: float) -> float:
+    fn(question)
+    return time.perf_counter() - arrived
+
+
+async def atimed(fn, question: LegalState, arrived: float) -> float:
+    await fn(question)
+    return time.perf_counter() - arrived
+
+
+def row(path: str, users: int, elapsed: float, latencies: list[float], threads: int) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "path": path,
+        "users": users,
+        "questions_per_s": users / elapsed,
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[int(0.95 * (len(latencies) - 1))],
+        "client_threads": threads,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--users", default="16,64,128")
+    ap.add_argument("--workers", type=int, default=16, help="sync worker threads")
+    ap.add_argument("--latency", type=float, default=2.0, help="seconds per LLM call")
+    args = ap.parse_args()
+
+    rows = []
+    with OpenAIStub(latency_s=args.latency) as stub:
+        llm = ChatOpenAI(model="gpt-stub", api_key="bench-key", base_url=stub.base_url)
+
+        async def aretrieve(_q: str) -> list[Document]:
+            return DOCS
+
+        retriever = RunnableLambda(lambda q: DOCS, afunc=aretrieve)
+        sync_graph = build_graph(retriever, llm)
+        async_graph = build_async_graph(retriever, llm)
+        sync_graph.invoke(LegalState(question="warm up"))
+
+        for users in map(int, args.users.split(",")):
+            questions = [LegalState(question=f"Key risks {i}?") for i in range(users)]
+
+            with ThreadPoolExecutor(args.workers) as pool, Timer() as t:
+                arrived = time.perf_counter()
+                latencies = list(
+                    pool.map(lambda q: timed(sync_graph.invoke, q, arrived), questions)
+                )
+            threads = min(args.workers, users)
+            rows.append(row(f"sync x{args.workers}", users, t.elapsed, latencies, threads))
+
+            async def run_all() -> tuple[float, list[float]]:
+                with Timer() as t:
+                    arrived = time.perf_counter()
+                    tasks = [atimed(async_graph.ainvoke, q, arrived) for q in questions]
+                    latencies = await asyncio.gather(*tasks)
+                return t.elapsed, list(latencies)
+
+            elapsed, latencies = asyncio.run(run_all())
+            rows.append(row("async", users, elapsed, latencies, 1))
+    report(
+        f"Concurrent questions ({args.latency * 1000:.0f} ms per LLM call, 2 calls each)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Duplicate prompt tokens removed by stitching neighbouring retrieved chunks.
+
+Indexes a synthetic contract with long pages (several 1300-token chunks each, cut
+with the 200-token overlap), asks a set of questions at several ``k`` and compares
+the context built from the raw hits with the context built after ``stitch_chunks``.
+
+Like a real contract section, each page mostly covers one topic (``--locality`` is
+the share of its sentences on that topic), so a question tends to hit several
+chunks of the same page. Retrieval uses a normalized hashed bag-of-words embedding.
+
+Usage: python benchmarks/bench_chunk_stitching.py [--page-chars 12000] [--ks 4,6,8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import random
+import re
+import statistics
+import uuid
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from synthetic import CLAUSE_TEMPLATES
+
+from uae_legal_rag.ingestion.chunking import chunk_documents, token_len
+from uae_legal_rag.rag.formatting import docs_to_context, stitch_chunks
+from uae_legal_rag.rag.retriever import build_retriever
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+QUESTIONS = [
+    "How much written notice is needed to terminate the Agreement?",
+    "What is the cap on aggregate liability?",
+    "What liquidated damages apply per day of delay?",
+    "Does the Supplier indemnify and hold harmless the Client?",
+    "How is personal data processed under the PDPL?",
+    "Which laws govern and which courts have jurisdiction?",
+    "When must invoices be paid and what late fee applies?",
+    "How long must Confidential Information be kept confidential?",
+]
+
+
+class HashingEmbeddings(Embeddings):
+    """L2-normalized hashed bag of words: crude, but similarity tracks shared vocabulary."""
+
+    dim = 512
+
+    def _embed(self, text: str) -> list[float]:
+        vec = [0.0] * self.dim
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vec[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1.0
+        norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+        return [x / norm for x in vec]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+def topical_pages(n_pages: int, page_chars: int, locality: float, rng: random.Random):
+    pages = []
+    for p in range(n_pages):
+        topic = CLAUSE_TEMPLATES[p % len(CLAUSE_TEMPLATES)]
+        lines, size, c = [], 0, 0
+        while size < page_chars:
+            c += 1
+            sentences = [
+                (topic if rng.random() < locality else rng.choice(CLAUSE_TEMPLATES)).format(
+                    n=rng.randint(1, 90)
+                )
+                for _ in range(rng.randint(2, 4))
+            ]
+            lines.append(f"{p + 1}.{c} " + " ".join(sentences))
+            size += len(lines[-1]) + 1
+        pages.append(
+            Document(page_content="\n".join(lines), metadata={"filename": "msa.pdf", "page": p + 1})
+        )
+    return pages
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pages", type=int, default=30)
+    ap.add_argument("--page-chars", type=int, default=12_000)
+    ap.add_argument("--locality", type=float, default=0.7)
+    ap.add_argument("--ks", default="4,6,8")
+    ap.add_argument("--strategy", choices=["recursive", "clause"], default="recursive")
+    args = ap.parse_args()
+
+    rng = random.Random(23)
+    pages = topical_pages(args.pages, args.page_chars, args.locality, rng)
+    chunks = chunk_documents(pages, strategy=args.strategy)
+    vs = get_chroma(HashingEmbeddings(), None, f"bench_{uuid.uuid4().hex[:8]}")
+    vs.add_documents(chunks)
+    print(f"{len(pages)} pages -> {len(chunks)} {args.strategy} chunks")
+
+    rows = []
+    for k in map(int, args.ks.split(",")):
+        retriever = build_retriever(vs, k=k)
+        raw_tokens, stitched_tokens, passages, times = [], [], [], []
+        for q in QUESTIONS:
+            docs = retriever.invoke(q)
+            with Timer() as t:
+                stitched = stitch_chunks(docs)
+            times.append(t.elapsed)
+            raw_tokens.append(token_len(docs_to_context(docs)))
+            stitched_tokens.append(token_len(docs_to_context(stitched)))
+            passages.append(len(stitched))
+        raw, stitched_mean = statistics.mean(raw_tokens), statistics.mean(stitched_tokens)
+        rows.append(
+            {
+                "k": k,
+                "raw_tokens": raw,
+                "stitched_tokens": stitched_mean,
+                "saved_pct": 100 * (raw - stitched_mean) / raw,
+                "passages": statistics.mean(passages),
+                "stitch_us": statistics.mean(times) * 1e6,
+            }
+        )
+    report(f"Chunk stitching ({len(QUESTIONS)} questions, mean per question)", rows)
+
+
+if __name__ == "__main__":
+    main()
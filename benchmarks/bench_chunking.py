@@ -0,0 +1,88 @@
+"""Chunks/sec of the original per-call tiktoken splitter vs the cached splitter.
+
+Both are run page-by-page (as the streaming pipeline does) and over the whole
+corpus at once; chunk boundaries must come out identical.
+
+Usage: python benchmarks/bench_chunking.py [--pages 400] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+
+from _common import Timer, report, synthetic_page_text
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from uae_legal_rag.ingestion import chunking
+from uae_legal_rag.ingestion.chunking import chunk_documents, infer_section_type
+
+
+def baseline_chunk_documents(docs: list[Document]) -> list[Document]:
+    """The pre-change implementation: a fresh tiktoken splitter on every call."""
+
+    splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=1300,
+        chunk_overlap=200,
+        separators=["\n\n", "\n", ". ", "; ", ": ", " ", ""],
+    )
+    chunks = splitter.split_documents(docs)
+    for d in chunks:
+        section = infer_section_type(d.page_content)
+        if section:
+            d.metadata["section_type"] = section
+    return chunks
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pages", type=int, default=400)
+    ap.add_argument("--clauses", type=int, default=40, help="clauses per page")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    rng = random.Random(11)
+    docs = [
+        Document(
+            page_content=synthetic_page_text(p, rng, args.clauses),
+            metadata={"filename": "corpus.pdf", "page": p},
+        )
+        for p in range(1, args.pages + 1)
+    ]
+
+    def per_page(fn):
+        return [c for d in docs for c in fn([d])]
+
+    runs = [
+        ("baseline, per page", lambda: per_page(baseline_chunk_documents)),
+        ("baseline, whole corpus", lambda: baseline_chunk_documents(docs)),
+        ("cached, per page", lambda: per_page(chunk_documents)),
+        ("cached, whole corpus", lambda: chunk_documents(docs)),
+        (f"cached, {args.workers} workers", lambda: chunk_documents(docs, args.workers)),
+    ]
+
+    reference: list[Document] | None = None
+    rows = []
+    for label, fn in runs:
+        chunking.token_len.cache_clear()
+        with Timer() as t:
+            out = fn()
+        if reference is None:
+            reference = out
+        rows.append(
+            {
+                "mode": label,
+                "chunks": len(out),
+                "seconds": t.elapsed,
+                "chunks_per_s": len(out) / t.elapsed,
+                "same_boundaries": [c.page_content for c in out]
+                == [c.page_content for c in reference],
+            }
+        )
+    report(f"Chunking ({args.pages} pages)", rows)
+
+
+if __name__ == "__main__":
+    main()
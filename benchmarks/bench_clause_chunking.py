@@ -0,0 +1,81 @@
+"""Recursive vs clause-aware chunking on a numbered synthetic contract.
+
+Reports chunk count, tokens per chunk, how many chunks (and tokens) it takes to
+cover one sub-clause, the context a k=4 answer would carry, and throughput.
+
+Usage: python benchmarks/bench_clause_chunking.py [--clauses 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from synthetic import synthetic_contract_pages
+
+from uae_legal_rag.ingestion.chunking import chunk_documents, token_len
+
+
+def coverage(chunks: list[Document], clause_lines: list[str]) -> tuple[float, float]:
+    """Average chunks / tokens needed to see both ends of each clause line."""
+
+    n_chunks, n_tokens = [], []
+    for line in clause_lines:
+        head, tail = line[:40], line[-40:]
+        hit = {i for i, c in enumerate(chunks) if head in c.page_content}
+        hit |= {i for i, c in enumerate(chunks) if tail in c.page_content}
+        # A chunk holding the whole line covers it alone.
+        whole = [i for i in hit if line in chunks[i].page_content]
+        used = {whole[0]} if whole else hit
+        n_chunks.append(len(used))
+        n_tokens.append(sum(token_len(chunks[i].page_content) for i in used))
+    return statistics.mean(n_chunks), statistics.mean(n_tokens)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--clauses", type=int, default=400)
+    ap.add_argument("--k", type=int, default=4)
+    ap.add_argument("--sample", type=int, default=300, help="sub-clauses used for coverage")
+    args = ap.parse_args()
+
+    rng = random.Random(5)
+    pages = synthetic_contract_pages(args.clauses, rng)
+    docs = [
+        Document(page_content=text, metadata={"filename": "msa.pdf", "page": i})
+        for i, (text, _) in enumerate(pages, start=1)
+    ]
+    clause_lines = [
+        line
+        for text, _ in pages
+        for line in text.split("\n")
+        if line[:1].isdigit() and "." in line[:4]
+    ]
+    sample = rng.sample(clause_lines, min(args.sample, len(clause_lines)))
+
+    rows = []
+    for strategy in ("recursive", "clause"):
+        with Timer() as t:
+            chunks = chunk_documents(docs, strategy=strategy)
+        sizes = [token_len(c.page_content) for c in chunks]
+        cover_chunks, cover_tokens = coverage(chunks, sample)
+        rows.append(
+            {
+                "strategy": strategy,
+                "chunks": len(chunks),
+                "tokens_per_chunk": statistics.mean(sizes),
+                "max_tokens": max(sizes),
+                "chunks_per_clause": cover_chunks,
+                "tokens_per_clause": cover_tokens,
+                f"k={args.k}_context_tokens": args.k * statistics.mean(sizes),
+                "pages_per_s": len(docs) / t.elapsed,
+            }
+        )
+    report(f"Chunking strategies ({len(docs)} pages, {args.clauses} clauses)", rows)
+
+
+if __name__ == "__main__":
+    main()
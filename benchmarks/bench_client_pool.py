@@ -0,0 +1,110 @@
+"""Per-message client construction vs the shared, pooled client registry.
+
+Simulates ``--sessions`` concurrent chat sessions, each sending ``--messages``
+messages (one chat completion plus one query embedding, as the UI does) to a local
+OpenAI stand-in. The stub charges ``--connect-latency`` once per new connection to
+stand in for the TCP + TLS handshake against the real API.
+
+Modes:
+  per_message  new chat + embedding clients, each with its own HTTP client, per message
+  registry     ``get_chat_llm`` / ``get_embeddings`` backed by the ClientRegistry
+
+Usage: python benchmarks/bench_client_pool.py [--sessions 16] [--messages 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import openai
+from _common import Timer, report
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from openai_stub import OpenAIStub
+
+from uae_legal_rag.clients import get_client_registry, reset_client_registries
+from uae_legal_rag.config import get_settings
+from uae_legal_rag.llm import get_chat_llm, get_embeddings
+
+
+def per_message_clients(settings) -> tuple[ChatOpenAI, OpenAIEmbeddings]:
+    chat = ChatOpenAI(
+        model_name=settings.openai_model,  # type: ignore[call-arg]
+        openai_api_key=settings.openai_api_key,  # type: ignore[call-arg]
+        http_client=openai.DefaultHttpxClient(),
+    )
+    emb = OpenAIEmbeddings(
+        model=settings.openai_embedding_model,
+        openai_api_key=settings.openai_api_key,  # type: ignore[call-arg]
+        http_client=openai.DefaultHttpxClient(),
+        check_embedding_ctx_length=False,
+    )
+    return chat, emb
+
+
+def registry_clients(settings):
+    return get_chat_llm(settings), get_embeddings(settings)
+
+
+def run(mode: str, args, settings) -> dict[str, object]:
+    make = per_message_clients if mode == "per_message" else registry_clients
+    latencies: list[float] = []
+
+    def session(i: int) -> None:
+        for m in range(args.messages):
+            with Timer() as t:
+                chat, emb = make(settings)
+                chat.invoke(f"session {i} question {m}")
+                emb.embed_query(f"session {i} question {m}")
+            latencies.append(t.elapsed)
+
+    with OpenAIStub(latency_s=args.latency, connect_latency_s=args.connect_latency) as stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+        with Timer() as total, ThreadPoolExecutor(max_workers=args.sessions) as pool:
+            list(pool.map(session, range(args.sessions)))
+        connections = stub.connections
+    stats = get_client_registry(settings.http_pool_size).stats
+    reset_client_registries()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "sessions": args.sessions,
+        "messages": len(latencies),
+        "seconds": total.elapsed,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        "connections": connections,
+        "reuse_rate": stats.reuse_rate if mode == "registry" else "-",
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sessions", type=int, default=16)
+    ap.add_argument("--messages", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.02, help="seconds per request")
+    ap.add_argument("--connect-latency", type=float, default=0.05, help="seconds per connection")
+    ap.add_argument("--pool-size", type=int, default=20)
+    args = ap.parse_args()
+
+    settings = dataclasses.replace(
+        get_settings(),
+        openai_api_key="bench",
+        embedding_cache_max_entries=0,
+        llm_cache_max_entries=0,
+        http_pool_size=args.pool_size,
+    )
+    rows = [run(mode, args, settings) for mode in ("per_message", "registry")]
+    report(
+        f"Client construction ({args.latency * 1000:.0f} ms/request, "
+        f"{args.connect_latency * 1000:.0f} ms/connection)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Cold start to first answer: in-memory index vs persistent Streamlit index.
+
+After a restart the in-memory app has to re-embed and re-index the workspace's
+contracts before it can answer; the persistent mode (``CHROMA_PERSIST_STREAMLIT``)
+reopens the directory instead. Each measurement runs in a fresh process that
+behaves like a Streamlit server (``STREAMLIT_SERVER_RUN_ON_SAVE`` set): acquire the
+workspace, (re)index if needed, then answer one question through the legal graph.
+
+Embeddings come from the API-like stand-in of ``bench_shared_vectorstore`` (1536-d,
+``--embed-ms`` per 100 texts); the LLM takes ``--llm-latency`` seconds per call.
+
+Usage: python benchmarks/bench_cold_start.py [--clauses 400,2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+
+from _common import Timer, report
+from bench_shared_vectorstore import ApiLikeEmbeddings
+from fake_chat import SlowChatModel
+from langchain_core.documents import Document
+from synthetic import synthetic_contract_pages
+
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph
+from uae_legal_rag.ingestion.chunking import chunk_documents
+from uae_legal_rag.rag.retriever import build_retriever
+from uae_legal_rag.vectorstore.indexing import sync_document
+from uae_legal_rag.vectorstore.namespaces import VectorStoreRegistry
+
+
+def corpus(clauses: int) -> list[Document]:
+    rng = random.Random(22)
+    pages = [
+        Document(page_content=text, metadata={"filename": "msa.pdf", "page": i + 1})
+        for i, (text, _) in enumerate(synthetic_contract_pages(clauses, rng))
+    ]
+    return chunk_documents(pages)
+
+
+def boot(mode: str, persist_dir: str, clauses: int, args: argparse.Namespace) -> dict:
+    """One server process from boot to its first answer."""
+
+    os.environ["STREAMLIT_SERVER_RUN_ON_SAVE"] = "false"
+    emb = ApiLikeEmbeddings(args.dim, args.embed_ms)
+    llm = SlowChatModel(responses=["The Supplier bears the risk."], latency_s=args.llm_latency)
+    index_s = 0.0
+    with Timer() as total:
+        with Timer() as t:
+            registry = VectorStoreRegistry(
+                persist_dir, "bench_docs", persist_in_streamlit=mode != "in_memory"
+            )
+            lease = registry.acquire("default", emb)
+        open_s = t.elapsed
+        if mode != "warm_persistent":
+            with Timer() as t, lease.write_lock:
+                sync_document(lease.vectorstore, "msa.pdf", corpus(clauses))
+            index_s = t.elapsed
+        with Timer() as t:
+            graph = build_graph(build_retriever(lease.vectorstore, k=4), llm)
+            state = LegalState.model_validate(graph.invoke(LegalState(question="Key risks?")))
+        first_answer_s = t.elapsed
+    assert state.retrieved_docs
+    return {
+        "mode": mode,
+        "clauses": clauses,
+        "texts_embedded": emb.texts,
+        "open_s": open_s,
+        "index_s": index_s,
+        "first_answer_s": first_answer_s,
+        "cold_to_answer_s": total.elapsed,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--clauses", default="400,2000")
+    ap.add_argument("--dim", type=int, default=1536)
+    ap.add_argument("--embed-ms", type=float, default=150.0, help="ms per 100 texts")
+    ap.add_argument("--llm-latency", type=float, default=0.8)
+    args = ap.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for clauses in map(int, args.clauses.split(",")):
+        with tempfile.TemporaryDirectory() as persist_dir:
+            # "first_persistent" builds the directory that the warm boot reopens.
+            for mode in ("in_memory", "first_persistent", "warm_persistent"):
+                with ctx.Pool(1) as pool:
+                    rows.append(pool.apply(boot, (mode, persist_dir, clauses, args)))
+    report(f"Cold start to first answer ({args.llm_latency:g} s per LLM call)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Context tokens and latency per question with and without token-budgeted packing.
+
+Indexes a synthetic contract whose pages become ~1200-token chunks (close to the
+1300-token chunk size), then for each question retrieves ``k`` chunks and formats
+them either in full (``docs_to_context``) or packed into each ``--budgets`` value
+(``pack_context``). Reports context tokens per LLM call, packing overhead and an
+estimate of the LLM time saved per question: two calls x tokens saved x
+``--prefill-ms-per-1k``.
+
+Usage: python benchmarks/bench_context_packing.py [--budgets 5000,4000,3000,2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import uuid
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from synthetic import synthetic_contract_pages
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.ingestion.chunking import chunk_documents, token_len
+from uae_legal_rag.rag.formatting import docs_to_context, pack_context
+from uae_legal_rag.rag.retriever import build_retriever
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+QUESTIONS = [
+    "Key risks?",
+    "Termination clauses?",
+    "Liability limits?",
+    "Key dates?",
+    "What are the penalty and indemnity terms?",
+    "How is personal data protected under PDPL?",
+]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--clauses", type=int, default=120)
+    ap.add_argument("--page-chars", type=int, default=5700, help="~1200-token chunks")
+    ap.add_argument("--k", type=int, default=4)
+    ap.add_argument("--budgets", default="5000,4000,3000,2000")
+    ap.add_argument("--prefill-ms-per-1k", type=float, default=30.0)
+    args = ap.parse_args()
+
+    rng = random.Random(17)
+    pages = [
+        Document(page_content=text, metadata={"filename": "msa.pdf", "page": i + 1})
+        for i, (text, _) in enumerate(synthetic_contract_pages(args.clauses, rng, args.page_chars))
+    ]
+    chunks = chunk_documents(pages)
+    vs = get_chroma(DeterministicEmbeddings(), None, f"bench_{uuid.uuid4().hex[:8]}")
+    vs.add_documents(chunks)
+    retriever = build_retriever(vs, k=args.k)
+    retrieved = [retriever.invoke(q) for q in QUESTIONS]
+    print(f"{len(pages)} pages -> {len(chunks)} chunks; k={args.k}")
+
+    full_tokens = []
+    full_times = []
+    for docs in retrieved:
+        with Timer() as t:
+            context = docs_to_context(docs)
+        full_times.append(t.elapsed)
+        token_len.cache_clear()  # count fresh, as a new question would
+        full_tokens.append(token_len(context))
+    rows: list[dict[str, object]] = [
+        {
+            "budget": "none",
+            "ctx_tokens": statistics.mean(full_tokens),
+            "saved_pct": 0.0,
+            "trimmed": 0,
+            "dropped": 0,
+            "format_ms": statistics.mean(full_times) * 1000,
+            "est_llm_ms_saved": 0.0,
+        }
+    ]
+    for budget in map(int, args.budgets.split(",")):
+        stats_list, times = [], []
+        for docs in retrieved:
+            token_len.cache_clear()
+            with Timer() as t:
+                _, stats = pack_context(docs, budget)
+            times.append(t.elapsed)
+            stats_list.append(stats)
+        saved = statistics.mean(s.tokens_saved for s in stats_list)
+        rows.append(
+            {
+                "budget": budget,
+                "ctx_tokens": statistics.mean(s.tokens_packed for s in stats_list),
+                "saved_pct": 100 * statistics.mean(s.savings for s in stats_list),
+                "trimmed": sum(s.trimmed for s in stats_list),
+                "dropped": sum(s.dropped for s in stats_list),
+                "format_ms": statistics.mean(times) * 1000,
+                "est_llm_ms_saved": 2 * saved / 1000 * args.prefill_ms_per_1k,
+            }
+        )
+    report(
+        f"Context packing per question ({len(QUESTIONS)} questions, "
+        f"{args.prefill_ms_per_1k:g} ms prefill per 1k tokens)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
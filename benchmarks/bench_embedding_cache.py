@@ -0,0 +1,81 @@
+"""Hit rate and time saved by the on-disk embedding cache.
+
+Simulates the common pattern of re-uploading the same contracts across sessions:
+a cold pass, then ``--sessions`` warm passes where ``--changed`` of the chunks differ.
+
+Usage: python benchmarks/bench_embedding_cache.py [--chunks 2000] [--embed-latency 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from _common import Timer, clause_text, report
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.cache.embeddings import CachedEmbeddings
+
+
+class SlowEmbeddings(DeterministicEmbeddings):
+    """Offline stand-in charging a fixed latency per API batch."""
+
+    def __init__(self, latency_s: float, batch: int = 512):
+        super().__init__()
+        self.latency_s = latency_s
+        self.batch = batch
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += -(-len(texts) // self.batch)
+        time.sleep(self.latency_s * -(-len(texts) // self.batch))
+        return super().embed_documents(texts)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--chunks", type=int, default=2000)
+    ap.add_argument("--sessions", type=int, default=3)
+    ap.add_argument("--changed", type=float, default=0.05, help="fraction edited per session")
+    ap.add_argument("--embed-latency", type=float, default=0.2, help="seconds per API batch")
+    args = ap.parse_args()
+
+    rng = random.Random(3)
+    corpus = [clause_text(rng, 10) for _ in range(args.chunks)]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = str(Path(tmp) / "emb.sqlite")
+        for session in range(args.sessions + 1):
+            texts = list(corpus)
+            if session:
+                for i in rng.sample(range(len(texts)), int(len(texts) * args.changed)):
+                    texts[i] = clause_text(rng, 10)
+
+            raw = SlowEmbeddings(args.embed_latency)
+            with Timer() as uncached:
+                raw.embed_documents(texts)
+
+            inner = SlowEmbeddings(args.embed_latency)
+            cached = CachedEmbeddings(inner, model="bench", db_path=db)
+            with Timer() as t:
+                cached.embed_documents(texts)
+
+            rows.append(
+                {
+                    "session": "cold" if session == 0 else f"warm {session}",
+                    "hit_rate": cached.stats.hit_rate,
+                    "api_calls": inner.calls,
+                    "uncached_s": uncached.elapsed,
+                    "cached_s": t.elapsed,
+                    "saved_s": uncached.elapsed - t.elapsed,
+                }
+            )
+    report(f"Embedding cache ({args.chunks} chunks)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Embedding throughput vs scheduler concurrency against a local OpenAI stand-in.
+
+Every request to the stub sleeps ``--latency`` seconds. The last rows cap the stub
+at ``--rate-limit`` concurrent requests (extra requests get 429) to show the
+scheduler backing off.
+
+Usage: python benchmarks/bench_embedding_scheduler.py [--texts 2000] [--latency 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from _common import Timer, clause_text, report
+from langchain_openai import OpenAIEmbeddings
+from openai_stub import OpenAIStub
+
+from uae_legal_rag.embedding_scheduler import ConcurrentEmbeddings
+from uae_legal_rag.ingestion.chunking import token_len
+
+
+def run(texts: list[str], args, concurrency: int, rate_limit: int | None) -> dict[str, object]:
+    with OpenAIStub(latency_s=args.latency, rate_limit_concurrency=rate_limit) as stub:
+        client = OpenAIEmbeddings(
+            model="text-embedding-3-small",
+            base_url=stub.base_url,
+            api_key="bench",  # type: ignore[arg-type]
+            check_embedding_ctx_length=False,
+            max_retries=0,
+        )
+        emb = ConcurrentEmbeddings(client, max_concurrency=concurrency, batch_texts=args.batch)
+        with Timer() as t:
+            emb.embed_documents(texts)
+    return {
+        "concurrency": concurrency,
+        "stub_limit": rate_limit or "-",
+        "seconds": t.elapsed,
+        "texts_per_s": len(texts) / t.elapsed,
+        "requests": emb.stats.requests,
+        "429s": emb.stats.rate_limited,
+        "final_concurrency": emb.stats.concurrency,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--texts", type=int, default=2000)
+    ap.add_argument("--batch", type=int, default=32, help="max texts per request")
+    ap.add_argument("--latency", type=float, default=0.1, help="seconds per request")
+    ap.add_argument("--levels", default="1,2,4,8,16")
+    ap.add_argument("--rate-limit", type=int, default=4)
+    args = ap.parse_args()
+
+    rng = random.Random(3)
+    texts = [clause_text(rng, 4) for _ in range(args.texts)]
+    token_len(texts[0])  # load the tokenizer outside the timings
+
+    levels = [int(x) for x in args.levels.split(",")]
+    rows = [run(texts, args, c, None) for c in levels]
+    rows += [run(texts, args, c, args.rate_limit) for c in levels if c > args.rate_limit]
+    report(f"Embedding scheduler ({args.texts} texts, {args.latency * 1000:.0f} ms/request)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""End-to-end latency of the sequential vs fan-out (parallel) legal graph.
+
+Retrieval takes ``--retrieval`` seconds and each of the two LLM calls (risk analysis
+and answer) takes ``--latency`` seconds on a local stand-in model. Sequential is
+retrieval + 2 x LLM; the fan-out graph should be close to retrieval + 1 x LLM.
+
+Usage: python benchmarks/bench_graph_parallel.py [--latency 0.8] [--retrieval 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from _common import Timer, clause_text, report
+from fake_chat import SlowChatModel
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--latency", type=float, default=0.8, help="seconds per LLM call")
+    ap.add_argument("--retrieval", type=float, default=0.1, help="seconds per retrieval")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    rng = random.Random(11)
+    docs = [
+        Document(page_content=clause_text(rng, 6), metadata={"source": "msa.pdf", "page": i})
+        for i in range(4)
+    ]
+
+    def retrieve(_q: str) -> list[Document]:
+        time.sleep(args.retrieval)
+        return docs
+
+    rows = []
+    for parallel in (False, True):
+        llm = SlowChatModel(
+            responses=["The Supplier bears unlimited liability."],
+            routes={"**Analysis Request:**": "Indemnity and penalty clauses apply."},
+            latency_s=args.latency,
+        )
+        graph = build_graph(RunnableLambda(retrieve), llm, parallel=parallel)
+        graph.invoke(LegalState(question="warm up"))
+        times = []
+        for _ in range(args.repeat):
+            with Timer() as t:
+                graph.invoke(LegalState(question="What are the key risks?"))
+            times.append(t.elapsed)
+        median = statistics.median(times)
+        rows.append(
+            {
+                "topology": "parallel" if parallel else "sequential",
+                "median_s": median,
+                "llm_calls_equiv": (median - args.retrieval) / args.latency,
+                "best_s": min(times),
+            }
+        )
+    report(
+        f"Legal graph ({args.retrieval * 1000:.0f} ms retrieval, "
+        f"{args.latency * 1000:.0f} ms per LLM call)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
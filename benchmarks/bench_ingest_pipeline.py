@@ -0,0 +1,139 @@
+"""Batch (load all -> chunk all -> add all) vs streaming ingestion.
+
+Reports wall time, time until the first chunk is searchable and peak traced Python
+memory. Embeddings are offline; ``--embed-latency`` simulates per-call API latency.
+The page-cache rows upload the same files twice into fresh stores (a new session):
+the second run streams cached page text instead of parsing the PDFs.
+
+Usage: python benchmarks/bench_ingest_pipeline.py [--pages 300] [--files 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from _common import Timer, make_synthetic_pdf, report
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.cache.pages import PageTextCache
+from uae_legal_rag.ingestion.chunking import chunk_documents
+from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+from uae_legal_rag.ingestion.pipeline import ingest_stream
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+
+class SlowEmbeddings(DeterministicEmbeddings):
+    def __init__(self, latency_s: float):
+        super().__init__()
+        self.latency_s = latency_s
+
+    def embed_documents(self, texts):
+        time.sleep(self.latency_s)
+        return super().embed_documents(texts)
+
+
+def _store(emb):
+    return get_chroma(emb, persist_dir=None, collection_name=f"bench_{uuid.uuid4().hex[:8]}")
+
+
+def run_batch(files: dict[str, bytes], emb) -> dict[str, object]:
+    vs = _store(emb)
+    tracemalloc.start()
+    with Timer() as t:
+        pages = []
+        for name, data in files.items():
+            pages.extend(load_pdf_bytes(data, name, max_workers=1))
+        chunks = chunk_documents(pages)
+        vs.add_documents(chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": "batch",
+        "chunks": len(chunks),
+        "total_s": t.elapsed,
+        "first_searchable_s": t.elapsed,
+        "peak_mb": peak / 2**20,
+        "cached_pages": 0,
+    }
+
+
+def run_stream(
+    files: dict[str, bytes],
+    emb,
+    batch_size: int,
+    page_cache: PageTextCache | None = None,
+    label: str = "",
+) -> dict[str, object]:
+    vs = _store(emb)
+    first: list[float] = []
+    start = time.perf_counter()
+
+    def on_progress(p) -> None:
+        if not first and p.chunks_indexed:
+            first.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    with Timer() as t:
+        result = ingest_stream(
+            [(n, io.BytesIO(d)) for n, d in files.items()],
+            vs,
+            batch_size=batch_size,
+            page_cache=page_cache,
+            on_progress=on_progress,
+        )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "mode": f"stream (batch={batch_size}){label}",
+        "chunks": result.chunks_indexed,
+        "total_s": t.elapsed,
+        "first_searchable_s": first[0] if first else t.elapsed,
+        "peak_mb": peak / 2**20,
+        "cached_pages": page_cache.stats.pages_served if page_cache else 0,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pages", type=int, default=300, help="pages per file")
+    ap.add_argument("--files", type=int, default=2)
+    ap.add_argument("--batch-size", type=int, default=64)
+    ap.add_argument("--embed-latency", type=float, default=0.05, help="seconds per embed call")
+    args = ap.parse_args()
+
+    files = {f"doc{i}.pdf": make_synthetic_pdf(args.pages, seed=i) for i in range(args.files)}
+    size_mb = sum(len(d) for d in files.values()) / 2**20
+    print(f"{args.files} file(s) x {args.pages} pages, {size_mb:.1f} MB")
+
+    rows = [
+        run_batch(files, SlowEmbeddings(args.embed_latency)),
+        run_stream(files, SlowEmbeddings(args.embed_latency), args.batch_size),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PageTextCache(f"{tmp}/pages.sqlite")
+        for label in (", page cache cold", ", page cache warm"):
+            emb = SlowEmbeddings(args.embed_latency)
+            rows.append(run_stream(files, emb, args.batch_size, cache, label))
+        report("Ingestion pipeline", rows)
+
+        with Timer() as parse:
+            for name, data in files.items():
+                load_pdf_bytes(data, name, max_workers=1)
+        with Timer() as hit:
+            for name, data in files.items():
+                load_pdf_bytes(data, name, page_cache=cache)
+        print(
+            f"load_pdf_bytes: parse {parse.elapsed:.2f}s, cache hit {hit.elapsed:.3f}s "
+            f"({parse.elapsed / hit.elapsed:.0f}x); cache hits={cache.stats.hits} "
+            f"misses={cache.stats.misses} hit_rate={cache.stats.hit_rate:.0%} "
+            f"size={cache.total_bytes() / 2**20:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
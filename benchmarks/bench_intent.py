@@ -0,0 +1,90 @@
+"""Intent routing: accuracy vs latency of the local classifier and the LLM fallback.
+
+Runs every message in ``tests/intent_samples.py`` through ``classify_intent`` and
+reports accuracy and per-message latency, then, for each ``--thresholds`` value,
+the share of messages that would be sent to the LLM and the resulting mean routing
+latency (local time + fallback share x ``--llm-latency``). The LLM itself is not
+called, so fallback accuracy is reported as an upper bound (fallbacks counted as
+correct). ``llm_only`` is the previous behaviour: one LLM round trip per message.
+
+Usage: python benchmarks/bench_intent.py [--llm-latency 0.6] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from _common import report
+from intent_samples import LABELED_MESSAGES
+
+from uae_legal_rag.intent import classify_intent
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--llm-latency", type=float, default=0.6, help="seconds per LLM call")
+    ap.add_argument("--thresholds", default="0.5,0.6,0.7,0.8,0.9")
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    classify_intent("warm up")  # trains the model outside the timings
+    timings: list[float] = []
+    results = []
+    for text, label in LABELED_MESSAGES:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = classify_intent(text)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+        results.append((result, label))
+
+    n = len(results)
+    local_us = statistics.mean(timings) * 1e6
+    timings.sort()
+    rows: list[dict[str, object]] = [
+        {
+            "mode": "local",
+            "accuracy": sum(r.intent == label for r, label in results) / n,
+            "llm_share": 0.0,
+            "mean_ms": local_us / 1000,
+            "p99_local_us": timings[int(0.99 * (n - 1))] * 1e6,
+        }
+    ]
+    for threshold in map(float, args.thresholds.split(",")):
+        fallback = [r.confidence < threshold for r, _ in results]
+        correct = sum(fb or r.intent == label for fb, (r, label) in zip(fallback, results))
+        share = sum(fallback) / n
+        rows.append(
+            {
+                "mode": f"local+llm@{threshold:g}",
+                "accuracy": correct / n,
+                "llm_share": share,
+                "mean_ms": local_us / 1000 + share * args.llm_latency * 1000,
+                "p99_local_us": "-",
+            }
+        )
+    rows.append(
+        {
+            "mode": "llm_only",
+            "accuracy": "-",
+            "llm_share": 1.0,
+            "mean_ms": args.llm_latency * 1000,
+            "p99_local_us": "-",
+        }
+    )
+    by_source: dict[str, int] = {}
+    for r, _ in results:
+        by_source[r.source] = by_source.get(r.source, 0) + 1
+    print(f"{n} labeled messages; decided by: {by_source}")
+    report(
+        f"Intent routing (LLM round trip {args.llm_latency * 1000:.0f} ms; "
+        "fallback accuracy is an upper bound)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Per-keyword substring scans vs the compiled LexiconMatcher.
+
+Times section tagging and risk-marker detection over ``--chunks`` synthetic chunks,
+with the matcher forced onto each engine (``scan`` is what ``auto`` picks for these
+lexicon sizes).
+
+Usage: python benchmarks/bench_lexicon.py [--chunks 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from _common import Timer, clause_text, report
+
+from uae_legal_rag.graph.legal_graph import RISK_MARKERS
+from uae_legal_rag.ingestion.chunking import SECTION_RULES
+from uae_legal_rag.lexicon import LexiconMatcher
+
+
+def scan_section(text: str) -> str | None:
+    t = text.lower()
+    for label, pats in SECTION_RULES.items():
+        if any(p in t for p in pats):
+            return label
+    return None
+
+
+def scan_risk_terms(text: str) -> set[str]:
+    t = text.lower()
+    return {m for ms in RISK_MARKERS.values() for m in ms if m in t}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--chunks", type=int, default=100_000)
+    ap.add_argument("--sentences", type=int, default=6, help="sentences per chunk")
+    args = ap.parse_args()
+
+    rng = random.Random(1)
+    texts = [clause_text(rng, args.sentences) for _ in range(args.chunks)]
+
+    rows = []
+
+    def run(task: str, mode: str, fn, check=None) -> None:
+        with Timer() as t:
+            out = fn()
+        rows.append(
+            {
+                "task": task,
+                "mode": mode,
+                "seconds": t.elapsed,
+                "chunks_per_s": len(texts) / t.elapsed,
+                "agrees": "-" if check is None else out == check,
+            }
+        )
+        return out
+
+    base = run("section (first)", "substring scan", lambda: [scan_section(t) for t in texts])
+    risk_base = None
+    for engine in ("scan", "regex"):
+        sections = LexiconMatcher(SECTION_RULES, engine=engine)
+        risk = LexiconMatcher(RISK_MARKERS, engine=engine)
+        run(
+            "section (first)",
+            f"matcher[{engine}]",
+            lambda: [sections.first_label(t) for t in texts],
+            base,
+        )
+        run(
+            "section (all labels)",
+            f"matcher[{engine}] batch",
+            lambda: [
+                found
+                for i in range(0, len(texts), 1000)
+                for found in sections.labels_batch(texts[i : i + 1000])
+            ],
+        )
+        if risk_base is None:
+            risk_base = run(
+                "risk markers", "substring scan", lambda: [scan_risk_terms(t) for t in texts]
+            )
+        run("risk markers", f"matcher[{engine}]", lambda: [risk.terms(t) for t in texts], risk_base)
+
+    report(f"Lexicon matching ({args.chunks:,} chunks)", rows)
+
+
+if __name__ == "__main__":
+    main()
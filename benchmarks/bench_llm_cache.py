@@ -0,0 +1,70 @@
+"""Quick-prompt latency with and without the LLM response cache.
+
+Asks the four quick-prompt questions through the real graph ``--rounds`` times
+against an unchanged corpus. The chat model is offline and sleeps ``--latency``
+seconds per call; each question makes two calls (risk analysis + answer).
+
+Usage: python benchmarks/bench_llm_cache.py [--latency 0.8] [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import uuid
+
+from _common import Timer, clause_text, report
+from fake_chat import SlowChatModel
+from langchain_core.documents import Document
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.cache.llm import LLMResponseCache
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph
+from uae_legal_rag.rag.retriever import build_retriever
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+QUESTIONS = ["Key risks?", "Termination clauses?", "Liability limits?", "Key dates?"]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--latency", type=float, default=0.8, help="seconds per LLM call")
+    ap.add_argument("--rounds", type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(2)
+    vs = get_chroma(DeterministicEmbeddings(), None, f"bench_{uuid.uuid4().hex[:8]}")
+    vs.add_documents(
+        [Document(page_content=clause_text(rng, 5), metadata={"page": i}) for i in range(200)]
+    )
+    retriever = build_retriever(vs, k=4)
+
+    rows = []
+    for label, cache in [("no cache", None), ("cache", LLMResponseCache())]:
+        llm = SlowChatModel(
+            responses=["The clause allows termination."], latency_s=args.latency, cache=cache
+        )
+        graph = build_graph(retriever, llm)
+        for round_no in range(1, args.rounds + 1):
+            calls_before = llm.calls
+            times = []
+            for q in QUESTIONS:
+                with Timer() as t:
+                    graph.invoke(LegalState(question=q))
+                times.append(t.elapsed)
+            rows.append(
+                {
+                    "mode": label,
+                    "round": round_no,
+                    "mean_s": statistics.mean(times),
+                    "max_s": max(times),
+                    "llm_calls": llm.calls - calls_before,
+                    "hit_rate": cache.stats.hit_rate if cache else 0.0,
+                }
+            )
+    report(f"Quick prompts x{len(QUESTIONS)} ({args.latency * 1000:.0f} ms per LLM call)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-backend PDF text extraction throughput and text equivalence.
+
+Extracts each PDF of a sample corpus with every installed backend (serially, so the
+numbers compare extractors rather than process pools) and reports pages/s, MB/s and
+word-level agreement with pypdf. The corpus is synthetic contracts of a few sizes,
+or every PDF under ``--dir``.
+
+Usage: python benchmarks/bench_pdf_backends.py [--dir contracts/] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import statistics
+from pathlib import Path
+
+from _common import Timer, make_synthetic_pdf, report
+
+from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+from uae_legal_rag.ingestion.pdf_backends import available_backends, select_backend
+
+
+def word_agreement(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--dir", type=Path, default=None, help="directory of real PDFs")
+    ap.add_argument("--sizes", default="5,50,300", help="synthetic page counts")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    if args.dir:
+        corpus = {p.name: p.read_bytes() for p in sorted(args.dir.rglob("*.pdf"))}
+    else:
+        corpus = {
+            f"synthetic_{n}p.pdf": make_synthetic_pdf(n, seed=n)
+            for n in map(int, args.sizes.split(","))
+        }
+    backends = available_backends()
+    print(f"backends: {', '.join(b.extractor_id for b in backends)}")
+
+    rows = []
+    for name, data in corpus.items():
+        reference: list[str] | None = None
+        for backend in backends:
+            best = float("inf")
+            for _ in range(args.repeat):
+                with Timer() as t:
+                    docs = load_pdf_bytes(data, name, max_workers=1, backend=backend.name)
+                best = min(best, t.elapsed)
+            texts = [d.page_content for d in docs]
+            if reference is None:
+                reference = texts
+            agreement = statistics.mean(
+                [word_agreement(a, b) for a, b in zip(reference, texts, strict=False)] or [0.0]
+            )
+            pages = docs[-1].metadata["page"] if docs else 0
+            rows.append(
+                {
+                    "file": name,
+                    "size_kb": len(data) / 1024,
+                    "backend": backend.name,
+                    "auto": "*" if select_backend(len(data)).name == backend.name else "",
+                    "best_s": best,
+                    "pages_per_s": pages / best,
+                    "mb_per_s": len(data) / 2**20 / best,
+                    "same_pages": len(texts) == len(reference),
+                    "word_agreement": agreement,
+                }
+            )
+    report("PDF extraction backends (word_agreement is vs pypdf)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Pages/sec of serial vs process-pool PDF text extraction.
+
+Usage: python benchmarks/bench_pdf_extraction.py [--pages 400] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from _common import Timer, make_synthetic_pdf, report
+
+from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pages", type=int, default=400)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    pdf = make_synthetic_pdf(args.pages)
+    print(f"synthetic PDF: {args.pages} pages, {len(pdf) / 1024:.0f} KB, {os.cpu_count()} CPUs")
+
+    rows = []
+    baseline: list | None = None
+    for label, workers in [("serial", 1), (f"parallel x{args.workers}", args.workers)]:
+        best = float("inf")
+        for _ in range(args.repeat):
+            with Timer() as t:
+                docs = load_pdf_bytes(pdf, "bench.pdf", max_workers=workers)
+            best = min(best, t.elapsed)
+        if baseline is None:
+            baseline = docs
+        same = [d.page_content for d in docs] == [d.page_content for d in baseline]
+        rows.append(
+            {
+                "mode": label,
+                "pages": len(docs),
+                "best_s": best,
+                "pages_per_s": args.pages / best,
+                "same_output": same,
+            }
+        )
+    report("PDF text extraction", rows)
+
+
+if __name__ == "__main__":
+    main()
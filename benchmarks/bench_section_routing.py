@@ -0,0 +1,143 @@
+"""Section routing: retrieval precision and latency with and without the prefilter.
+
+The corpus is ``--chunks`` clause-sized chunks, each written mostly about one topic
+(three to five sentences from that topic's templates, plus one off-topic sentence)
+and tagged by ``tag_sections`` as ingestion does. Every question is about one topic
+and uses that topic's vocabulary, so ``route_sections`` has something to route on.
+Embeddings are the offline ``DeterministicEmbeddings``.
+
+- ``precision@k``: share of the top ``k`` chunks whose main topic is the one asked
+  about.
+- ``hit@1``: share of questions whose first chunk is on topic.
+- ``widened``: share of routed questions that had to widen to the whole store.
+
+Usage: python benchmarks/bench_section_routing.py [--chunks 2000,20000] [--k 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import uuid
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.ingestion.chunking import tag_sections
+from uae_legal_rag.rag.retriever import build_retriever, route_sections
+from uae_legal_rag.vectorstore.backends import get_vectorstore
+from uae_legal_rag.vectorstore.chroma_client import add_embedded_documents
+
+TOPICS: dict[str, list[str]] = {
+    "termination": [
+        "Either party may terminate this Agreement on {n} days written notice.",
+        "On termination the Supplier shall return all Client materials within {n} days.",
+        "The Client may terminate without notice if the Supplier becomes insolvent.",
+    ],
+    "liability": [
+        "Neither party's liability shall exceed the fees paid in the preceding {n} months.",
+        "The Supplier shall indemnify the Client against third-party claims.",
+        "The limitation of liability does not apply to fraud or wilful misconduct.",
+    ],
+    "confidentiality": [
+        "Each party shall keep confidential all information received for {n} years.",
+        "Confidential Information excludes information that is already public.",
+        "The non-disclosure obligations survive expiry of this Agreement.",
+    ],
+    "data_protection": [
+        "Personal data shall be handled in accordance with the PDPL.",
+        "The Supplier shall notify the Client of a personal data breach within {n} hours.",
+        "Data protection impact assessments are carried out before new processing.",
+    ],
+    "governing_law": [
+        "This Agreement is subject to the governing law of the Emirate of Dubai.",
+        "The courts of the DIFC have exclusive jurisdiction over any dispute.",
+        "Disputes are finally resolved by arbitration seated in Dubai.",
+    ],
+    "payment": [
+        "The Client shall pay each invoice within {n} days of receipt.",
+        "A late fee of {n}% a month applies to overdue amounts.",
+        "All fees are exclusive of VAT, which the Client pays in addition.",
+    ],
+}
+QUESTIONS: dict[str, list[str]] = {
+    "termination": ["How much notice do we need to terminate?", "What happens on termination?"],
+    "liability": ["Is the Supplier's liability capped?", "Who must indemnify whom?"],
+    "confidentiality": ["How long does confidentiality last?", "What is confidential?"],
+    "data_protection": ["How must personal data be protected?", "Does the PDPL apply?"],
+    "governing_law": ["Which governing law applies?", "Which courts have jurisdiction?"],
+    "payment": ["When must each invoice be paid?", "Is there a late fee on payment?"],
+}
+
+
+def corpus(n: int, rng: random.Random) -> list[tuple[Document, str]]:
+    topics = list(TOPICS)
+    out = []
+    for _ in range(n):
+        topic = rng.choice(topics)
+        sentences = [rng.choice(TOPICS[topic]) for _ in range(rng.randint(3, 5))]
+        sentences.insert(rng.randrange(len(sentences)), rng.choice(TOPICS[rng.choice(topics)]))
+        text = " ".join(s.format(n=rng.randint(1, 90)) for s in sentences)
+        out.append((Document(page_content=text, metadata={"filename": "msa.pdf"}), topic))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--chunks", default="2000,20000")
+    ap.add_argument("--k", type=int, default=4)
+    ap.add_argument("--repeats", type=int, default=5, help="passes over the questions")
+    args = ap.parse_args()
+
+    emb = DeterministicEmbeddings()
+    asked = [(q, topic) for topic, qs in QUESTIONS.items() for q in qs]
+    assert all(topic in route_sections(q) for q, topic in asked)
+
+    rows = []
+    for n in map(int, args.chunks.split(",")):
+        chunks = corpus(n, random.Random(25))
+        docs = [d for d, _ in chunks]
+        tag_sections(docs)
+        topic_of = {}
+        for backend in ("chroma", "numpy"):
+            vs = get_vectorstore(emb, None, f"bench_route_{uuid.uuid4().hex[:8]}", backend)
+            ids = [f"c{i}" for i in range(n)]
+            topic_of = {i: topic for i, (_, topic) in zip(ids, chunks, strict=True)}
+            vectors = emb.embed_documents([d.page_content for d in docs])
+            for start in range(0, n, 1000):
+                window = slice(start, start + 1000)
+                add_embedded_documents(vs, docs[window], vectors[window], ids[window])
+
+            for routed in (False, True):
+                retriever = build_retriever(vs, k=args.k, route_sections=routed)
+                on_topic, first, widened, latencies = 0, 0, 0, []
+                for _ in range(args.repeats):
+                    for question, topic in asked:
+                        with Timer() as t:
+                            hits = retriever.invoke(question)
+                        latencies.append(t.elapsed)
+                        on_topic += sum(topic_of[d.id] == topic for d in hits)
+                        first += topic_of[hits[0].id] == topic
+                        widened += routed and any(
+                            not any(d.metadata.get(f"has_{s}") for s in route_sections(question))
+                            for d in hits
+                        )
+                total = args.repeats * len(asked)
+                rows.append(
+                    {
+                        "backend": backend,
+                        "chunks": n,
+                        "routing": "on" if routed else "off",
+                        f"precision@{args.k}": on_topic / (total * args.k),
+                        "hit@1": first / total,
+                        "widened": widened / total,
+                        "p50_ms": statistics.median(latencies) * 1000,
+                    }
+                )
+    report(f"Section routing ({len(asked)} questions x{args.repeats}, k={args.k})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Memory and ingest cost of N concurrent sessions indexing the same contracts.
+
+``per_session`` gives every session its own in-memory collection (what a fresh
+store per Streamlit session amounts to); ``shared`` has all sessions acquire one
+namespace of the process-wide registry and ingest under its write lock. Each
+session syncs the same chunked corpus with ``sync_document``. The embedding stand-in
+returns ``--dim``-dimensional vectors and takes ``--embed-ms`` per 100 texts, like
+a batched API call.
+
+Each configuration runs in a fresh process; ``rss_mb`` is that process's resident
+memory growth (Chroma's native index included).
+
+Usage: python benchmarks/bench_shared_vectorstore.py [--sessions 1,4,16] [--pages 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import multiprocessing
+import random
+import threading
+import time
+import uuid
+
+from _common import Timer, report
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from synthetic import synthetic_contract_pages
+
+from uae_legal_rag.ingestion.chunking import chunk_documents
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+from uae_legal_rag.vectorstore.indexing import sync_document
+from uae_legal_rag.vectorstore.namespaces import VectorStoreRegistry
+
+
+class ApiLikeEmbeddings(Embeddings):
+    """Deterministic ``dim``-d vectors; sleeps like a remote call and counts texts."""
+
+    def __init__(self, dim: int, ms_per_100: float):
+        self.dim = dim
+        self.ms_per_100 = ms_per_100
+        self.texts = 0
+        self._lock = threading.Lock()
+
+    def _vector(self, text: str) -> list[float]:
+        seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        return [rng.uniform(-1, 1) for _ in range(self.dim)]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.texts += len(texts)
+        time.sleep(self.ms_per_100 / 1000 * len(texts) / 100)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._vector(text)
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run(mode: str, sessions: int, args: argparse.Namespace) -> dict[str, object]:
+    rng = random.Random(21)
+    pages = [
+        Document(page_content=text, metadata={"filename": "msa.pdf", "page": i + 1})
+        for i, (text, _) in enumerate(synthetic_contract_pages(args.clauses, rng))
+    ]
+    chunks = chunk_documents(pages)
+    emb = ApiLikeEmbeddings(args.dim, args.embed_ms)
+    registry = VectorStoreRegistry(None, f"bench_{uuid.uuid4().hex[:8]}")
+    leases = []
+    before = rss_mb()
+
+    def session(_i: int) -> None:
+        if mode == "shared":
+            lease = registry.acquire("acme", emb)
+            leases.append(lease)
+            with lease.write_lock:
+                sync_document(lease.vectorstore, "msa.pdf", chunks)
+        else:
+            vs = get_chroma(emb, None, f"session_{uuid.uuid4().hex[:12]}")
+            leases.append(vs)
+            sync_document(vs, "msa.pdf", chunks)
+
+    with Timer() as t:
+        threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "chunks": len(chunks),
+        "texts_embedded": emb.texts,
+        "ingest_s": t.elapsed,
+        "rss_mb": rss_mb() - before,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sessions", default="1,4,16")
+    ap.add_argument("--clauses", type=int, default=400)
+    ap.add_argument("--dim", type=int, default=1536, help="text-embedding-3-small size")
+    ap.add_argument("--embed-ms", type=float, default=150.0, help="ms per 100 texts")
+    args = ap.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for sessions in map(int, args.sessions.split(",")):
+        for mode in ("per_session", "shared"):
+            with ctx.Pool(1) as pool:
+                rows.append(pool.apply(run, (mode, sessions, args)))
+    report("Concurrent sessions indexing the same contract", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Time to first answer token: blocking ``graph.invoke`` vs ``stream_graph``.
+
+Both LLM calls go to a local streaming stand-in that waits ``--latency`` seconds
+before its first token and then emits one word every ``--token-interval`` seconds.
+With ``invoke`` nothing can be shown until the whole graph has finished.
+
+Usage: python benchmarks/bench_streaming.py [--words 150] [--latency 0.4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from _common import Timer, clause_text, report
+from fake_chat import SlowChatModel
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph, stream_graph
+
+
+def make_graph(args, rng: random.Random):
+    words = clause_text(rng, 40).split()
+    risk = " ".join(words[: args.words // 2]) + " indemnity"
+    answer = " ".join(words[: args.words])
+    docs = [Document(page_content=clause_text(rng, 6), metadata={"source": "msa.pdf", "page": 1})]
+    llm = SlowChatModel(
+        responses=[answer],
+        routes={"**Analysis Request:**": risk, "**User Question:**": answer},
+        latency_s=args.latency,
+        token_interval_s=args.token_interval,
+    )
+    return build_graph(RunnableLambda(lambda q: docs), llm)
+
+
+def run_invoke(graph) -> dict[str, float]:
+    with Timer() as t:
+        graph.invoke(LegalState(question="Key risks?"))
+    return {"risk_s": t.elapsed, "first_token_s": t.elapsed, "total_s": t.elapsed}
+
+
+def run_stream(graph) -> dict[str, float]:
+    marks: dict[str, float] = {}
+    start = time.perf_counter()
+    for kind, _ in stream_graph(graph, LegalState(question="Key risks?")):
+        marks.setdefault(kind, time.perf_counter() - start)
+    total = time.perf_counter() - start
+    return {"risk_s": marks["risk"], "first_token_s": marks["token"], "total_s": total}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--words", type=int, default=150, help="words in the answer")
+    ap.add_argument("--latency", type=float, default=0.4, help="seconds to first token")
+    ap.add_argument("--token-interval", type=float, default=0.015)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(5)
+    rows = []
+    for mode, fn in (("invoke", run_invoke), ("stream", run_stream)):
+        runs = [fn(make_graph(args, rng)) for _ in range(args.repeat)]
+        rows.append({"mode": mode} | {k: statistics.median(r[k] for r in runs) for k in runs[0]})
+    report(
+        f"Answer streaming ({args.latency * 1000:.0f} ms to first token, "
+        f"{args.words} words at {args.token_interval * 1000:.0f} ms)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
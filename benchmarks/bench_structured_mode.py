@@ -0,0 +1,120 @@
+"""Latency and tokens per question: two-call graph vs single structured call.
+
+Both modes talk to the local OpenAI stand-in through ``ChatOpenAI`` (streaming, as
+in the app). The stand-in waits ``--latency`` seconds before the first token and
+``--token-latency`` seconds per completion token; its ``usage`` counts words and
+punctuation. The two-call graph runs risk analysis and answer over the same context,
+in parallel (the default) or in sequence; the structured mode returns the answer plus
+a compact findings list in one reply. ``first_text_s`` is when the user first sees
+answer text: the first streamed token, or the final answer for the structured mode.
+
+Usage: python benchmarks/bench_structured_mode.py [--k 4] [--latency 0.4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from _common import Timer, clause_text, report
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+from langchain_openai import ChatOpenAI
+from openai_stub import OpenAIStub
+
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph, stream_graph
+
+QUESTIONS = ["Key risks?", "Termination clauses?", "Liability limits?", "Key dates?"]
+
+
+def replies(rng: random.Random, answer_words: int, findings: int) -> tuple[str, str, str]:
+    words = clause_text(rng, 60).split()
+    answer = " ".join(words[:answer_words])
+    # Free-form risk analysis: quote, implication and severity per risk, with prose.
+    risk = "\n\n".join(
+        f"**Risk {i + 1}** — {clause_text(rng, 1)}\nImplication: {clause_text(rng, 2)}\n"
+        f"Severity: High (indemnity)"
+        for i in range(findings)
+    )
+    structured = json.dumps(
+        {
+            "answer": answer,
+            "findings": [
+                {"clause": clause_text(rng, 1), "issue": clause_text(rng, 1), "severity": "High"}
+                for _ in range(findings)
+            ],
+        }
+    )
+    return answer, risk, structured
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--k", type=int, default=4, help="retrieved passages per question")
+    ap.add_argument("--latency", type=float, default=0.4, help="seconds to first token")
+    ap.add_argument("--token-latency", type=float, default=0.004, help="seconds per token")
+    ap.add_argument("--answer-words", type=int, default=180)
+    ap.add_argument("--findings", type=int, default=4)
+    args = ap.parse_args()
+
+    rng = random.Random(19)
+    docs = [
+        Document(page_content=clause_text(rng, 12), metadata={"source": "msa.pdf", "page": i})
+        for i in range(args.k)
+    ]
+    answer, risk, structured = replies(rng, args.answer_words, args.findings)
+
+    rows = []
+    for name, mode, parallel in (
+        ("two_call", "two_call", True),
+        ("two_call_seq", "two_call", False),
+        ("structured", "structured", True),
+    ):
+        with OpenAIStub(
+            latency_s=args.latency,
+            token_latency_s=args.token_latency,
+            routes={"**Analysis Request:**": risk, "**User Question:**": answer},
+            structured_reply=structured,
+        ) as stub:
+            llm = ChatOpenAI(model="gpt-stub", api_key="bench-key", base_url=stub.base_url)
+            graph = build_graph(RunnableLambda(lambda q: docs), llm, parallel, mode=mode)
+            list(stream_graph(graph, LegalState(question="warm up")))
+            stub.requests = stub.prompt_tokens = stub.completion_tokens = 0
+
+            totals, first_text, levels = [], [], set()
+            for q in QUESTIONS:
+                with Timer() as t:
+                    start, first = time.perf_counter(), None
+                    for kind, payload in stream_graph(graph, LegalState(question=q)):
+                        if kind in ("token", "final") and first is None:
+                            first = time.perf_counter() - start
+                        if kind == "final":
+                            levels.add(payload.risk_level)
+                totals.append(t.elapsed)
+                first_text.append(first)
+            n = len(QUESTIONS)
+            rows.append(
+                {
+                    "mode": name,
+                    "llm_calls": stub.requests / n,
+                    "prompt_tok": stub.prompt_tokens / n,
+                    "completion_tok": stub.completion_tokens / n,
+                    "total_tok": (stub.prompt_tokens + stub.completion_tokens) / n,
+                    "first_text_s": statistics.median(first_text),
+                    "median_s": statistics.median(totals),
+                    "risk_level": "/".join(sorted(levels)),
+                }
+            )
+    report(
+        f"Two-call vs structured graph ({len(QUESTIONS)} questions, k={args.k}, "
+        f"{args.latency * 1000:.0f} ms to first token, "
+        f"{args.token_latency * 1000:g} ms per token)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Chroma vs the NumPy flat index: build time, query latency, memory and recall.
+
+Both stores receive the same precomputed unit vectors (``--dim``) through
+``add_embedded_documents`` in ingest-sized batches, with a ``section_type`` on
+every chunk. Queries go through ``similarity_search_by_vector`` (what the retriever
+calls after embedding the question), unfiltered and with a one-in-eight
+``section_type`` filter. ``recall`` is the overlap of each backend's top-k with the
+exact top-k.
+
+Each configuration runs in a fresh process; ``rss_mb`` is that process's resident
+memory growth while building the index.
+
+Usage: python benchmarks/bench_vector_backends.py [--chunks 1000,10000,100000] [--dim 1536]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import statistics
+import uuid
+
+import numpy as np
+from _common import Timer, report
+from bench_shared_vectorstore import rss_mb
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.vectorstore.backends import get_vectorstore
+from uae_legal_rag.vectorstore.chroma_client import add_embedded_documents
+
+SECTIONS = [
+    "payment",
+    "liability",
+    "termination",
+    "data_protection",
+    "confidentiality",
+    "governing_law",
+    "force_majeure",
+    "general",
+]
+
+
+def unit_vectors(n: int, dim: int, seed: int) -> np.ndarray:
+    v = np.random.default_rng(seed).standard_normal((n, dim), dtype=np.float32)
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+def ms(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    return statistics.median(ordered) * 1000, ordered[int(0.95 * (len(ordered) - 1))] * 1000
+
+
+def run(backend: str, chunks: int, args: argparse.Namespace) -> dict[str, object]:
+    vectors = unit_vectors(chunks, args.dim, seed=23)
+    queries = unit_vectors(args.queries, args.dim, seed=7)
+    exact = np.argsort(-(queries @ vectors.T), axis=1)[:, : args.k]
+    ids = [f"c{i}" for i in range(chunks)]
+    docs = [
+        Document(page_content=f"Clause {i}", metadata={"section_type": SECTIONS[i % len(SECTIONS)]})
+        for i in range(chunks)
+    ]
+
+    before = rss_mb()
+    vs: VectorStore = get_vectorstore(
+        None,  # type: ignore[arg-type]  # vectors are passed in precomputed
+        None,
+        f"bench_{uuid.uuid4().hex[:8]}",
+        backend=backend,
+    )
+    with Timer() as build:
+        for start in range(0, chunks, args.batch):
+            end = start + args.batch
+            add_embedded_documents(vs, docs[start:end], vectors[start:end].tolist(), ids[start:end])
+    grown = rss_mb() - before
+
+    latencies, filtered, hits = [], [], 0
+    for q, truth in zip(queries.tolist(), exact, strict=True):
+        with Timer() as t:
+            found = vs.similarity_search_by_vector(q, k=args.k)
+        latencies.append(t.elapsed)
+        hits += len({d.id or "" for d in found} & {ids[i] for i in truth})
+        with Timer() as t:
+            vs.similarity_search_by_vector(q, k=args.k, filter={"section_type": "liability"})
+        filtered.append(t.elapsed)
+    p50, p95 = ms(latencies)
+    return {
+        "backend": backend,
+        "chunks": chunks,
+        "build_s": build.elapsed,
+        "query_p50_ms": p50,
+        "query_p95_ms": p95,
+        "filtered_p50_ms": ms(filtered)[0],
+        f"recall@{args.k}": hits / (args.k * args.queries),
+        "rss_mb": grown,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--chunks", default="1000,10000,100000")
+    ap.add_argument("--dim", type=int, default=1536, help="text-embedding-3-small size")
+    ap.add_argument("--queries", type=int, default=100)
+    ap.add_argument("--k", type=int, default=8)
+    ap.add_argument("--batch", type=int, default=1000)
+    args = ap.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for chunks in map(int, args.chunks.split(",")):
+        for backend in ("chroma", "numpy"):
+            with ctx.Pool(1) as pool:
+                rows.append(pool.apply(run, (backend, chunks, args)))
+    report(f"Vector backends ({args.dim}-d, k={args.k}, {args.queries} queries)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,19 @@ from __future__ import annotations
 
 import base64
 from pathlib import Path
-from typing import Any
 
 import streamlit as st
 
+from uae_legal_rag.cache.pages import get_page_cache
 from uae_legal_rag.config import get_settings
-from uae_legal_rag.graph.legal_graph import LegalState, build_graph
-from uae_legal_rag.ingestion.chunking import chunk_documents
-from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+from uae_legal_rag.graph.legal_graph import LegalState, build_graph, stream_graph
+from uae_legal_rag.ingestion.pipeline import IngestProgress, ingest_stream
+from uae_legal_rag.intent import resolve_intent
 from uae_legal_rag.llm import get_chat_llm, get_embeddings
 from uae_legal_rag.rag.retriever import build_retriever
-from uae_legal_rag.vectorstore.chroma_client import get_chroma, reset_chroma_dir
+from uae_legal_rag.vectorstore.backends import count_documents, flush_vectorstore
+from uae_legal_rag.vectorstore.chroma_client import reset_chroma_collection
+from uae_legal_rag.vectorstore.namespaces import get_vectorstore_registry
 
 
 def _get_logo_base64() -> str:
@@ -786,7 +788,7 @@ def _doc_count(vs) -> int:
     if not vs:
         return 0
     try:
-        return int(vs._collection.count())
+        return count_documents(vs)
     except Exception:
         return 0
 
@@ -871,14 +873,32 @@ def render_app() -> None:
         # Actions
         st.markdown('<div class="section-header">Quick Actions</div>', unsafe_allow_html=True)
         c1, c2 = st.columns(2)
+        workspace = settings.workspace
         if c1.button(
-            "🗑️ Reset", use_container_width=True, help="Clear all documents", key="btn_reset"
+            "🗑️ Reset",
+            use_container_width=True,
+            help=(
+                f"Clear all documents of workspace '{workspace}', for every session using it"
+                if workspace
+                else "Clear all documents"
+            ),
+            key="btn_reset",
         ):
-            reset_chroma_dir(settings.chroma_persist_dir, st.session_state.get("vs"))
-            dark_mode = st.session_state.get("dark_mode", True)
-            st.session_state.clear()
-            st.session_state["dark_mode"] = dark_mode
-            st.rerun()
+            if workspace:
+                st.session_state["confirm_reset"] = True
+            else:
+                _reset_documents()
+        if st.session_state.get("confirm_reset"):
+            st.warning(
+                f"This deletes every document in workspace '{workspace}', "
+                "including those uploaded by other sessions."
+            )
+            y, n = st.columns(2)
+            if y.button("Delete all", type="primary", key="btn_reset_confirm"):
+                _reset_documents()
+            if n.button("Cancel", key="btn_reset_cancel"):
+                del st.session_state["confirm_reset"]
+                st.rerun()
         if c2.button(
             "💬 New Chat",
             use_container_width=True,
@@ -1031,15 +1051,48 @@ def _show_setup_required() -> None:
     )
 
 
+def _reset_documents() -> None:
+    """Empty this session's namespace and start the session over."""
+
+    vs = st.session_state.get("vs")
+    lease = st.session_state.get("vs_lease")
+    if vs is not None and lease is not None:
+        with lease.write_lock:
+            reset_chroma_collection(vs)
+            flush_vectorstore(vs)
+    dark_mode = st.session_state.get("dark_mode", True)
+    st.session_state.clear()
+    st.session_state["dark_mode"] = dark_mode
+    st.rerun()
+
+
 def _init_vectorstore(settings):
-    """Initialize vectorstore."""
+    """This session's namespace in the process-wide vector store.
+
+    Sessions share the configured ``WORKSPACE``; without one, each session gets a
+    private namespace. The namespace is chosen by the deployment only, never by the
+    URL. The lease lives in session state; when the session goes away it is released
+    and an unused in-memory namespace is dropped.
+    """
     if "vs" not in st.session_state:
-        emb = get_embeddings(settings)
-        st.session_state["vs"] = get_chroma(
-            embeddings=emb,
-            persist_dir=settings.chroma_persist_dir,
-            collection_name=settings.chroma_collection_docs,
+        registry = get_vectorstore_registry(
+            settings.chroma_persist_dir,
+            settings.chroma_collection_docs,
+            persist_in_streamlit=settings.chroma_persist_streamlit,
+            backend=settings.vector_backend,
         )
+        if settings.workspace:
+            lease = registry.acquire(settings.workspace, get_embeddings(settings))
+        else:
+            lease = registry.acquire_private(get_embeddings(settings))
+        st.session_state["vs_lease"] = lease
+        st.session_state["vs"] = lease.vectorstore
+        if interrupted := registry.interrupted():
+            st.warning(
+                f"An indexing run ({interrupted.get('label', 'ingest')}) stopped before "
+                "finishing. Upload those documents again to complete the index; "
+                "sections already indexed are not re-embedded."
+            )
     return st.session_state["vs"]
 
 
@@ -1096,32 +1149,13 @@ def _chat_ui(settings, vs, count: int) -> None:
                 try:
                     llm = get_chat_llm(settings)
 
-                    # Smart intent classification using LLM
-                    intent_prompt = f"""Classify this user message into one of these categories:
-- "greeting": Simple greetings like hi, hello, hey, good morning, etc.
-- "about": Questions about you (the AI), your capabilities, who made you, etc.
-- "general": General questions NOT about documents (weather, math, coding, etc.)
-- "document": Questions about legal documents, contracts, clauses, analysis, etc.
-
-User message: "{q}"
-
-Reply with ONLY one word: greeting, about, general, or document"""
-
-                    intent_response = llm.invoke(intent_prompt)
-                    # Extract content safely
-                    if hasattr(intent_response, "content"):
-                        raw_content = intent_response.content
-                        if isinstance(raw_content, list):
-                            intent = (
-                                str(raw_content[0]).strip().lower() if raw_content else "document"
-                            )
-                        else:
-                            intent = str(raw_content).strip().lower()
-                    else:
-                        intent = str(intent_response).strip().lower()
+                    # Local classifier; the LLM is consulted only for unclear messages.
+                    intent = resolve_intent(
+                        q, llm=llm, min_confidence=settings.intent_min_confidence
+                    ).intent
 
                     # Handle based on intent
-                    if "greeting" in intent:
+                    if intent == "greeting":
                         response = """Hello! 👋 I'm **LexiQ**, your AI legal document assistant.
 
 I can help you with:
@@ -1139,7 +1173,7 @@ I can help you with:
                             {"role": "assistant", "content": response}
                         )
 
-                    elif "about" in intent:
+                    elif intent == "about":
                         response = """I'm **LexiQ** ⚖️ — an AI-powered legal document analysis assistant.
 
 **What I do:**
@@ -1159,7 +1193,7 @@ I'm here to help you understand your legal documents better. What would you like
                             {"role": "assistant", "content": response}
                         )
 
-                    elif "general" in intent:
+                    elif intent == "general":
                         # Use LLM for general conversation but remind about capabilities
                         general_resp = llm.invoke(f"""You are LexiQ, a friendly AI legal document assistant. 
 The user asked a general question (not about documents). Give a brief, helpful response, 
@@ -1179,20 +1213,44 @@ User: {q}""")
                     else:
                         # Document-related query - use full RAG pipeline
                         if "retriever" not in st.session_state:
-                            st.session_state["retriever"] = build_retriever(vs, k=4)
-
-                        graph = build_graph(st.session_state["retriever"], llm)
-                        raw: Any = graph.invoke(LegalState(question=q))
-                        out = LegalState.model_validate(raw) if isinstance(raw, dict) else raw
+                            st.session_state["retriever"] = build_retriever(
+                                vs,
+                                k=4,
+                                mode=settings.retrieval_mode,
+                                route_sections=settings.section_routing,
+                            )
 
-                        st.markdown(_risk_badge(out.risk_level), unsafe_allow_html=True)
+                        graph = build_graph(
+                            st.session_state["retriever"],
+                            llm,
+                            context_tokens=settings.context_token_budget or None,
+                            mode=settings.graph_mode,
+                        )
+                        badge_slot = st.empty()
                         st.markdown("")
-                        st.markdown(out.answer)
+                        answer_slot = st.empty()
+
+                        # Render the badge as soon as the risk node is done and the
+                        # answer token by token; the final state replaces the draft.
+                        draft = ""
+                        out = LegalState(question=q)
+                        for kind, payload in stream_graph(graph, LegalState(question=q)):
+                            if kind == "risk":
+                                badge_slot.markdown(_risk_badge(payload[0]), unsafe_allow_html=True)
+                            elif kind == "token":
+                                draft += payload
+                                answer_slot.markdown(draft + "▌")
+                            else:
+                                out = payload
+
+                        badge_slot.markdown(_risk_badge(out.risk_level), unsafe_allow_html=True)
+                        answer_slot.markdown(out.answer)
 
                         if out.clause_snippets:
                             # Custom styled source references section
                             snippets_html = "".join(
-                                f'<div class="source-snippet">{s}</div>' for s in out.clause_snippets
+                                f'<div class="source-snippet">{s}</div>'
+                                for s in out.clause_snippets
                             )
                             st.markdown(
                                 f"""
@@ -1254,28 +1312,60 @@ def _upload_ui(settings) -> None:
         if files and st.button(
             "🚀 Process Documents", type="primary", use_container_width=True, key="btn_process"
         ):
+            names = [f.name for f in files]
+            duplicates = sorted({n for n in names if names.count(n) > 1})
+            if duplicates:
+                # Filenames identify documents in the index; a second file with the
+                # same name would replace the first one's sections.
+                st.error(f"⚠️ Rename or remove duplicate files: {', '.join(duplicates)}")
+                return
+
             vs = _init_vectorstore(settings)
             prog = st.progress(0, text="Initializing...")
 
-            pages = []
-            for i, f in enumerate(files):
-                prog.progress((i + 1) / (len(files) + 2), f"Loading: {f.name}")
-                pages.extend(load_pdf_bytes(f.read(), f.name))
-
-            if not pages:
+            def on_progress(p: IngestProgress) -> None:
+                prog.progress(
+                    p.fraction,
+                    f"Indexing: {p.current_file} — {p.pages_loaded} pages read, "
+                    f"{p.chunks_indexed} sections searchable",
+                )
+
+            # Streams pages straight from the uploaded buffers; batches become
+            # searchable as soon as they are added.
+            # Another session of this workspace uploading the same files waits here,
+            # then finds their chunks already indexed instead of embedding them again.
+            with st.session_state["vs_lease"].write_lock:
+                result = ingest_stream(
+                    [(f.name, f) for f in files],
+                    vs,
+                    batch_size=settings.ingest_batch_size,
+                    chunk_strategy=settings.chunking_strategy,  # type: ignore[arg-type]
+                    page_cache=get_page_cache(settings),
+                    pdf_backend=settings.pdf_backend,
+                    on_progress=on_progress,
+                )
+                flush_vectorstore(vs)
+
+            if not result.pages_loaded:
                 st.error("⚠️ No readable text found in the uploaded PDFs")
                 return
 
-            prog.progress(0.7, "Processing and chunking documents...")
-            chunks = chunk_documents(pages)
-
-            prog.progress(0.9, "Building search index...")
-            vs.add_documents(chunks)
-            st.session_state["retriever"] = build_retriever(vs, k=4)
+            st.session_state["retriever"] = build_retriever(
+                vs,
+                k=4,
+                mode=settings.retrieval_mode,
+                route_sections=settings.section_routing,
+            )
 
             prog.progress(1.0, "Complete!")
             st.success(
-                f"✅ Successfully indexed {len(chunks)} document sections from {len(files)} file(s)"
+                f"✅ Successfully indexed {result.chunks_indexed} new document sections "
+                f"from {len(files)} file(s)"
+                + (
+                    f" ({result.chunks_unchanged} unchanged, {result.chunks_deleted} removed)"
+                    if result.chunks_unchanged or result.chunks_deleted
+                    else ""
+                )
             )
 
     with col2:
@@ -0,0 +1,157 @@
+"""Persistent, content-addressed embedding cache.
+
+Vectors are stored in a local SQLite file keyed by ``sha256(model, normalized text)``,
+so re-uploads, resets and new sessions only pay for text that was never embedded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from uae_legal_rag.cache.sqlite import connect
+
+# SQLite's default limit on bound parameters is 999 on older builds.
+_LOOKUP_CHUNK = 500
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def cache_key(model: str, text: str) -> str:
+    payload = f"{model}\0{normalize_text(text)}".encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+class CachedEmbeddings(Embeddings):
+    """Wrap an ``Embeddings`` so document vectors are served from disk when known.
+
+    ``max_entries`` caps the store; the least recently used vectors are evicted
+    first. Query embeddings are passed straight through.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model: str,
+        db_path: str,
+        max_entries: int = 200_000,
+    ):
+        self.underlying = underlying
+        self.model = model
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        return connect(self.db_path)
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                  key TEXT PRIMARY KEY,
+                  model TEXT NOT NULL,
+                  vector BLOB NOT NULL,
+                  last_used REAL NOT NULL
+                );
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            conn.commit()
+
+    def _lookup(self, conn: sqlite3.Connection, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        for i in range(0, len(keys), _LOOKUP_CHUNK):
+            part = keys[i : i + _LOOKUP_CHUNK]
+            marks = ",".join("?" * len(part))
+            rows = conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", part
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+        if found:
+            now = time.time()
+            conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                [(now, k) for k in found],
+            )
+        return found
+
+    def _store(self, conn: sqlite3.Connection, items: dict[str, list[float]]) -> None:
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) VALUES (?, ?, ?, ?)",
+            [(k, self.model, array("f", v).tobytes(), now) for k, v in items.items()],
+        )
+        (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                (excess,),
+            )
+            with self._lock:
+                self.stats.evictions += excess
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [cache_key(self.model, t) for t in texts]
+        with self._connect() as conn:
+            found = self._lookup(conn, keys)
+
+        # Embed each distinct missing text once, even if repeated in the batch.
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            # No transaction is held while the (slow) embedding call runs.
+            vectors = self.underlying.embed_documents(list(missing.values()))
+            # Round-trip through float32 so a miss returns exactly what a later hit will.
+            fresh = {k: array("f", v).tolist() for k, v in zip(missing, vectors, strict=True)}
+            with self._connect() as conn:
+                self._store(conn, fresh)
+            found.update(fresh)
+
+        with self._lock:
+            self.stats.hits += len(texts) - len(missing)
+            self.stats.misses += len(missing)
+        return [found[k] for k in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.underlying.embed_query(text)
+
+    def entry_count(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(count)
@@ -0,0 +1,210 @@
+"""Exact-match cache for chat model responses.
+
+Plugs into LangChain's model-level cache (``ChatOpenAI(cache=...)``), which keys
+every call by the model's serialized parameters (model, temperature, ...) and the
+fully rendered messages. A byte-identical call is answered from an in-memory LRU
+tier or, optionally, a SQLite tier that survives restarts. Entries expire after
+``ttl_s`` seconds.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from uae_legal_rag.cache.sqlite import connect
+from uae_legal_rag.config import Settings
+
+
+@dataclass
+class LLMCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _key(prompt: str, llm_string: str) -> str:
+    return hashlib.sha256(f"{llm_string}\0{prompt}".encode()).hexdigest()
+
+
+def _encode(generations: Sequence[Generation]) -> str:
+    out = []
+    for g in generations:
+        item: dict[str, Any] = {"text": g.text, "generation_info": g.generation_info}
+        if isinstance(g, ChatGeneration):
+            item["message"] = message_to_dict(g.message)
+        out.append(item)
+    return json.dumps(out)
+
+
+def _decode(payload: str) -> list[Generation]:
+    out: list[Generation] = []
+    for item in json.loads(payload):
+        if "message" in item:
+            (message,) = messages_from_dict([item["message"]])
+            out.append(ChatGeneration(message=message, generation_info=item["generation_info"]))
+        else:
+            out.append(Generation(text=item["text"], generation_info=item["generation_info"]))
+    return out
+
+
+class LLMResponseCache(BaseCache):
+    """Two-tier (memory LRU + optional SQLite) exact-match response cache.
+
+    Values are kept serialized and decoded on every hit, so callers never share
+    (or mutate) a cached message object.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_s: float | None = 24 * 3600,
+        db_path: str | None = None,
+        max_db_entries: int = 20_000,
+    ):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.db_path = db_path
+        self.max_db_entries = max_db_entries
+        self.stats = LLMCacheStats()
+        # key -> (expires_at, payload)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        if db_path:
+            self._init_db()
+
+    def _connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        assert self.db_path is not None
+        return connect(self.db_path)
+
+    def _init_db(self) -> None:
+        assert self.db_path is not None
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                  key TEXT PRIMARY KEY,
+                  payload TEXT NOT NULL,
+                  expires_at REAL NOT NULL,
+                  last_used REAL NOT NULL
+                );
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_responses_last_used ON llm_responses (last_used)"
+            )
+            conn.commit()
+
+    def _remember(self, key: str, expires_at: float, payload: str) -> None:
+        # Caller holds the lock.
+        self._memory[key] = (expires_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = _key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return _decode(entry[1])
+                del self._memory[key]
+                self.stats.expired += 1
+
+        if self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (now, key))
+                    with self._lock:
+                        self._remember(key, row[1], row[0])
+                        self.stats.disk_hits += 1
+                    return _decode(row[0])
+                if row is not None:
+                    conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    with self._lock:
+                        self.stats.expired += 1
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = _key(prompt, llm_string)
+        now = time.time()
+        expires_at = now + self.ttl_s if self.ttl_s else float("inf")
+        payload = _encode(return_val)
+        with self._lock:
+            self._remember(key, expires_at, payload)
+        if not self.db_path:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, payload, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+            excess = count - self.max_db_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN "
+                    "(SELECT key FROM llm_responses ORDER BY last_used ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_cache(max_entries: int, ttl_s: float, db_path: str | None) -> LLMResponseCache:
+    return LLMResponseCache(max_entries=max_entries, ttl_s=ttl_s or None, db_path=db_path)
+
+
+def get_llm_cache(settings: Settings) -> LLMResponseCache | None:
+    """Process-wide cache for these settings (chat models are rebuilt per request)."""
+
+    if settings.llm_cache_max_entries <= 0:
+        return None
+    db_path = str(Path(settings.cache_dir) / "llm.sqlite") if settings.llm_cache_persist else None
+    return _shared_cache(settings.llm_cache_max_entries, settings.llm_cache_ttl_s, db_path)
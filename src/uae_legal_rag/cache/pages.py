@@ -0,0 +1,238 @@
+"""Persistent cache of extracted PDF page text.
+
+Entries are keyed by ``sha256(pdf bytes)`` plus the extractor that produced them, so
+re-uploading a file (new session, reset, CLI re-run) skips PDF parsing entirely and
+an extractor upgrade never serves stale text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from uae_legal_rag.cache.sqlite import connect
+from uae_legal_rag.config import Settings
+
+
+@dataclass
+class PageCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    pages_served: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Pages per write transaction while a document is being extracted.
+WRITE_BATCH_PAGES = 32
+
+
+def document_key(pdf: bytes | BinaryIO, extractor: str) -> str:
+    """Cache key of a PDF. A stream is hashed in chunks and rewound afterwards."""
+
+    if isinstance(pdf, bytes):
+        digest = hashlib.sha256(pdf).hexdigest()
+    else:
+        start = pdf.tell()
+        digest = hashlib.file_digest(pdf, "sha256").hexdigest()
+        pdf.seek(start)
+    return f"{digest}:{extractor}"
+
+
+class PageTextCache:
+    """Per-page text of whole PDFs, stored in a local SQLite file.
+
+    ``max_bytes`` caps the stored text; least recently used documents are evicted
+    first. Every page is stored (including empty ones) so cached output matches a
+    fresh extraction exactly.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 256 * 2**20):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.stats = PageCacheStats()
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def __getstate__(self) -> dict:
+        # Picklable for process pools; each process keeps its own counters.
+        return {"db_path": self.db_path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.stats = PageCacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        return connect(self.db_path)
+
+    def _init_db(self) -> None:
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                  key TEXT PRIMARY KEY,
+                  num_pages INTEGER NOT NULL,
+                  bytes INTEGER NOT NULL,
+                  last_used REAL NOT NULL
+                );
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                  key TEXT NOT NULL,
+                  idx INTEGER NOT NULL,
+                  text TEXT NOT NULL,
+                  PRIMARY KEY (key, idx)
+                ) WITHOUT ROWID;
+                """
+            )
+            conn.commit()
+
+    def get(self, key: str) -> list[str] | None:
+        """All page texts of a cached document, in page order, or ``None``."""
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT num_pages FROM documents WHERE key = ?", (key,)).fetchone()
+            texts = None
+            if row is not None:
+                texts = [
+                    t
+                    for (t,) in conn.execute(
+                        "SELECT text FROM pages WHERE key = ? ORDER BY idx", (key,)
+                    )
+                ]
+                if len(texts) != row[0]:
+                    texts = None  # partially written entry; treat as a miss
+                else:
+                    conn.execute(
+                        "UPDATE documents SET last_used = ? WHERE key = ?", (time.time(), key)
+                    )
+
+        with self._lock:
+            if texts is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.stats.pages_served += len(texts)
+        return texts
+
+    def put(self, key: str, texts: Iterable[str]) -> None:
+        writer = self.writer(key)
+        for text in texts:
+            writer.add(text)
+        writer.commit()
+
+    def writer(self, key: str) -> PageWriter:
+        """Store a document's pages one at a time, as they are extracted."""
+
+        return PageWriter(self, key)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM documents").fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        rows = conn.execute("SELECT key, bytes FROM documents ORDER BY last_used ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            conn.execute("DELETE FROM documents WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        with self._lock:
+            self.stats.evictions += evicted
+
+    def total_bytes(self) -> int:
+        with self._connect() as conn:
+            (total,) = conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM documents").fetchone()
+        return int(total)
+
+
+class PageWriter:
+    """Writes one document's pages in small batches (``PageTextCache.writer``).
+
+    Pages are flushed every ``WRITE_BATCH_PAGES``, so no more than a batch of text is
+    held in memory. The document only becomes visible to ``get`` on ``commit``; a
+    document that outgrows ``max_bytes`` is dropped, and ``discard`` removes the
+    pages written so far. After either, further calls do nothing.
+    """
+
+    def __init__(self, cache: PageTextCache, key: str):
+        self.cache = cache
+        self.key = key
+        self._batch: list[tuple[str, int, str]] = []
+        self._num_pages = 0
+        self._size = 0
+        self._started = False
+        self._closed = False
+
+    def add(self, text: str) -> None:
+        if self._closed:
+            return
+        self._size += len(text.encode("utf-8"))
+        if self._size > self.cache.max_bytes:
+            self.discard()
+            return
+        self._batch.append((self.key, self._num_pages, text))
+        self._num_pages += 1
+        if len(self._batch) >= WRITE_BATCH_PAGES:
+            with self.cache._connect() as conn:
+                self._flush(conn)
+
+    def commit(self) -> None:
+        if self._closed:
+            return
+        with self.cache._connect() as conn:
+            self._flush(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO documents (key, num_pages, bytes, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (self.key, self._num_pages, self._size, time.time()),
+            )
+            self.cache._evict(conn)
+        self._closed = True
+
+    def discard(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._batch.clear()
+        if self._started:
+            with self.cache._connect() as conn:
+                conn.execute("DELETE FROM pages WHERE key = ?", (self.key,))
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        if not self._started:
+            # Replace whatever an earlier (possibly interrupted) write left behind.
+            conn.execute("DELETE FROM documents WHERE key = ?", (self.key,))
+            conn.execute("DELETE FROM pages WHERE key = ?", (self.key,))
+            self._started = True
+        conn.executemany(
+            "INSERT OR REPLACE INTO pages (key, idx, text) VALUES (?, ?, ?)", self._batch
+        )
+        self._batch.clear()
+
+
+def get_page_cache(settings: Settings) -> PageTextCache | None:
+    if settings.page_cache_max_mb <= 0:
+        return None
+    return PageTextCache(
+        str(Path(settings.cache_dir) / "pages.sqlite"),
+        max_bytes=settings.page_cache_max_mb * 2**20,
+    )
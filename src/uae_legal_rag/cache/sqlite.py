@@ -0,0 +1,23 @@
+"""SQLite connections for the on-disk caches."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+@contextmanager
+def connect(db_path: str) -> Iterator[sqlite3.Connection]:
+    """One transaction on a fresh connection, closed afterwards.
+
+    ``with sqlite3.connect(...)`` only commits or rolls back; the connection itself
+    would stay open until garbage collection.
+    """
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
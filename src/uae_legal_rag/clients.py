@@ -0,0 +1,115 @@
+"""Process-wide registry of shared, pooled OpenAI clients.
+
+Every chat / embedding client handed out by the registry sends its requests through
+one keep-alive ``httpx`` connection pool, so sessions and messages reuse warm
+connections instead of paying a new TCP (and TLS) handshake each time. Clients are
+built once per key (kind, model, API key fingerprint, ...) and shared; both the
+LangChain OpenAI wrappers and ``httpx.Client`` are safe to use from many threads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import httpx
+import openai
+
+DEFAULT_POOL_SIZE = 20
+
+T = TypeVar("T")
+
+
+@dataclass
+class ConnectionStats:
+    requests: int = 0
+    connections_opened: int = 0
+    clients_built: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible stand-in for an API key in registry keys."""
+
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class ClientRegistry:
+    """Builds each client once and shares one pooled HTTP transport between them."""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        self.pool_size = max(1, pool_size)
+        self.stats = ConnectionStats()
+        self._clients: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.http_client = openai.DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.pool_size, max_keepalive_connections=self.pool_size
+            ),
+            event_hooks={"request": [self._on_request]},
+        )
+
+    def _on_request(self, request: httpx.Request) -> None:
+        with self._stats_lock:
+            self.stats.requests += 1
+        # httpcore reports "connection.connect_tcp.*" only when it opens a connection.
+        request.extensions["trace"] = self._trace
+
+    def _trace(self, event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            with self._stats_lock:
+                self.stats.connections_opened += 1
+
+    def get(self, key: Hashable, factory: Callable[[httpx.Client], T]) -> T:
+        """Client for ``key``, built with ``factory(self.http_client)`` on first use."""
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory(self.http_client)
+                self._clients[key] = client
+                with self._stats_lock:
+                    self.stats.clients_built += 1
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def close(self) -> None:
+        with self._lock:
+            self._clients.clear()
+        self.http_client.close()
+
+
+_registries: dict[int, ClientRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_client_registry(pool_size: int = DEFAULT_POOL_SIZE) -> ClientRegistry:
+    """Process-wide registry (one per pool size; first callers may race, hence the lock)."""
+
+    with _registries_lock:
+        registry = _registries.get(pool_size)
+        if registry is None:
+            registry = _registries[pool_size] = ClientRegistry(pool_size)
+        return registry
+
+
+def reset_client_registries() -> None:
+    """Close and forget every registry (tests, or after rotating API keys)."""
+
+    with _registries_lock:
+        for registry in _registries.values():
+            registry.close()
+        _registries.clear()
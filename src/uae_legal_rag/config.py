@@ -25,7 +25,26 @@ class Settings:
     openai_model: str
     openai_embedding_model: str
     chroma_persist_dir: str
+    chroma_persist_streamlit: bool
     chroma_collection_docs: str
+    workspace: str | None
+    ingest_batch_size: int
+    chunking_strategy: str
+    cache_dir: str
+    embedding_cache_max_entries: int
+    embedding_concurrency: int
+    http_pool_size: int
+    page_cache_max_mb: int
+    llm_cache_max_entries: int
+    llm_cache_ttl_s: float
+    llm_cache_persist: bool
+    intent_min_confidence: float
+    context_token_budget: int
+    graph_mode: str
+    vector_backend: str
+    retrieval_mode: str
+    section_routing: bool
+    pdf_backend: str
 
 
 def get_settings() -> Settings:
@@ -34,11 +53,49 @@ def get_settings() -> Settings:
 
     persist_dir = os.getenv("CHROMA_PERSIST_DIR", "./chroma_legal")
     persist_dir = str(Path(persist_dir).resolve())
+    chunking_strategy = os.getenv("CHUNKING_STRATEGY", "recursive")
+    if chunking_strategy not in ("recursive", "clause"):
+        raise ValueError(
+            f"CHUNKING_STRATEGY must be 'recursive' or 'clause', not {chunking_strategy!r}"
+        )
+    pdf_backend = os.getenv("PDF_BACKEND", "auto")
+    if pdf_backend not in ("auto", "pypdf", "pymupdf"):
+        raise ValueError(f"PDF_BACKEND must be 'auto', 'pypdf' or 'pymupdf', not {pdf_backend!r}")
+    graph_mode = os.getenv("GRAPH_MODE", "two_call")
+    if graph_mode not in ("two_call", "structured"):
+        raise ValueError(f"GRAPH_MODE must be 'two_call' or 'structured', not {graph_mode!r}")
+    vector_backend = os.getenv("VECTOR_BACKEND", "chroma")
+    if vector_backend not in ("chroma", "numpy"):
+        raise ValueError(f"VECTOR_BACKEND must be 'chroma' or 'numpy', not {vector_backend!r}")
+    retrieval_mode = os.getenv("RETRIEVAL_MODE", "dense")
+    if retrieval_mode not in ("dense", "hybrid"):
+        raise ValueError(f"RETRIEVAL_MODE must be 'dense' or 'hybrid', not {retrieval_mode!r}")
+    cache_dir = str(Path(os.getenv("LEXIQ_CACHE_DIR", "./.lexiq_cache")).resolve())
 
     return Settings(
         openai_api_key=os.getenv("OPENAI_API_KEY"),
         openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
         openai_embedding_model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"),
         chroma_persist_dir=persist_dir,
+        chroma_persist_streamlit=os.getenv("CHROMA_PERSIST_STREAMLIT", "false").lower()
+        in ("1", "true", "yes"),
         chroma_collection_docs=os.getenv("CHROMA_COLLECTION_NAME", "uae_legal_docs"),
+        workspace=os.getenv("WORKSPACE") or None,
+        ingest_batch_size=int(os.getenv("INGEST_BATCH_SIZE", "64")),
+        chunking_strategy=chunking_strategy,
+        cache_dir=cache_dir,
+        embedding_cache_max_entries=int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000")),
+        embedding_concurrency=int(os.getenv("EMBEDDING_CONCURRENCY", "4")),
+        http_pool_size=int(os.getenv("HTTP_POOL_SIZE", "20")),
+        page_cache_max_mb=int(os.getenv("PAGE_CACHE_MAX_MB", "256")),
+        pdf_backend=pdf_backend,
+        llm_cache_max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512")),
+        llm_cache_ttl_s=float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400")),
+        llm_cache_persist=os.getenv("LLM_CACHE_PERSIST", "false").lower() in ("1", "true", "yes"),
+        intent_min_confidence=float(os.getenv("INTENT_MIN_CONFIDENCE", "0.6")),
+        context_token_budget=int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000")),
+        graph_mode=graph_mode,
+        vector_backend=vector_backend,
+        retrieval_mode=retrieval_mode,
+        section_routing=os.getenv("SECTION_ROUTING", "false").lower() in ("1", "true", "yes"),
     )
@@ -0,0 +1,195 @@
+"""Concurrent, rate-limit-aware embedding of large text lists.
+
+``ConcurrentEmbeddings`` wraps any ``Embeddings``: it cuts the input into
+token-bounded batches, sends up to ``max_concurrency`` of them at once and returns
+vectors in input order. On HTTP 429 it backs off (honouring ``retry-after``) and
+halves its concurrency, then grows it back one slot at a time as requests succeed.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+import openai
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_BATCH_TEXTS = 32
+# Well under the API's per-request limit; keeps batches small enough to overlap.
+DEFAULT_BATCH_TOKENS = 32_000
+DEFAULT_MAX_RETRIES = 6
+BACKOFF_BASE_S = 0.5
+BACKOFF_MAX_S = 30.0
+
+T = TypeVar("T")
+
+
+@dataclass
+class SchedulerStats:
+    requests: int = 0
+    texts: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    concurrency: int = 0
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    status = _status_code(exc)
+    return status is not None and status >= 500
+
+
+class _AdaptiveLimiter:
+    """Concurrency slots: halved on throttling, regrown by one per ``limit`` successes."""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self.limit < self.max_limit and self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def token_batches(
+    texts: list[str], count_tokens: Callable[[str], int], max_texts: int, max_tokens: int
+) -> list[range]:
+    """Contiguous index ranges holding at most ``max_texts`` / ``max_tokens`` each.
+
+    A single text over ``max_tokens`` gets a batch of its own.
+    """
+
+    out: list[range] = []
+    start, tokens = 0, 0
+    for i, text in enumerate(texts):
+        n = count_tokens(text)
+        if i > start and (i - start >= max_texts or tokens + n > max_tokens):
+            out.append(range(start, i))
+            start, tokens = i, 0
+        tokens += n
+    if start < len(texts):
+        out.append(range(start, len(texts)))
+    return out
+
+
+class ConcurrentEmbeddings(Embeddings):
+    """Embed documents in concurrent, token-bounded batches.
+
+    Queries are sent one at a time but share the limiter and retry policy. Set
+    ``max_retries=0`` on the wrapped OpenAI client so retries are not stacked.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_texts: int = DEFAULT_BATCH_TEXTS,
+        batch_tokens: int = DEFAULT_BATCH_TOKENS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        count_tokens: Callable[[str], int] | None = None,
+    ):
+        if count_tokens is None:
+            from uae_legal_rag.ingestion.chunking import token_len
+
+            count_tokens = token_len
+        self.underlying = underlying
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_texts = batch_texts
+        self.batch_tokens = batch_tokens
+        self.max_retries = max_retries
+        self.count_tokens = count_tokens
+        self.stats = SchedulerStats(concurrency=self.max_concurrency)
+        self._limiter = _AdaptiveLimiter(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return self._with_retries(lambda: self.underlying.embed_documents(texts), len(texts))
+
+    def _with_retries(self, call: Callable[[], T], n_texts: int) -> T:
+        """Run one API request under the limiter, backing off on throttling and blips."""
+
+        attempt = 0
+        while True:
+            self._limiter.acquire()
+            try:
+                result = call()
+            except Exception as exc:
+                throttled = _status_code(exc) == 429
+                self._limiter.release(throttled=throttled)
+                if attempt >= self.max_retries or not (throttled or _is_transient(exc)):
+                    raise
+                delay = _retry_after(exc) if throttled else None
+                if delay is None:
+                    delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2**attempt)
+                    delay *= random.uniform(0.5, 1.0)
+                with self._stats_lock:
+                    self.stats.retries += 1
+                    self.stats.rate_limited += int(throttled)
+                    self.stats.concurrency = self._limiter.limit
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._limiter.release()
+            with self._stats_lock:
+                self.stats.requests += 1
+                self.stats.texts += n_texts
+                self.stats.concurrency = self._limiter.limit
+            return result
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = token_batches(texts, self.count_tokens, self.batch_texts, self.batch_tokens)
+        if len(batches) <= 1:
+            return self._embed_batch(list(texts)) if texts else []
+
+        out: list[list[float]] = [[] for _ in texts]
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+            futures = [pool.submit(self._embed_batch, texts[r.start : r.stop]) for r in batches]
+            for r, fut in zip(batches, futures, strict=True):
+                out[r.start : r.stop] = fut.result()
+        return out
+
+    def embed_query(self, text: str) -> list[float]:
+        # Questions go through the same backoff as documents: the wrapped client
+        # does not retry on its own.
+        return self._with_retries(lambda: self.underlying.embed_query(text), 1)
@@ -1,10 +1,23 @@
-"""LangGraph workflow: retrieve -> analyze risk -> answer.
+"""LangGraph workflow: retrieve -> (analyze risk || answer) -> compose.
 
-Designed to be readable and easy to extend.
+Designed to be readable and easy to extend. Both LLM calls only need the retrieved
+context, so by default they run in parallel and ``compose`` joins them into the final
+answer (``build_graph(..., parallel=False)`` keeps the old sequential order).
+``graph.invoke`` returns the final state; ``stream_graph`` yields the risk verdict and
+answer tokens as they are produced.
+
+``build_graph(..., mode="structured")`` replaces the two calls with a single one that
+returns the answer and the risk findings as one structured reply
+(``StructuredAnalysis``); the rule-based risk score still runs over those findings.
+
+``build_async_graph`` wires the same topology from the ``anode_*`` variants, which
+``await`` retrieval and the LLM (``ainvoke``), so many questions can share one event
+loop; run it with ``await graph.ainvoke(...)`` or ``astream_graph``.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, Literal
 
 from langchain_core.documents import Document
@@ -12,21 +25,42 @@ from langchain_core.output_parsers import StrOutputParser
 from langgraph.graph import END, StateGraph
 from pydantic import BaseModel, Field
 
-from uae_legal_rag.rag.formatting import docs_to_context, docs_to_snippets
-from uae_legal_rag.rag.prompts import qa_prompt, risk_prompt
+from uae_legal_rag.lexicon import LexiconMatcher
+from uae_legal_rag.rag.formatting import (
+    ContextStats,
+    docs_to_context,
+    docs_to_snippets,
+    pack_context,
+    stitch_chunks,
+)
+from uae_legal_rag.rag.prompts import qa_prompt, risk_prompt, structured_prompt
 
 RiskLevel = Literal["Low", "Medium", "High"]
+Severity = Literal["Critical", "High", "Medium", "Low"]
+GraphMode = Literal["two_call", "structured"]
+StreamEventKind = Literal["risk", "token", "final"]
+
+GRAPH_MODES: tuple[GraphMode, ...] = ("two_call", "structured")
+ANSWER_NODE = "answer"
+RISK_NODE = "analyze_risk"
+STRUCTURED_NODE = "analyze_and_answer"
+COMPOSE_NODE = "compose"
+STREAM_MODES = ["messages", "updates", "values"]
 
 
 class LegalState(BaseModel):
     question: str
 
     retrieved_docs: list[Document] = Field(default_factory=list)
+    # Formatted once after retrieval and shared by both LLM calls.
+    context: str = ""
+    context_stats: ContextStats | None = None
 
     analysis: str = ""
     risk_level: RiskLevel = "Low"
     risk_explanation: str = ""
 
+    draft_answer: str = ""
     answer: str = ""
     clause_snippets: list[str] = Field(default_factory=list)
 
@@ -36,12 +70,21 @@ class LegalState(BaseModel):
     hops_remaining: int = 0
 
 
-def deterministic_risk_score(analysis_text: str) -> tuple[RiskLevel, str]:
-    """Explainable keyword-based scoring (demo only)."""
+class RiskFinding(BaseModel):
+    clause: str = Field(description="Quoted or cited clause the risk comes from")
+    issue: str = Field(description="Practical implication for the reader")
+    severity: Severity
+
 
-    t = (analysis_text or "").lower()
+class StructuredAnalysis(BaseModel):
+    """Single-call reply: the user-facing answer plus the risk findings behind it."""
 
-    high = [
+    answer: str = Field(description="Markdown answer to the question")
+    findings: list[RiskFinding] = Field(default_factory=list)
+
+
+RISK_MARKERS: dict[str, list[str]] = {
+    "high": [
         "unlimited liability",
         "termination without notice",
         "liquidated damages",
@@ -50,8 +93,8 @@ def deterministic_risk_score(analysis_text: str) -> tuple[RiskLevel, str]:
         "hold harmless",
         "non-compete",
         "waiver of rights",
-    ]
-    medium = [
+    ],
+    "medium": [
         "termination",
         "notice period",
         "liability",
@@ -61,10 +104,17 @@ def deterministic_risk_score(analysis_text: str) -> tuple[RiskLevel, str]:
         "pdpl",
         "data protection",
         "personal data",
-    ]
+    ],
+}
+RISK_MATCHER = LexiconMatcher(RISK_MARKERS)
+
+
+def deterministic_risk_score(analysis_text: str) -> tuple[RiskLevel, str]:
+    """Explainable keyword-based scoring (demo only)."""
 
-    hits_high = sorted({m for m in high if m in t})
-    hits_med = sorted({m for m in medium if m in t})
+    found = RISK_MATCHER.terms(analysis_text)
+    hits_high = sorted(found.intersection(RISK_MARKERS["high"]))
+    hits_med = sorted(found.intersection(RISK_MARKERS["medium"]))
 
     if hits_high:
         return "High", f"High-risk markers found: {', '.join(hits_high)}."
@@ -76,30 +126,97 @@ def deterministic_risk_score(analysis_text: str) -> tuple[RiskLevel, str]:
     return "Low", "No explicit high-risk markers detected by the rule layer."
 
 
-def node_retrieve(state: LegalState, retriever) -> dict[str, Any]:
-    docs = retriever.invoke(state.question)
-    return {"retrieved_docs": docs}
+def _retrieved(hits: list[Document], max_tokens: int | None) -> dict[str, Any]:
+    # Neighbouring chunks of one page become a single passage (no repeated overlap).
+    docs = stitch_chunks(hits)
+    if max_tokens:
+        context, stats = pack_context(docs, max_tokens)
+        return {"retrieved_docs": docs, "context": context, "context_stats": stats}
+    return {"retrieved_docs": docs, "context": docs_to_context(docs), "context_stats": None}
 
 
-def node_analyze_risk(state: LegalState, llm) -> dict[str, Any]:
-    context = docs_to_context(state.retrieved_docs)
-    analysis = (risk_prompt() | llm | StrOutputParser()).invoke(
-        {"question": state.question, "context": context}
-    )
+def _inputs(state: LegalState) -> dict[str, str]:
+    return {
+        "question": state.question,
+        "context": state.context or docs_to_context(state.retrieved_docs),
+    }
+
+
+def _risk_update(analysis: str) -> dict[str, Any]:
     risk_level, explanation = deterministic_risk_score(analysis)
     return {"analysis": analysis, "risk_level": risk_level, "risk_explanation": explanation}
 
 
+def _answer_update(state: LegalState, ai_response: str) -> dict[str, Any]:
+    snippets = docs_to_snippets(state.retrieved_docs, max_items=4)
+
+    follow_up = None  # Let the conversation flow naturally
+
+    return {
+        "draft_answer": ai_response.strip(),
+        "clause_snippets": snippets,
+        "follow_up_question": follow_up,
+    }
+
+
+def findings_to_analysis(findings: list[RiskFinding]) -> str:
+    return "\n".join(f"- [{f.severity}] {f.clause}: {f.issue}" for f in findings)
+
+
+def _structured_update(state: LegalState, reply: StructuredAnalysis) -> dict[str, Any]:
+    return {
+        **_risk_update(findings_to_analysis(reply.findings)),
+        **_answer_update(state, reply.answer),
+    }
+
+
+def _structured_chain(llm):
+    return structured_prompt() | llm.with_structured_output(StructuredAnalysis)
+
+
+def node_retrieve(state: LegalState, retriever, max_tokens: int | None = None) -> dict[str, Any]:
+    return _retrieved(retriever.invoke(state.question), max_tokens)
+
+
+def node_analyze_risk(state: LegalState, llm) -> dict[str, Any]:
+    return _risk_update((risk_prompt() | llm | StrOutputParser()).invoke(_inputs(state)))
+
+
 def node_answer(state: LegalState, llm) -> dict[str, Any]:
-    context = docs_to_context(state.retrieved_docs)
-    ai_response = (qa_prompt() | llm | StrOutputParser()).invoke(
-        {"question": state.question, "context": context}
-    )
+    return _answer_update(state, (qa_prompt() | llm | StrOutputParser()).invoke(_inputs(state)))
 
-    snippets = docs_to_snippets(state.retrieved_docs, max_items=4)
+
+def node_analyze_and_answer(state: LegalState, llm) -> dict[str, Any]:
+    """One structured call in place of ``node_analyze_risk`` + ``node_answer``."""
+
+    return _structured_update(state, _structured_chain(llm).invoke(_inputs(state)))
+
+
+async def anode_retrieve(
+    state: LegalState, retriever, max_tokens: int | None = None
+) -> dict[str, Any]:
+    return _retrieved(await retriever.ainvoke(state.question), max_tokens)
+
+
+async def anode_analyze_risk(state: LegalState, llm) -> dict[str, Any]:
+    chain = risk_prompt() | llm | StrOutputParser()
+    return _risk_update(await chain.ainvoke(_inputs(state)))
+
+
+async def anode_answer(state: LegalState, llm) -> dict[str, Any]:
+    chain = qa_prompt() | llm | StrOutputParser()
+    return _answer_update(state, await chain.ainvoke(_inputs(state)))
+
+
+async def anode_analyze_and_answer(state: LegalState, llm) -> dict[str, Any]:
+    return _structured_update(state, await _structured_chain(llm).ainvoke(_inputs(state)))
+
+
+def node_compose(state: LegalState) -> dict[str, Any]:
+    """Join point: the LLM answer plus the risk block and disclaimer."""
 
     # Build clean, modern response without redundant headers
-    answer = ai_response.strip()
+    answer = state.draft_answer
 
     # Add risk insight if relevant (not Low)
     if state.risk_level != "Low":
@@ -108,9 +225,7 @@ def node_answer(state: LegalState, llm) -> dict[str, Any]:
     # Add disclaimer subtly at the end
     answer += "\n\n---\n*This analysis is for educational purposes only and does not constitute legal advice.*"
 
-    follow_up = None  # Let the conversation flow naturally
-
-    return {"answer": answer, "clause_snippets": snippets, "follow_up_question": follow_up}
+    return {"answer": answer}
 
 
 def node_maybe_follow_up(state: LegalState) -> dict[str, Any]:
@@ -123,27 +238,37 @@ def node_maybe_follow_up(state: LegalState) -> dict[str, Any]:
     return {"question": state.follow_up_question, "hops_remaining": state.hops_remaining - 1}
 
 
-def build_graph(retriever, llm):
-    g = StateGraph(LegalState)
-
-    def retrieve_action(state: LegalState) -> dict[str, Any]:
-        return node_retrieve(state, retriever)
+def _check_mode(mode: str) -> None:
+    if mode not in GRAPH_MODES:
+        raise ValueError(f"Unknown graph mode {mode!r}; expected one of {GRAPH_MODES}")
 
-    def analyze_risk_action(state: LegalState) -> dict[str, Any]:
-        return node_analyze_risk(state, llm)
 
-    def answer_action(state: LegalState) -> dict[str, Any]:
-        return node_answer(state, llm)
+def _compile(retrieve, analyze_risk, answer, analyze_and_answer, parallel: bool, mode: str):
+    g = StateGraph(LegalState)
 
-    g.add_node("retrieve", retrieve_action)
-    g.add_node("analyze_risk", analyze_risk_action)
-    g.add_node("answer", answer_action)
+    g.add_node("retrieve", retrieve)
+    g.add_node(COMPOSE_NODE, node_compose)
     g.add_node("maybe_follow_up", node_maybe_follow_up)
+    if mode == "structured":
+        g.add_node(STRUCTURED_NODE, analyze_and_answer)
+    else:
+        g.add_node(RISK_NODE, analyze_risk)
+        g.add_node(ANSWER_NODE, answer)
 
     g.set_entry_point("retrieve")
-    g.add_edge("retrieve", "analyze_risk")
-    g.add_edge("analyze_risk", "answer")
-    g.add_edge("answer", "maybe_follow_up")
+    if mode == "structured":
+        g.add_edge("retrieve", STRUCTURED_NODE)
+        g.add_edge(STRUCTURED_NODE, COMPOSE_NODE)
+    elif parallel:
+        # Fan out after retrieval; compose waits for both branches.
+        g.add_edge("retrieve", RISK_NODE)
+        g.add_edge("retrieve", ANSWER_NODE)
+        g.add_edge([RISK_NODE, ANSWER_NODE], COMPOSE_NODE)
+    else:
+        g.add_edge("retrieve", RISK_NODE)
+        g.add_edge(RISK_NODE, ANSWER_NODE)
+        g.add_edge(ANSWER_NODE, COMPOSE_NODE)
+    g.add_edge(COMPOSE_NODE, "maybe_follow_up")
 
     def route(state: LegalState) -> str:
         if state.run_follow_up and state.follow_up_question and state.hops_remaining > 0:
@@ -153,3 +278,128 @@ def build_graph(retriever, llm):
     g.add_conditional_edges("maybe_follow_up", route)
 
     return g.compile()
+
+
+def build_graph(
+    retriever,
+    llm,
+    parallel: bool = True,
+    context_tokens: int | None = None,
+    mode: GraphMode = "two_call",
+):
+    """``context_tokens`` caps the retrieved context sent to each LLM call (None: no cap).
+
+    ``mode="structured"`` makes one LLM call per question instead of two (``parallel`` is
+    then irrelevant).
+    """
+
+    _check_mode(mode)
+
+    def retrieve_action(state: LegalState) -> dict[str, Any]:
+        return node_retrieve(state, retriever, context_tokens)
+
+    def analyze_risk_action(state: LegalState) -> dict[str, Any]:
+        return node_analyze_risk(state, llm)
+
+    def answer_action(state: LegalState) -> dict[str, Any]:
+        return node_answer(state, llm)
+
+    def analyze_and_answer_action(state: LegalState) -> dict[str, Any]:
+        return node_analyze_and_answer(state, llm)
+
+    return _compile(
+        retrieve_action,
+        analyze_risk_action,
+        answer_action,
+        analyze_and_answer_action,
+        parallel,
+        mode,
+    )
+
+
+def build_async_graph(
+    retriever,
+    llm,
+    parallel: bool = True,
+    context_tokens: int | None = None,
+    mode: GraphMode = "two_call",
+):
+    """Same graph as ``build_graph`` with ``async`` nodes; use ``ainvoke``/``astream``.
+
+    Retrieval and LLM calls are awaited, so a single event loop can serve many
+    questions at once instead of blocking one thread per question. Keep that loop
+    long-lived: the async HTTP client pools connections per loop.
+    """
+
+    _check_mode(mode)
+
+    async def retrieve_action(state: LegalState) -> dict[str, Any]:
+        return await anode_retrieve(state, retriever, context_tokens)
+
+    async def analyze_risk_action(state: LegalState) -> dict[str, Any]:
+        return await anode_analyze_risk(state, llm)
+
+    async def answer_action(state: LegalState) -> dict[str, Any]:
+        return await anode_answer(state, llm)
+
+    async def analyze_and_answer_action(state: LegalState) -> dict[str, Any]:
+        return await anode_analyze_and_answer(state, llm)
+
+    return _compile(
+        retrieve_action,
+        analyze_risk_action,
+        answer_action,
+        analyze_and_answer_action,
+        parallel,
+        mode,
+    )
+
+
+def _stream_event(mode: str, payload: Any) -> tuple[StreamEventKind, Any] | None:
+    if mode == "messages":
+        chunk, meta = payload
+        if meta.get("langgraph_node") == ANSWER_NODE and isinstance(chunk.content, str):
+            if chunk.content:
+                return "token", chunk.content
+    elif mode == "updates":
+        risk = payload.get(RISK_NODE) or payload.get(STRUCTURED_NODE)
+        if risk:
+            return "risk", (risk["risk_level"], risk["risk_explanation"])
+    return None
+
+
+def _final_state(final: Any) -> LegalState:
+    return LegalState.model_validate(final) if isinstance(final, dict) else final
+
+
+def stream_graph(graph, state: LegalState) -> Iterator[tuple[StreamEventKind, Any]]:
+    """Run ``graph`` and yield events as they happen.
+
+    - ``("risk", (risk_level, risk_explanation))`` once the risk verdict is known
+    - ``("token", text)`` for each chunk the LLM produces inside the answer node (the
+      structured mode streams JSON, so it yields no tokens)
+    - ``("final", LegalState)`` last, holding the complete (post-processed) answer
+
+    Chat models invoked inside nodes stream automatically under LangGraph's
+    ``messages`` mode, so the nodes themselves stay plain ``invoke`` calls.
+    """
+
+    final: Any = state
+    for mode, payload in graph.stream(state, stream_mode=STREAM_MODES):
+        if mode == "values":
+            final = payload
+        elif event := _stream_event(mode, payload):
+            yield event
+    yield "final", _final_state(final)
+
+
+async def astream_graph(graph, state: LegalState) -> AsyncIterator[tuple[StreamEventKind, Any]]:
+    """``stream_graph`` for graphs from ``build_async_graph``."""
+
+    final: Any = state
+    async for mode, payload in graph.astream(state, stream_mode=STREAM_MODES):
+        if mode == "values":
+            final = payload
+        elif event := _stream_event(mode, payload):
+            yield event
+    yield "final", _final_state(final)
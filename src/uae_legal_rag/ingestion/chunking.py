@@ -2,43 +2,160 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Literal
+
+import tiktoken
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from uae_legal_rag.lexicon import LexiconMatcher
+
+# Same encoding RecursiveCharacterTextSplitter.from_tiktoken_encoder defaults to.
+TOKEN_ENCODING = "gpt2"
+# Below this many documents a process pool costs more than it saves.
+PARALLEL_MIN_DOCS = 64
+
+ChunkStrategy = Literal["recursive", "clause"]
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding(TOKEN_ENCODING)
+
+
+@functools.lru_cache(maxsize=8192)
+def token_len(text: str) -> int:
+    """Token count of ``text``, memoized.
+
+    The recursive splitter measures the same pieces repeatedly while it tries each
+    separator and slides its overlap window, so most calls are cache hits.
+    """
+
+    return len(_encoding().encode(text, allowed_special=set(), disallowed_special="all"))
+
 
+@functools.lru_cache(maxsize=None)
 def get_legal_splitter(
     chunk_size_tokens: int = 1300, chunk_overlap_tokens: int = 200
 ) -> RecursiveCharacterTextSplitter:
-    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+    # Built once per process and argument set; the splitter holds no per-call state.
+    return RecursiveCharacterTextSplitter(
         chunk_size=chunk_size_tokens,
         chunk_overlap=chunk_overlap_tokens,
+        length_function=token_len,
         separators=["\n\n", "\n", ". ", "; ", ": ", " ", ""],
     )
 
 
+def locate_pieces(text: str, pieces: list[str], base: int = 0) -> list[tuple[int, int] | None]:
+    """``(start, end)`` character span of each piece in ``text``, offset by ``base``.
+
+    Pieces come from a splitter, so they appear in order and may overlap; each one
+    starts after the previous one did.
+    """
+
+    spans: list[tuple[int, int] | None] = []
+    pos = 0
+    for piece in pieces:
+        i = text.find(piece, pos)
+        if i < 0:
+            spans.append(None)
+            continue
+        spans.append((base + i, base + i + len(piece)))
+        pos = i + 1
+    return spans
+
+
+def split_with_offsets(
+    splitter: RecursiveCharacterTextSplitter, docs: list[Document]
+) -> list[Document]:
+    """``splitter.split_documents`` plus ``start_index`` / ``end_index`` in the page text.
+
+    The splitter's own ``add_start_index`` assumes the overlap is measured in
+    characters; ours is in tokens, so spans are located here instead.
+    """
+
+    out: list[Document] = []
+    for d in docs:
+        pieces = splitter.split_text(d.page_content)
+        for piece, span in zip(pieces, locate_pieces(d.page_content, pieces), strict=True):
+            meta = copy.deepcopy(d.metadata)
+            if span:
+                meta["start_index"], meta["end_index"] = span
+            out.append(Document(page_content=piece, metadata=meta))
+    return out
+
+
+# Ordered: when a chunk matches several sections, the first label is its primary type.
+SECTION_RULES: dict[str, list[str]] = {
+    "termination": ["terminate", "termination", "notice period", "without notice"],
+    "liability": ["liability", "limitation", "unlimited", "indemn", "hold harmless"],
+    "confidentiality": ["confidential", "non-disclosure", "nda"],
+    "data_protection": ["pdpl", "personal data", "data protection", "processing"],
+    "governing_law": ["governing law", "jurisdiction", "courts", "arbitration"],
+    "payment": ["fees", "invoice", "payment", "late fee"],
+}
+SECTION_MATCHER = LexiconMatcher(SECTION_RULES)
+
+
 def infer_section_type(text: str) -> str | None:
-    t = text.lower()
-    rules = {
-        "termination": ["terminate", "termination", "notice period", "without notice"],
-        "liability": ["liability", "limitation", "unlimited", "indemn", "hold harmless"],
-        "confidentiality": ["confidential", "non-disclosure", "nda"],
-        "data_protection": ["pdpl", "personal data", "data protection", "processing"],
-        "governing_law": ["governing law", "jurisdiction", "courts", "arbitration"],
-        "payment": ["fees", "invoice", "payment", "late fee"],
-    }
-    for label, pats in rules.items():
-        if any(p in t for p in pats):
-            return label
-    return None
-
-
-def chunk_documents(docs: list[Document]) -> list[Document]:
-    splitter = get_legal_splitter()
-    chunks = splitter.split_documents(docs)
-
-    for d in chunks:
-        section = infer_section_type(d.page_content)
-        if section:
-            d.metadata["section_type"] = section
+    return SECTION_MATCHER.first_label(text)
+
+
+def infer_section_types(text: str) -> list[str]:
+    """Every section label whose keywords occur in ``text``, primary label first."""
+
+    return SECTION_MATCHER.labels(text)
+
+
+def section_flag(label: str) -> str:
+    """Metadata key marking a chunk that mentions ``label`` (filterable, unlike a list)."""
+
+    return f"has_{label}"
+
+
+def tag_sections(chunks: list[Document]) -> None:
+    """Set ``section_type`` (primary), ``section_types`` (all, comma-joined) and a
+    ``has_<label>`` flag per label."""
 
+    labels = SECTION_MATCHER.labels_batch([d.page_content for d in chunks])
+    for d, found in zip(chunks, labels, strict=True):
+        if found:
+            d.metadata["section_type"] = found[0]
+            d.metadata["section_types"] = ",".join(found)
+            d.metadata.update({section_flag(label): True for label in found})
+
+
+def _chunk_serial(docs: list[Document], strategy: ChunkStrategy = "recursive") -> list[Document]:
+    if strategy == "clause":
+        from uae_legal_rag.ingestion.clause_chunker import chunk_by_clause
+
+        return chunk_by_clause(docs)
+
+    chunks = split_with_offsets(get_legal_splitter(), docs)
+    tag_sections(chunks)
     return chunks
+
+
+def chunk_documents(
+    docs: list[Document], workers: int = 1, strategy: ChunkStrategy = "recursive"
+) -> list[Document]:
+    """Split documents into tagged chunks.
+
+    ``strategy="recursive"`` cuts on generic separators; ``"clause"`` follows clause
+    numbering (see ``clause_chunker``). With ``workers > 1`` large inputs are sharded
+    across a process pool; the output is identical to the serial path and keeps
+    document order.
+    """
+
+    if workers <= 1 or len(docs) < PARALLEL_MIN_DOCS:
+        return _chunk_serial(docs, strategy)
+
+    size = -(-len(docs) // workers)
+    shards = [docs[i : i + size] for i in range(0, len(docs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(functools.partial(_chunk_serial, strategy=strategy), shards)
+        return [c for part in parts for c in part]
@@ -0,0 +1,185 @@
+"""Single-pass chunker that follows contract structure.
+
+Each page is scanned once with one compiled pattern that recognises numbered
+clauses (``12``, ``12.3.1``, ``Clause 4``), headings, schedules/annexes and
+recitals. The resulting clause units are packed into chunks that never straddle
+two top-level clauses and stay within the token budget, so a question about one
+clause usually needs one chunk rather than several.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+from uae_legal_rag.ingestion.chunking import (
+    get_legal_splitter,
+    locate_pieces,
+    tag_sections,
+    token_len,
+)
+
+_BOUNDARY = re.compile(
+    r"""
+    ^[ \t]*(?:
+        (?P<schedule>(?i:schedule|annex|appendix|exhibit)[ \t]+[A-Z0-9]{1,4})\b
+      | (?P<recital>(?i:whereas|recitals?|background))\b
+      | (?P<keyword>(?i:clause|section|article)[ \t]+)?
+        (?P<number>\d{1,3}(?:\.\d{1,3}){0,4})(?P<dot>\.)?[ \t]+(?=\S)
+      | (?P<heading>[A-Z][A-Z0-9 &,/()'-]{3,80})[ \t]*$
+    )
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+# "12. TERMINATION" - the rest of a numbered line that is really a heading.
+_HEADING_TAIL = re.compile(r"[A-Z][A-Z0-9 &,/()'-]{2,80}[ \t]*$")
+
+
+@dataclass
+class _Unit:
+    start: int
+    end: int
+    kind: str  # preamble | recital | clause | schedule | heading
+    number: tuple[int, ...] | None = None
+    heading: str | None = None
+    group: str = ""
+
+
+def _plausible_next(prev: tuple[int, ...] | None, cand: tuple[int, ...]) -> bool:
+    """Numbering continues from ``prev``: a first child, a sibling, or an ancestor's sibling."""
+
+    if prev is None:
+        return True
+    if cand == (*prev, 1):
+        return True
+    return any(cand == (*prev[:i], prev[i] + 1) for i in range(len(prev)))
+
+
+def _scan(text: str) -> list[_Unit]:
+    units: list[_Unit] = []
+    prev: tuple[int, ...] | None = None
+    heading: str | None = None
+    group = "preamble"
+
+    def open_unit(start: int, **kw) -> None:
+        if units:
+            units[-1].end = start
+        elif start > 0:
+            units.append(_Unit(0, start, "preamble", group="preamble"))
+        units.append(_Unit(start, len(text), **kw))
+
+    for m in _BOUNDARY.finditer(text):
+        if m.group("schedule"):
+            heading, prev = m.group("schedule").upper(), None
+            group = f"schedule:{heading}"
+            open_unit(m.start(), kind="schedule", heading=heading, group=group)
+        elif m.group("recital"):
+            group = "recitals"
+            open_unit(m.start(), kind="recital", heading=heading, group=group)
+        elif m.group("number"):
+            number = tuple(int(x) for x in m.group("number").split("."))
+            strong = len(number) > 1 or m.group("dot") or m.group("keyword")
+            # Bare "30 days" after a line wrap is not a clause; demand a plausible sequence.
+            if not (_plausible_next(prev, number) and (strong or prev is not None)):
+                continue
+            prev = number
+            line_end = text.find("\n", m.end())
+            tail = text[m.end() : line_end if line_end != -1 else len(text)]
+            if len(number) == 1 and _HEADING_TAIL.fullmatch(tail.strip() or "-"):
+                heading = tail.strip()
+            elif len(number) == 1:
+                heading = None
+            group = f"clause:{number[0]}"
+            open_unit(m.start(), kind="clause", number=number, heading=heading, group=group)
+        elif m.group("heading"):
+            heading = m.group("heading").strip()
+            open_unit(m.start(), kind="heading", heading=heading, group=f"heading:{heading}")
+
+    if not units:
+        units.append(_Unit(0, len(text), "preamble", group="preamble"))
+    return units
+
+
+def _fmt(number: tuple[int, ...] | None) -> str | None:
+    return ".".join(map(str, number)) if number else None
+
+
+def _common_parent(numbers: list[tuple[int, ...]]) -> str | None:
+    if not numbers:
+        return None
+    first = numbers[0]
+    depth = min(len(n) for n in numbers)
+    common: tuple[int, ...] = ()
+    for i in range(depth):
+        if all(n[i] == first[i] for n in numbers):
+            common = (*common, first[i])
+        else:
+            break
+    # A chunk holding exactly one clause is described by its parent.
+    if len(numbers) == 1 or common == first:
+        common = first[:-1] if len(first) > 1 else ()
+    return _fmt(common)
+
+
+def _emit(
+    text: str, group: list[_Unit], base: dict, max_tokens: int, overlap: int
+) -> list[Document]:
+    raw = text[group[0].start : group[-1].end]
+    body = raw.strip()
+    if not body:
+        return []
+    start = group[0].start + len(raw) - len(raw.lstrip())
+
+    numbers = [u.number for u in group if u.number]
+    meta = dict(base)
+    meta["clause_kind"] = group[0].kind if group[0].kind != "heading" else group[-1].kind
+    if numbers:
+        meta["clause_number"] = _fmt(numbers[0])
+        meta["clause_numbers"] = ",".join(_fmt(n) or "" for n in numbers)
+        parent = _common_parent(numbers)
+        if parent:
+            meta["parent_clause"] = parent
+    heading = next((u.heading for u in group if u.heading), None)
+    if heading:
+        meta["clause_heading"] = heading
+
+    if token_len(body) <= max_tokens:
+        meta["start_index"], meta["end_index"] = start, start + len(body)
+        return [Document(page_content=body, metadata=meta)]
+    # A single clause longer than the budget: fall back to the recursive splitter.
+    pieces = get_legal_splitter(max_tokens, overlap).split_text(body)
+    out = []
+    for piece, span in zip(pieces, locate_pieces(body, pieces, base=start), strict=True):
+        piece_meta = dict(meta)
+        if span:
+            piece_meta["start_index"], piece_meta["end_index"] = span
+        out.append(Document(page_content=piece, metadata=piece_meta))
+    return out
+
+
+def chunk_by_clause(
+    docs: list[Document], max_tokens: int = 1300, overlap_tokens: int = 200
+) -> list[Document]:
+    """Split page Documents into clause-aligned chunks carrying clause metadata."""
+
+    out: list[Document] = []
+    for doc in docs:
+        text = doc.page_content
+        units = _scan(text)
+        group: list[_Unit] = []
+        budget = 0
+        for u in units:
+            cost = token_len(text[u.start : u.end]) + 1
+            # Stay inside one top-level clause; a bare heading joins whatever follows it.
+            joins = bool(group) and (u.group == group[-1].group or group[-1].kind == "heading")
+            if group and (not joins or budget + cost > max_tokens):
+                out.extend(_emit(text, group, doc.metadata, max_tokens, overlap_tokens))
+                group, budget = [], 0
+            group.append(u)
+            budget += cost
+        if group:
+            out.extend(_emit(text, group, doc.metadata, max_tokens, overlap_tokens))
+    tag_sections(out)
+    return out
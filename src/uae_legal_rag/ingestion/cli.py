@@ -0,0 +1,325 @@
+"""``lexiq-ingest``: index a directory of PDFs into the persistent Chroma collection.
+
+PDF parsing and chunking run in a process pool; the main process embeds new chunks
+and writes them to the store. A JSON manifest next to the collection records each
+file's SHA-256 and status after it is indexed, so an interrupted run picks up where
+it stopped and unchanged files are skipped on later runs.
+
+Usage: lexiq-ingest DIR [--workers N] [--strategy clause] [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.cache.embeddings import CachedEmbeddings
+from uae_legal_rag.cache.pages import PageTextCache, get_page_cache
+from uae_legal_rag.config import get_settings
+from uae_legal_rag.embedding_scheduler import ConcurrentEmbeddings
+from uae_legal_rag.ingestion.chunking import ChunkStrategy, chunk_documents
+from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+from uae_legal_rag.vectorstore.backends import flush_vectorstore, get_vectorstore
+from uae_legal_rag.vectorstore.chroma_client import add_embedded_documents
+from uae_legal_rag.vectorstore.indexing import DocumentSync
+from uae_legal_rag.vectorstore.persistence import StoreWriter
+
+MANIFEST_NAME = "ingest_manifest.json"
+MANIFEST_VERSION = 1
+# Files parsed ahead of the indexer per worker; bounds memory held in finished chunks.
+INFLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class BulkIngestStats:
+    files_found: int = 0
+    files_skipped: int = 0
+    files_indexed: int = 0
+    files_failed: int = 0
+    pages: int = 0
+    chunks: int = 0
+    chunks_added: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+    embedding_calls: int = 0
+    texts_embedded: int = 0
+    elapsed_s: float = 0.0
+
+    def rate(self, count: int) -> float:
+        return count / self.elapsed_s if self.elapsed_s else 0.0
+
+    def summary(self) -> str:
+        return "\n".join(
+            [
+                f"files:      {self.files_indexed} indexed, {self.files_skipped} unchanged, "
+                f"{self.files_failed} failed ({self.files_found} found)",
+                f"chunks:     {self.chunks_added} new, {self.chunks_unchanged} unchanged, "
+                f"{self.chunks_deleted} removed",
+                f"embedding:  {self.embedding_calls} calls, {self.texts_embedded} texts",
+                f"elapsed:    {self.elapsed_s:.1f}s",
+                f"throughput: {self.rate(self.files_indexed):.2f} files/s, "
+                f"{self.rate(self.pages):.1f} pages/s, {self.rate(self.chunks):.1f} chunks/s",
+            ]
+        )
+
+
+class Manifest:
+    """Per-file hash and status, rewritten atomically after every file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: dict[str, dict] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.files = data.get("files", {})
+
+    def is_done(self, name: str, sha256: str) -> bool:
+        entry = self.files.get(name)
+        return bool(entry) and entry["status"] == "done" and entry["sha256"] == sha256
+
+    def record(self, name: str, sha256: str, status: str, **info) -> None:
+        self.files[name] = {"sha256": sha256, "status": status, "updated_at": time.time(), **info}
+        self.save()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        payload = {"version": MANIFEST_VERSION, "files": self.files}
+        tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def iter_pdfs(root: Path) -> Iterator[Path]:
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() == ".pdf":
+            yield path
+
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _load_and_chunk(
+    path: str,
+    filename: str,
+    strategy: ChunkStrategy,
+    page_cache: PageTextCache | None,
+    pdf_backend: str,
+) -> tuple[int, list[Document]]:
+    # Runs in a worker process; each file is parsed serially there, the pool
+    # provides the parallelism across files.
+    data = Path(path).read_bytes()
+    pages = load_pdf_bytes(
+        data, filename, max_workers=1, page_cache=page_cache, backend=pdf_backend
+    )
+    return len(pages), chunk_documents(pages, strategy=strategy)
+
+
+def _scheduler(emb: Embeddings) -> ConcurrentEmbeddings | None:
+    """The ``ConcurrentEmbeddings`` layer of ``emb``, if any."""
+
+    layer: Embeddings | None = emb
+    while layer is not None and not isinstance(layer, ConcurrentEmbeddings):
+        layer = getattr(layer, "underlying", None)
+    return layer
+
+
+def _index_file(
+    vs: VectorStore,
+    emb: Embeddings,
+    filename: str,
+    chunks: list[Document],
+    batch_size: int,
+    stats: BulkIngestStats,
+) -> None:
+    sync = DocumentSync(vs, filename)
+    new_docs, new_ids = sync.plan(chunks)
+    if new_docs:
+        # One call per file lets a concurrent embedder overlap its requests.
+        vectors = emb.embed_documents([d.page_content for d in new_docs])
+        stats.embedding_calls += 1
+        stats.texts_embedded += len(new_docs)
+    for i in range(0, len(new_docs), batch_size):
+        window = slice(i, i + batch_size)
+        add_embedded_documents(vs, new_docs[window], vectors[window], new_ids[window])
+    result = sync.finish()
+    stats.chunks_added += result.added
+    stats.chunks_unchanged += result.unchanged
+    stats.chunks_deleted += result.deleted
+
+
+def ingest_directory(
+    root: Path,
+    vs: VectorStore,
+    manifest: Manifest,
+    *,
+    embeddings: Embeddings | None = None,
+    workers: int = 1,
+    strategy: ChunkStrategy = "recursive",
+    batch_size: int = 64,
+    force: bool = False,
+    page_cache: PageTextCache | None = None,
+    pdf_backend: str = "auto",
+    log=print,
+) -> BulkIngestStats:
+    """Index every PDF under ``root`` that is not already recorded as done.
+
+    Files are named by their path relative to ``root``. Indexing is idempotent
+    (chunk IDs are content-derived), so a file interrupted mid-way is simply
+    re-synced on the next run.
+    """
+
+    emb = embeddings or vs.embeddings
+    if emb is None:
+        raise ValueError("Vector store has no embedding function; pass embeddings=.")
+
+    stats = BulkIngestStats()
+    started = time.perf_counter()
+    # The scheduler splits each file into many API requests (and the cache skips
+    # some); without one, each embed_documents call is counted instead.
+    scheduler = _scheduler(emb)
+    requests_before = scheduler.stats.requests if scheduler else 0
+    texts_before = scheduler.stats.texts if scheduler else 0
+    todo: list[tuple[Path, str, str]] = []
+    for path in iter_pdfs(root):
+        stats.files_found += 1
+        name = path.relative_to(root).as_posix()
+        sha = file_sha256(path)
+        if not force and manifest.is_done(name, sha):
+            stats.files_skipped += 1
+            continue
+        todo.append((path, name, sha))
+
+    def handle(name: str, sha: str, load) -> None:
+        try:
+            n_pages, chunks = load()
+            _index_file(vs, emb, name, chunks, batch_size, stats)
+        except Exception as e:
+            stats.files_failed += 1
+            manifest.record(name, sha, "failed", error=f"{type(e).__name__}: {e}")
+            log(f"[failed] {name}: {e}")
+            return
+        stats.files_indexed += 1
+        stats.pages += n_pages
+        stats.chunks += len(chunks)
+        manifest.record(name, sha, "done", pages=n_pages, chunks=len(chunks))
+        log(f"[ok] {name} ({n_pages} pages, {len(chunks)} chunks)")
+
+    load = functools.partial(
+        _load_and_chunk, strategy=strategy, page_cache=page_cache, pdf_backend=pdf_backend
+    )
+    try:
+        if workers <= 1:
+            for path, name, sha in todo:
+                handle(name, sha, functools.partial(load, str(path), name))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending: dict[Future, tuple[str, str]] = {}
+                queue = iter(todo)
+                try:
+                    while True:
+                        for path, name, sha in queue:
+                            fut = pool.submit(load, str(path), name)
+                            pending[fut] = (name, sha)
+                            if len(pending) >= workers * INFLIGHT_PER_WORKER:
+                                break
+                        if not pending:
+                            break
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            handle(*pending.pop(fut), fut.result)
+                except BaseException:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+    finally:
+        stats.elapsed_s = time.perf_counter() - started
+        if scheduler is not None:
+            stats.embedding_calls = scheduler.stats.requests - requests_before
+            stats.texts_embedded = scheduler.stats.texts - texts_before
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        prog="lexiq-ingest", description="Index a directory of PDFs into LexiQ's Chroma store."
+    )
+    ap.add_argument("directory", type=Path)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--strategy", choices=["recursive", "clause"], default=None)
+    ap.add_argument("--pdf-backend", choices=["auto", "pypdf", "pymupdf"], default=None)
+    ap.add_argument("--batch-size", type=int, default=None)
+    ap.add_argument("--manifest", type=Path, default=None)
+    ap.add_argument("--force", action="store_true", help="re-index files marked done")
+    ap.add_argument("--quiet", action="store_true")
+    args = ap.parse_args(argv)
+
+    if not args.directory.is_dir():
+        ap.error(f"not a directory: {args.directory}")
+
+    from uae_legal_rag.llm import get_embeddings
+
+    settings = get_settings()
+    emb = get_embeddings(settings)
+    manifest = Manifest(args.manifest or Path(settings.chroma_persist_dir) / MANIFEST_NAME)
+    # Waits for (and then blocks) a persistent Streamlit app writing the same store.
+    writer = StoreWriter(settings.chroma_persist_dir, label="lexiq-ingest")
+
+    try:
+        with writer:
+            # Opened under the lock so a NumPy store starts from the latest save.
+            vs = get_vectorstore(
+                emb,
+                settings.chroma_persist_dir,
+                settings.chroma_collection_docs,
+                backend=settings.vector_backend,
+            )
+            try:
+                stats = ingest_directory(
+                    args.directory.resolve(),
+                    vs,
+                    manifest,
+                    embeddings=emb,
+                    workers=args.workers,
+                    strategy=args.strategy or settings.chunking_strategy,  # type: ignore[arg-type]
+                    batch_size=args.batch_size or settings.ingest_batch_size,
+                    force=args.force,
+                    page_cache=get_page_cache(settings),
+                    pdf_backend=args.pdf_backend or settings.pdf_backend,
+                    log=(lambda _msg: None) if args.quiet else print,
+                )
+            finally:
+                # The manifest already records finished files; keep the index in step.
+                flush_vectorstore(vs)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; progress saved to {manifest.path}. Re-run to resume.")
+        return 130
+
+    print(stats.summary())
+    layer: Embeddings | None = emb
+    while layer is not None:
+        if isinstance(layer, CachedEmbeddings):
+            print(f"embedding cache: {layer.stats.hits} hits, {layer.stats.misses} misses")
+        elif isinstance(layer, ConcurrentEmbeddings):
+            s = layer.stats
+            print(f"embedding API: {s.requests} requests, {s.rate_limited} rate-limited")
+        layer = getattr(layer, "underlying", None)
+    return 1 if stats.files_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
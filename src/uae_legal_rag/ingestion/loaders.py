@@ -2,33 +2,209 @@
 
 from __future__ import annotations
 
-import io
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO
 
 from langchain_core.documents import Document
-from pypdf import PdfReader
 
+from uae_legal_rag.cache.pages import PageTextCache, document_key
+from uae_legal_rag.ingestion.pdf_backends import PdfPages, get_backend, select_backend
 
-def load_pdf_bytes(pdf_bytes: bytes, filename: str) -> list[Document]:
-    """Return per-page Documents with filename/page metadata."""
+# Below this many pages the process pool costs more than it saves.
+PARALLEL_MIN_PAGES = 48
+# Ranges handed out per worker; more than one evens out pages of uneven weight.
+RANGES_PER_WORKER = 4
 
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    docs: list[Document] = []
+_worker_pages: PdfPages | None = None
 
-    for idx, page in enumerate(reader.pages):
+
+def _init_worker(pdf_bytes: bytes, backend: str) -> None:
+    # Parse once per worker process instead of once per page range.
+    global _worker_pages
+    _worker_pages = get_backend(backend).open(pdf_bytes)
+
+
+def _extract_page_range(start: int, stop: int) -> list[tuple[int, str]]:
+    assert _worker_pages is not None
+    return [(idx, _worker_pages.text(idx)) for idx in range(start, stop)]
+
+
+def _page_ranges(num_pages: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``range(num_pages)`` into contiguous ``(start, stop)`` slices."""
+
+    n_ranges = max(1, min(num_pages, workers * RANGES_PER_WORKER))
+    size, extra = divmod(num_pages, n_ranges)
+    out: list[tuple[int, int]] = []
+    start = 0
+    for i in range(n_ranges):
+        stop = start + size + (1 if i < extra else 0)
+        out.append((start, stop))
+        start = stop
+    return out
+
+
+def _resolve_workers(max_workers: int | None, num_pages: int) -> int:
+    if num_pages < PARALLEL_MIN_PAGES:
+        return 1
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    return max(1, min(workers, num_pages))
+
+
+def _extract_parallel(
+    pdf_bytes: bytes, num_pages: int, workers: int, backend: str
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page index, text)`` in page order, extracted across a process pool.
+
+    At most ``2 * workers`` ranges are in flight, so a slow consumer holds back the
+    workers instead of letting extracted text pile up.
+    """
+
+    ranges = _page_ranges(num_pages, workers)
+    window = 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(pdf_bytes, backend)
+    ) as pool:
+        pending = deque(pool.submit(_extract_page_range, *r) for r in ranges[:window])
+        try:
+            for r in ranges[window:]:
+                # Futures are collected in submission order, which is page order.
+                texts = pending.popleft().result()
+                pending.append(pool.submit(_extract_page_range, *r))
+                yield from texts
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for fut in pending:  # consumer stopped early
+                fut.cancel()
+
+
+def _page_texts(
+    pages: PdfPages, source: bytes | BinaryIO, start: int, workers: int, backend: str
+) -> Iterator[tuple[int, str]]:
+    """``(page index, text)`` in page order, from the pool when ``workers > 1``.
+
+    Workers each parse their own copy of the PDF, so a stream is read into memory
+    once for them. If the pool cannot run, the rest is extracted serially.
+    """
+
+    done = 0
+    if workers > 1:
+        if isinstance(source, bytes):
+            pdf_bytes = source
+        else:
+            source.seek(start)
+            pdf_bytes = source.read()
+        try:
+            for idx, text in _extract_parallel(pdf_bytes, len(pages), workers, backend):
+                yield idx, text
+                done = idx + 1
+        except (BrokenProcessPool, OSError):
+            # Sandboxed hosts may refuse to spawn workers - stay correct, just slower.
+            pass
+    for idx in range(done, len(pages)):
+        yield idx, pages.text(idx)
+
+
+def _page_documents(texts: Iterable[tuple[int, str]], filename: str) -> Iterator[Document]:
+    for idx, text in texts:
+        if text:
+            yield Document(page_content=text, metadata={"filename": filename, "page": idx + 1})
+
+
+def iter_pdf_pages(pages: PdfPages, filename: str) -> Iterator[Document]:
+    """Yield per-page Documents lazily from an opened PDF.
+
+    Pages are parsed one at a time, so memory stays flat regardless of page count.
+    """
+
+    yield from _page_documents(((idx, pages.text(idx)) for idx in range(len(pages))), filename)
+
+
+def open_pdf_pages(
+    source: bytes | BinaryIO,
+    filename: str,
+    page_cache: PageTextCache | None = None,
+    backend: str = "auto",
+    max_workers: int | None = None,
+) -> tuple[int, Iterator[Document]]:
+    """Return ``(page_count, lazy page Documents)`` for one PDF.
+
+    ``backend`` is a backend name or ``"auto"`` (see ``pdf_backends.select_backend``).
+    A stream is hashed in chunks and handed to the backend as is. With a
+    ``page_cache``, a previously seen PDF is served without parsing; a new one is
+    written to the cache page by page as it is extracted and becomes visible once the
+    iterator is exhausted.
+
+    PDFs of ``PARALLEL_MIN_PAGES`` or more are extracted across a process pool
+    (``max_workers`` defaults to the CPU count), still yielded in page order; the
+    pool needs the file's bytes, so such a stream is read into memory once.
+    """
+
+    start = 0
+    if isinstance(source, bytes):
+        size = len(source)
+    else:
+        start = source.tell()
+        size = source.seek(0, os.SEEK_END) - start
+        source.seek(start)
+    engine = select_backend(size, backend)
+    key = document_key(source, engine.extractor_id)
+    cached = page_cache.get(key) if page_cache is not None else None
+    if cached is not None:
+        return len(cached), _page_documents(enumerate(cached), filename)
+
+    pages = engine.open(source)
+    workers = _resolve_workers(max_workers, len(pages))
+
+    def extract() -> Iterator[tuple[int, str]]:
+        writer = page_cache.writer(key) if page_cache is not None else None
         try:
-            text = (page.extract_text() or "").strip()
-        except Exception:
-            # Some PDFs have malformed fonts - skip problematic pages
-            text = ""
-
-        if not text:
-            continue
-
-        docs.append(
-            Document(
-                page_content=text,
-                metadata={"filename": filename, "page": idx + 1},
-            )
-        )
-
-    return docs
+            for idx, text in _page_texts(pages, source, start, workers, engine.name):
+                if writer is not None:
+                    writer.add(text)
+                yield idx, text
+            if writer is not None:
+                writer.commit()
+        finally:
+            pages.close()
+            if writer is not None:
+                writer.discard()  # no-op after commit; drops an abandoned extraction
+
+    return len(pages), _page_documents(extract(), filename)
+
+
+def load_pdf_bytes(
+    pdf_bytes: bytes,
+    filename: str,
+    max_workers: int | None = None,
+    page_cache: PageTextCache | None = None,
+    backend: str = "auto",
+) -> list[Document]:
+    """Return per-page Documents with filename/page metadata.
+
+    Large PDFs are extracted across a process pool (``max_workers`` defaults to the
+    CPU count); small ones, or ``max_workers=1``, use the serial loop. A PDF already
+    in ``page_cache`` is not parsed at all. ``backend`` is a backend name or
+    ``"auto"``.
+    """
+
+    engine = select_backend(len(pdf_bytes), backend)
+    key = document_key(pdf_bytes, engine.extractor_id)
+    cached = page_cache.get(key) if page_cache is not None else None
+    if cached is not None:
+        return list(_page_documents(enumerate(cached), filename))
+
+    pages = engine.open(pdf_bytes)
+    try:
+        workers = _resolve_workers(max_workers, len(pages))
+        texts = list(_page_texts(pages, pdf_bytes, 0, workers, engine.name))
+    finally:
+        pages.close()
+
+    if page_cache is not None:
+        page_cache.put(key, [text for _, text in texts])
+    return list(_page_documents(texts, filename))
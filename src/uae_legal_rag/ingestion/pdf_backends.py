@@ -0,0 +1,151 @@
+"""PDF text-extraction backends.
+
+Every backend returns the stripped text of each page (``""`` when a page has no
+extractable text or fails to parse), so the loaders build the same ``Document``
+shape whichever one ran. PyMuPDF is optional (``pip install "lefiq[pymupdf]"``);
+pypdf is always available.
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO
+
+import pypdf
+from pypdf import PdfReader
+
+# Below this size "auto" keeps pypdf: the saving is a few milliseconds, and files
+# indexed before PyMuPDF was installed keep byte-identical text (and chunk IDs).
+PYMUPDF_MIN_BYTES = 512 * 1024
+
+BACKEND_NAMES = ("pypdf", "pymupdf")
+
+
+class PdfPages(ABC):
+    """An opened PDF: page count plus per-page text extraction."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def text(self, idx: int) -> str: ...
+
+    def close(self) -> None:
+        pass
+
+
+class PdfBackend(ABC):
+    name: str
+
+    @property
+    @abstractmethod
+    def version(self) -> str: ...
+
+    @property
+    def extractor_id(self) -> str:
+        """Identifies the text this backend produces (part of page-cache keys)."""
+
+        return f"{self.name}-{self.version}"
+
+    @abstractmethod
+    def open(self, source: bytes | BinaryIO) -> PdfPages: ...
+
+
+class _PypdfPages(PdfPages):
+    def __init__(self, reader: PdfReader):
+        self._pages = reader.pages
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def text(self, idx: int) -> str:
+        try:
+            return (self._pages[idx].extract_text() or "").strip()
+        except Exception:
+            # Some PDFs have malformed fonts - skip problematic pages
+            return ""
+
+
+class PypdfBackend(PdfBackend):
+    name = "pypdf"
+
+    @property
+    def version(self) -> str:
+        return pypdf.__version__
+
+    def open(self, source: bytes | BinaryIO) -> PdfPages:
+        return _PypdfPages(PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source))
+
+
+class _PyMuPDFPages(PdfPages):
+    def __init__(self, doc: Any):
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return self._doc.page_count
+
+    def text(self, idx: int) -> str:
+        try:
+            return (self._doc.load_page(idx).get_text() or "").strip()
+        except Exception:
+            return ""
+
+    def close(self) -> None:
+        self._doc.close()
+
+
+class PyMuPDFBackend(PdfBackend):
+    name = "pymupdf"
+
+    @property
+    def version(self) -> str:
+        return _pymupdf().__version__
+
+    def open(self, source: bytes | BinaryIO) -> PdfPages:
+        data = source if isinstance(source, bytes) else source.read()
+        return _PyMuPDFPages(_pymupdf().open(stream=data, filetype="pdf"))
+
+
+@functools.lru_cache(maxsize=1)
+def _pymupdf() -> Any:
+    import pymupdf
+
+    return pymupdf
+
+
+def pymupdf_available() -> bool:
+    try:
+        _pymupdf()
+    except ImportError:
+        return False
+    return True
+
+
+def get_backend(name: str) -> PdfBackend:
+    if name == "pypdf":
+        return PypdfBackend()
+    if name == "pymupdf":
+        if not pymupdf_available():
+            raise ValueError('PDF backend "pymupdf" needs PyMuPDF: pip install "lefiq[pymupdf]"')
+        return PyMuPDFBackend()
+    raise ValueError(f"Unknown PDF backend {name!r}; expected one of {BACKEND_NAMES} or 'auto'.")
+
+
+def available_backends() -> list[PdfBackend]:
+    return [get_backend(n) for n in BACKEND_NAMES if n != "pymupdf" or pymupdf_available()]
+
+
+def select_backend(size_bytes: int, preference: str = "auto") -> PdfBackend:
+    """Pick the backend for a file of ``size_bytes``.
+
+    An explicit ``preference`` wins; ``"auto"`` uses PyMuPDF (several times faster)
+    for files of at least ``PYMUPDF_MIN_BYTES`` when it is installed, else pypdf.
+    """
+
+    if preference != "auto":
+        return get_backend(preference)
+    if size_bytes >= PYMUPDF_MIN_BYTES and pymupdf_available():
+        return PyMuPDFBackend()
+    return PypdfBackend()
@@ -0,0 +1,199 @@
+"""Streaming ingestion: load page -> chunk -> embed batch -> add batch.
+
+Each stage is a generator running in its own thread, connected to the next by a
+bounded queue. Only a few pages and batches are in flight at any time, so memory
+stays flat for large uploads, and every batch is searchable as soon as it is added.
+
+Chunks get deterministic IDs, so re-uploading a revised file only embeds the
+chunks whose text changed; chunks that disappeared are deleted at the end.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO, TypeVar
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.cache.pages import PageTextCache
+from uae_legal_rag.ingestion.chunking import ChunkStrategy, chunk_documents
+from uae_legal_rag.ingestion.loaders import open_pdf_pages
+from uae_legal_rag.vectorstore.chroma_client import add_embedded_documents
+from uae_legal_rag.vectorstore.indexing import DocumentSync
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_QUEUE_SIZE = 4
+
+
+@dataclass
+class IngestProgress:
+    """Running counters, reported after every indexed batch."""
+
+    files_total: int
+    files_done: int = 0
+    pages_loaded: int = 0
+    chunks_created: int = 0
+    chunks_embedded: int = 0
+    chunks_indexed: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+    batches_indexed: int = 0
+    current_file: str = ""
+    # Fraction of the upload whose chunks are already searchable (0..1).
+    fraction: float = 0.0
+
+
+ProgressCallback = Callable[[IngestProgress], None]
+
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+_DONE = object()
+
+
+def _buffered(items: Iterable[T], maxsize: int, stop: threading.Event) -> Iterator[T]:
+    """Run ``items`` in a worker thread, handing results over through a bounded queue."""
+
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as exc:  # re-raised in the consumer thread
+            put(_Failure(exc))
+            return
+        put(_DONE)
+
+    threading.Thread(target=run, daemon=True).start()
+    while True:
+        try:
+            item = q.get(timeout=0.1)
+        except queue.Empty:
+            if stop.is_set():
+                return
+            continue
+        if item is _DONE:
+            return
+        if isinstance(item, _Failure):
+            raise item.exc
+        yield item
+
+
+def ingest_stream(
+    sources: list[tuple[str, BinaryIO]],
+    vs: VectorStore,
+    *,
+    embeddings: Embeddings | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    chunk_strategy: ChunkStrategy = "recursive",
+    page_cache: PageTextCache | None = None,
+    pdf_backend: str = "auto",
+    max_workers: int | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> IngestProgress:
+    """Index ``(filename, stream)`` PDFs into ``vs`` batch by batch.
+
+    Files already in ``page_cache`` stream their cached page text straight into
+    chunking; large new ones are extracted across ``max_workers`` processes (see
+    ``open_pdf_pages``). ``on_progress`` is always called from the calling thread, so it may
+    update Streamlit widgets. Filenames identify documents in the store, so they
+    must be unique within one call.
+    """
+
+    emb = embeddings or vs.embeddings
+    if emb is None:
+        raise ValueError("Vector store has no embedding function; pass embeddings=.")
+    duplicates = sorted(name for name, n in Counter(n for n, _ in sources).items() if n > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate filenames in one upload: {', '.join(duplicates)}")
+
+    progress = IngestProgress(files_total=len(sources))
+    # Both indexed by position in the upload: page count (for the progress
+    # fraction) and the sync tracking that file's chunks.
+    page_counts: dict[int, int] = {}
+    syncs: dict[int, DocumentSync] = {}
+    stop = threading.Event()
+
+    def load() -> Iterator[tuple[int, Document]]:
+        for idx, (name, stream) in enumerate(sources):
+            progress.current_file = name
+            n_pages, pages = open_pdf_pages(stream, name, page_cache, pdf_backend, max_workers)
+            page_counts[idx] = n_pages
+            syncs[idx] = DocumentSync(vs, name)
+            for page in pages:
+                progress.pages_loaded += 1
+                yield idx, page
+
+    def chunk(
+        pages: Iterable[tuple[int, Document]],
+    ) -> Iterator[tuple[list[Document], list[str], int]]:
+        batch: list[Document] = []
+        ids: list[str] = []
+        for idx, page in pages:
+            chunks = chunk_documents([page], strategy=chunk_strategy)
+            progress.chunks_created += len(chunks)
+            new_docs, new_ids = syncs[idx].plan(chunks)
+            progress.chunks_unchanged += len(chunks) - len(new_docs)
+            for d, cid in zip(new_docs, new_ids, strict=True):
+                batch.append(d)
+                ids.append(cid)
+                if len(batch) >= batch_size:
+                    yield batch, ids, idx
+                    batch, ids = [], []
+        if batch:
+            yield batch, ids, idx
+
+    def embed(batches: Iterable[tuple[list[Document], list[str], int]]):
+        for batch, ids, idx in batches:
+            vectors = emb.embed_documents([d.page_content for d in batch])
+            progress.chunks_embedded += len(batch)
+            yield batch, ids, idx, vectors
+
+    try:
+        pages = _buffered(load(), queue_size, stop)
+        batches = _buffered(chunk(pages), queue_size, stop)
+        for batch, ids, pos, vectors in _buffered(embed(batches), queue_size, stop):
+            add_embedded_documents(vs, batch, vectors, ids)
+            progress.chunks_indexed += len(batch)
+            progress.batches_indexed += 1
+            # ``pos`` is the upload position of the batch's last chunk.
+            n_pages = page_counts.get(pos, 0)
+            progress.files_done = pos
+            within = batch[-1].metadata["page"] / n_pages if n_pages else 0.0
+            progress.fraction = min(1.0, (pos + within) / max(1, progress.files_total))
+            if on_progress:
+                on_progress(progress)
+    finally:
+        stop.set()
+
+    for sync in syncs.values():
+        progress.chunks_deleted += sync.finish().deleted
+
+    progress.files_done = progress.files_total
+    progress.fraction = 1.0
+    if on_progress:
+        on_progress(progress)
+    return progress
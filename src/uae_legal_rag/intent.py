@@ -0,0 +1,290 @@
+"""Local chat intent classification (greeting / about / general / document).
+
+Routing a chat message used to cost a full LLM round trip. ``classify_intent``
+answers locally in microseconds:
+
+1. Rules: whole-message greetings, questions about the assistant itself and legal
+   document cues (contract vocabulary plus the chunker's section keywords).
+2. A small multinomial naive Bayes model over word unigrams and bigrams, trained on
+   ``SEED_EXAMPLES`` at first use, for everything the rules do not settle.
+
+Each result carries a confidence; ``resolve_intent`` asks the LLM only when it is
+below ``min_confidence``.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Literal
+
+from uae_legal_rag.ingestion.chunking import SECTION_RULES
+from uae_legal_rag.lexicon import LexiconMatcher
+
+Intent = Literal["greeting", "about", "general", "document"]
+IntentSource = Literal["rules", "model", "llm"]
+INTENTS: tuple[Intent, ...] = ("greeting", "about", "general", "document")
+
+DEFAULT_MIN_CONFIDENCE = 0.6
+RULE_CONFIDENCE = 0.97
+# Document cues are strong but not absolute ("what is a contract?" is general-ish).
+CUE_CONFIDENCE = 0.9
+
+
+@dataclass(frozen=True)
+class IntentResult:
+    intent: Intent
+    confidence: float
+    source: IntentSource
+
+
+_GREETING = re.compile(
+    r"^(?:(?:hi|hello|hey|hiya|yo|greetings|salam|salaam|marhaba|assalamu alaikum"
+    r"|good (?:morning|afternoon|evening|day)|thanks|thank you|ok|okay|bye|goodbye)"
+    r"(?: there| all| everyone| lexiq| again| so much| a lot)?\s*)+"
+    r"(?:how are you(?: doing)?(?: today)?)?$"
+)
+_ABOUT = re.compile(
+    r"\b(?:who|what) (?:are|r) (?:you|u)\b|\bwhat can you do\b|\bwhat do you do\b"
+    r"|\b(?:who|which company) (?:made|built|created|developed|trained) you\b"
+    r"|\byour (?:name|capabilities|features|limitations)\b"
+    r"|\bare you (?:an? )?(?:ai|bot|human|lawyer)\b"
+    r"|\bhow do you work\b|\btell me about yourself\b|\bwhat is lexiq\b|\bwhat model\b"
+)
+# Matched as substrings of " <normalized text> "; a leading/trailing space anchors
+# phrases that would otherwise fire inside other words ("lease" in "please").
+DOCUMENT_CUES: dict[str, list[str]] = {
+    "document": [
+        "contract",
+        "agreement",
+        "clause",
+        "document",
+        " pdf",
+        "uploaded",
+        "the file",
+        "this file",
+        "section",
+        "article",
+        "schedule",
+        "annex",
+        "appendix",
+        " party",
+        " parties",
+        "obligation",
+        "warrant",
+        "breach",
+        "renewal",
+        "effective date",
+        "term of",
+        " lease",
+        " tenant",
+        "landlord",
+        "employee",
+        "employer",
+        "supplier",
+        "vendor",
+        " signed",
+        "sign this",
+        "risks",
+        "risky",
+        "red flag",
+        "key dates",
+        "deadline",
+        "penalt",
+        "damages",
+        "force majeure",
+        "intellectual property",
+        "non-compete",
+        "dispute",
+    ],
+    **SECTION_RULES,
+}
+
+
+def _cue(term: str) -> str:
+    # Same shape as normalized text; short bare words ("nda", "fees") need both anchors.
+    term = term.replace("-", " ")
+    return f" {term} " if len(term) <= 4 else term
+
+
+DOCUMENT_MATCHER = LexiconMatcher(
+    {label: [_cue(t) for t in terms] for label, terms in DOCUMENT_CUES.items()}
+)
+
+# Training phrases for the lexical model; kept separate from the labeled evaluation
+# set in ``tests/intent_samples.py``.
+SEED_EXAMPLES: dict[Intent, list[str]] = {
+    "greeting": [
+        "hi",
+        "hello there",
+        "hey",
+        "good morning",
+        "good evening lexiq",
+        "hi how are you",
+        "hello again",
+        "thanks",
+        "thank you so much",
+        "bye",
+        "hey hey",
+        "morning",
+        "yo what's up",
+        "nice to meet you",
+    ],
+    "about": [
+        "who are you",
+        "what can you do",
+        "who made you",
+        "what are your capabilities",
+        "are you a lawyer",
+        "are you an ai",
+        "how do you work",
+        "what model are you using",
+        "tell me about yourself",
+        "what is your name",
+        "can you give legal advice",
+        "what kind of questions can i ask you",
+        "do you store my files",
+        "what languages do you speak",
+    ],
+    "general": [
+        "what is the weather today",
+        "what is 2 plus 2",
+        "write a python function to sort a list",
+        "tell me a joke",
+        "what is the capital of france",
+        "recommend a good book",
+        "how do i cook rice",
+        "translate hello into arabic",
+        "what time is it in tokyo",
+        "explain quantum computing",
+        "who won the world cup",
+        "how tall is burj khalifa",
+        "give me a workout plan",
+        "what is the exchange rate of usd to aed",
+    ],
+    "document": [
+        "summarize this contract",
+        "what are the payment terms",
+        "are there any risky clauses",
+        "what does the termination clause say",
+        "who are the parties to the agreement",
+        "what is the notice period",
+        "is there a limitation of liability",
+        "key risks",
+        "key dates",
+        "what law governs this",
+        "can the landlord increase the rent",
+        "what happens if i leave early",
+        "how much is the late fee",
+        "explain section 4",
+        "what are my obligations",
+        "is there a non compete",
+        "when does it expire",
+        "can i cancel",
+        "what are the penalties",
+        "is my data protected under this",
+    ],
+}
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower().replace("’", "'")))
+
+
+def _features(normalized: str) -> list[str]:
+    words = normalized.split()
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:], strict=False)]
+
+
+class NaiveBayesIntentModel:
+    """Multinomial naive Bayes with Laplace smoothing over unigrams + bigrams."""
+
+    def __init__(self, examples: dict[Intent, list[str]], alpha: float = 1.0):
+        self.alpha = alpha
+        self.counts: dict[Intent, Counter[str]] = {}
+        self.totals: dict[Intent, int] = {}
+        self.log_priors: dict[Intent, float] = {}
+        n = sum(len(v) for v in examples.values())
+        for intent, texts in examples.items():
+            counts: Counter[str] = Counter()
+            for text in texts:
+                counts.update(_features(_normalize(text)))
+            self.counts[intent] = counts
+            self.totals[intent] = sum(counts.values())
+            self.log_priors[intent] = math.log(len(texts) / n)
+        self.vocab = set().union(*self.counts.values())
+
+    def predict_proba(self, text: str) -> dict[Intent, float]:
+        features = [f for f in _features(_normalize(text)) if f in self.vocab]
+        v = len(self.vocab)
+        scores = {}
+        for intent, counts in self.counts.items():
+            denom = math.log(self.totals[intent] + self.alpha * v)
+            scores[intent] = self.log_priors[intent] + sum(
+                math.log(counts[f] + self.alpha) - denom for f in features
+            )
+        top = max(scores.values())
+        exp = {k: math.exp(s - top) for k, s in scores.items()}
+        z = sum(exp.values())
+        return {k: e / z for k, e in exp.items()}
+
+
+@functools.cache
+def _model() -> NaiveBayesIntentModel:
+    return NaiveBayesIntentModel(SEED_EXAMPLES)
+
+
+def classify_intent(text: str) -> IntentResult:
+    """Local intent with a confidence in [0, 1]; never calls a model API."""
+
+    normalized = _normalize(text)
+    if not normalized:
+        return IntentResult("greeting", 0.5, "rules")
+    if _GREETING.match(normalized):
+        return IntentResult("greeting", RULE_CONFIDENCE, "rules")
+    if _ABOUT.search(normalized):
+        return IntentResult("about", RULE_CONFIDENCE, "rules")
+    if DOCUMENT_MATCHER.first_label(f" {normalized} "):
+        return IntentResult("document", CUE_CONFIDENCE, "rules")
+
+    proba = _model().predict_proba(text)
+    intent = max(proba, key=proba.__getitem__)
+    return IntentResult(intent, proba[intent], "model")
+
+
+INTENT_PROMPT = """Classify this user message into one of these categories:
+- "greeting": Simple greetings like hi, hello, hey, good morning, etc.
+- "about": Questions about you (the AI), your capabilities, who made you, etc.
+- "general": General questions NOT about documents (weather, math, coding, etc.)
+- "document": Questions about legal documents, contracts, clauses, analysis, etc.
+
+User message: "{message}"
+
+Reply with ONLY one word: greeting, about, general, or document"""
+
+
+def llm_intent(llm, text: str) -> Intent:
+    """One-word LLM classification; anything unrecognised counts as ``document``."""
+
+    response = llm.invoke(INTENT_PROMPT.format(message=text))
+    content = getattr(response, "content", response)
+    if isinstance(content, list):
+        content = content[0] if content else ""
+    reply = str(content).strip().lower()
+    return next((i for i in INTENTS if i in reply), "document")
+
+
+def resolve_intent(
+    text: str, llm=None, min_confidence: float = DEFAULT_MIN_CONFIDENCE
+) -> IntentResult:
+    """Local classification, deferring to ``llm`` only below ``min_confidence``."""
+
+    local = classify_intent(text)
+    if local.confidence >= min_confidence or llm is None:
+        return local
+    return IntentResult(llm_intent(llm, text), 1.0, "llm")
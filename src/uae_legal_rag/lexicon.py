@@ -0,0 +1,139 @@
+"""Compiled multi-pattern matcher for keyword lexicons.
+
+Section tagging and risk scoring both ask "which of these phrases occur in this
+text?" with plain-substring semantics (``phrase in text.lower()``). ``LexiconMatcher``
+compiles a lexicon once and answers that for one text or a batch, reporting every
+hit (including overlaps such as "termination" inside "termination without notice")
+and every matching label.
+
+Two engines produce identical results:
+
+- ``regex``: all phrases in one trie-shaped pattern inside a lookahead, so a single
+  pass finds every hit. Its cost is per character, independent of lexicon size.
+- ``scan``: one C-level substring search per phrase. Its cost grows with the number
+  of phrases, but for the small lexicons used here it is several times faster on
+  CPython than the regex pass (see ``benchmarks/bench_lexicon.py``).
+
+``engine="auto"`` picks ``scan`` below ``REGEX_MIN_PHRASES`` phrases.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections.abc import Iterable
+from typing import Literal
+
+# Measured crossover on CPython 3.11-3.13: ~14 ns/char for the regex pass vs
+# ~0.2-0.7 ns/char per phrase for substring scans.
+REGEX_MIN_PHRASES = 64
+# Joins texts for batch matching; never part of a lexicon phrase.
+_SEP = "\x00"
+
+Engine = Literal["auto", "scan", "regex"]
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node: dict) -> str:
+        end = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in node.items() if ch != ""]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy: prefer the longest phrase; shorter ones are recovered via prefixes.
+        if end:
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class LexiconMatcher:
+    """Find every lexicon phrase in a text (or many texts).
+
+    ``lexicon`` maps a label to its phrases; label order is preserved so callers
+    can keep "first matching rule wins" semantics.
+    """
+
+    def __init__(self, lexicon: dict[str, list[str]], engine: Engine = "auto"):
+        self.lexicon = {label: [t.lower() for t in terms] for label, terms in lexicon.items()}
+        self.labels_order = list(self.lexicon)
+        terms = sorted({t for ts in self.lexicon.values() for t in ts})
+        if not terms:
+            raise ValueError("Lexicon has no phrases.")
+        if engine == "auto":
+            engine = "regex" if len(terms) >= REGEX_MIN_PHRASES else "scan"
+        self.engine = engine
+        self._terms = terms
+
+        self._term_labels: dict[str, list[str]] = {t: [] for t in terms}
+        for label, ts in self.lexicon.items():
+            for t in ts:
+                if label not in self._term_labels[t]:
+                    self._term_labels[t].append(label)
+        # Phrases that start where a longer phrase starts are hidden by the greedy match.
+        self._prefixes = {t: [p for p in terms if p != t and t.startswith(p)] for t in terms}
+        self._pattern = re.compile(f"(?=({_trie_pattern(terms)}))")
+
+    def _hits(self, lowered: str) -> Iterable[tuple[int, str]]:
+        for m in self._pattern.finditer(lowered):
+            term = m.group(1)
+            if term:
+                yield m.start(), term
+                for p in self._prefixes[term]:
+                    yield m.start(), p
+
+    def terms(self, text: str) -> set[str]:
+        """All lexicon phrases occurring in ``text`` (case-insensitive)."""
+
+        lowered = (text or "").lower()
+        if self.engine == "scan":
+            return {t for t in self._terms if t in lowered}
+        return {t for _, t in self._hits(lowered)}
+
+    def labels(self, text: str) -> list[str]:
+        """Labels with at least one phrase in ``text``, in lexicon order."""
+
+        return self._order(self.terms(text))
+
+    def first_label(self, text: str) -> str | None:
+        if self.engine == "scan":
+            # Stop at the first label that hits, like a hand-written rule loop.
+            lowered = (text or "").lower()
+            for label, ts in self.lexicon.items():
+                if any(t in lowered for t in ts):
+                    return label
+            return None
+        found = self.labels(text)
+        return found[0] if found else None
+
+    def terms_batch(self, texts: list[str]) -> list[set[str]]:
+        """``terms`` for many texts; the regex engine covers them in a single pass."""
+
+        if self.engine == "scan":
+            return [self.terms(t) for t in texts]
+
+        lowered = [(t or "").lower() for t in texts]
+        starts = []
+        pos = 0
+        for t in lowered:
+            starts.append(pos)
+            pos += len(t) + 1
+        out: list[set[str]] = [set() for _ in texts]
+        for at, term in self._hits(_SEP.join(lowered)):
+            out[bisect.bisect_right(starts, at) - 1].add(term)
+        return out
+
+    def labels_batch(self, texts: list[str]) -> list[list[str]]:
+        return [self._order(found) for found in self.terms_batch(texts)]
+
+    def _order(self, found: set[str]) -> list[str]:
+        hit = {label for t in found for label in self._term_labels[t]}
+        return [label for label in self.labels_order if label in hit]
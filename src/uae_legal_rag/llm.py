@@ -1,13 +1,23 @@
 """LLM + embeddings factories.
 
 OpenAI is the default, but keep creation centralized for easy swapping later.
+Clients come from the process-wide ``ClientRegistry``: one shared instance per model
+and API key, all on a single pooled keep-alive HTTP transport.
 """
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import httpx
+from langchain_core.embeddings import Embeddings
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
+from uae_legal_rag.cache.embeddings import CachedEmbeddings
+from uae_legal_rag.cache.llm import get_llm_cache
+from uae_legal_rag.clients import get_client_registry, key_fingerprint
 from uae_legal_rag.config import Settings
+from uae_legal_rag.embedding_scheduler import ConcurrentEmbeddings
 
 
 def get_chat_llm(settings: Settings, api_key_override: str | None = None) -> ChatOpenAI:
@@ -15,19 +25,56 @@ def get_chat_llm(settings: Settings, api_key_override: str | None = None) -> Cha
     if not api_key:
         raise ValueError("Missing OPENAI_API_KEY (set in .env or via Streamlit sidebar).")
 
-    return ChatOpenAI(
-        model_name=settings.openai_model,  # type: ignore[call-arg]
-        temperature=0.1,
-        openai_api_key=api_key,  # type: ignore[call-arg]
+    cache = get_llm_cache(settings)
+    key = ("chat", settings.openai_model, key_fingerprint(api_key), id(cache))
+    return get_client_registry(settings.http_pool_size).get(
+        key,
+        lambda http_client: ChatOpenAI(
+            model_name=settings.openai_model,  # type: ignore[call-arg]
+            temperature=0.1,
+            openai_api_key=api_key,  # type: ignore[call-arg]
+            http_client=http_client,
+            # Byte-identical calls (quick prompts on an unchanged corpus) skip the API.
+            cache=cache,
+        ),
     )
 
 
-def get_embeddings(settings: Settings, api_key_override: str | None = None) -> OpenAIEmbeddings:
+def get_embeddings(settings: Settings, api_key_override: str | None = None) -> Embeddings:
     api_key = api_key_override or settings.openai_api_key
     if not api_key:
         raise ValueError("Missing OPENAI_API_KEY for embeddings.")
 
-    return OpenAIEmbeddings(
+    key = (
+        "embeddings",
+        settings.openai_embedding_model,
+        key_fingerprint(api_key),
+        settings.embedding_concurrency,
+        settings.embedding_cache_max_entries,
+        settings.cache_dir,
+    )
+    return get_client_registry(settings.http_pool_size).get(
+        key, lambda http_client: _build_embeddings(settings, api_key, http_client)
+    )
+
+
+def _build_embeddings(settings: Settings, api_key: str, http_client: httpx.Client) -> Embeddings:
+    emb: Embeddings = ConcurrentEmbeddings(
+        OpenAIEmbeddings(
+            model=settings.openai_embedding_model,
+            openai_api_key=api_key,  # type: ignore[call-arg]
+            http_client=http_client,
+            # Retries and 429 backoff are handled by the scheduler.
+            max_retries=0,
+        ),
+        max_concurrency=settings.embedding_concurrency,
+    )
+    if settings.embedding_cache_max_entries <= 0:
+        return emb
+
+    return CachedEmbeddings(
+        emb,
         model=settings.openai_embedding_model,
-        openai_api_key=api_key,  # type: ignore[call-arg]
+        db_path=str(Path(settings.cache_dir) / "embeddings.sqlite"),
+        max_entries=settings.embedding_cache_max_entries,
     )
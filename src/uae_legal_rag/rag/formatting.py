@@ -2,23 +2,180 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from langchain_core.documents import Document
 
+# Boundaries a trimmed passage may end on (not ":", which introduces what follows).
+_SENTENCE_END = re.compile(r"(?<=[.;!?])\s+|\n+")
+# A trimmed passage shorter than this is dropped rather than sent as a fragment.
+MIN_TRIMMED_TOKENS = 24
+# Hits separated by at most this many characters (whitespace the splitter stripped)
+# are adjacent and get stitched.
+STITCH_MAX_GAP = 2
+
+
+@dataclass
+class ContextStats:
+    passages: int = 0
+    trimmed: int = 0
+    dropped: int = 0
+    tokens_full: int = 0
+    tokens_packed: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_full - self.tokens_packed
+
+    @property
+    def savings(self) -> float:
+        return self.tokens_saved / self.tokens_full if self.tokens_full else 0.0
+
+
+def _header(d: Document) -> str:
+    meta = d.metadata or {}
+    src = meta.get("filename", "unknown")
+    page = meta.get("page", "?")
+    section = meta.get("section_type")
+    return f"[{src} | p.{page}]" + (f" ({section})" if section else "")
+
 
-def docs_to_context(docs: list[Document]) -> str:
+def docs_to_context(docs: list[Document], max_tokens: int | None = None) -> str:
+    """Passages with ``[file | p.N]`` headers; ``max_tokens`` packs them (``pack_context``)."""
+
+    if max_tokens is not None:
+        return pack_context(docs, max_tokens)[0]
     parts: list[str] = []
     for d in docs:
-        meta = d.metadata or {}
-        src = meta.get("filename", "unknown")
-        page = meta.get("page", "?")
-        section = meta.get("section_type")
-        header = f"[{src} | p.{page}]" + (f" ({section})" if section else "")
-        parts.append(header)
+        parts.append(_header(d))
         parts.append(d.page_content.strip())
         parts.append("")
     return "\n".join(parts).strip()
 
 
+def stitch_chunks(docs: list[Document], max_gap: int = STITCH_MAX_GAP) -> list[Document]:
+    """Merge overlapping or adjacent hits from the same file and page into one passage.
+
+    Uses the chunker's ``start_index`` / ``end_index`` page offsets, so the text the
+    splitter repeated as chunk overlap is sent once. A merged passage takes the place
+    and metadata of its best-ranked part (earliest in ``docs``), with the highest
+    ``score`` and the combined span. Documents without offsets pass through.
+    """
+
+    groups: dict[tuple[object, object], list[int]] = {}
+    for i, d in enumerate(docs):
+        meta = d.metadata or {}
+        if "start_index" in meta and "end_index" in meta:
+            groups.setdefault((meta.get("filename"), meta.get("page")), []).append(i)
+
+    merged: dict[int, Document] = {}
+    absorbed: set[int] = set()
+
+    def flush(run: list[int]) -> None:
+        if len(run) < 2:
+            return
+        first = docs[run[0]]
+        start, end = first.metadata["start_index"], first.metadata["end_index"]
+        text = first.page_content
+        for j in run[1:]:
+            d = docs[j]
+            s, e = d.metadata["start_index"], d.metadata["end_index"]
+            if e <= end:
+                continue
+            text += d.page_content[end - s :] if s < end else "\n" + d.page_content
+            end = e
+        rep = min(run)
+        meta = dict(docs[rep].metadata)
+        meta.update(start_index=start, end_index=end, stitched_chunks=len(run))
+        scores = [docs[j].metadata["score"] for j in run if "score" in docs[j].metadata]
+        if scores:
+            meta["score"] = max(scores)
+        merged[rep] = Document(page_content=text, metadata=meta)
+        absorbed.update(j for j in run if j != rep)
+
+    for idxs in groups.values():
+        idxs.sort(key=lambda i: docs[i].metadata["start_index"])
+        run = [idxs[0]]
+        for i in idxs[1:]:
+            reach = max(docs[j].metadata["end_index"] for j in run)
+            if docs[i].metadata["start_index"] <= reach + max_gap:
+                run.append(i)
+            else:
+                flush(run)
+                run = [i]
+        flush(run)
+
+    return [merged.get(i, d) for i, d in enumerate(docs) if i not in absorbed]
+
+
+def _trim_to_sentences(text: str, max_tokens: int, count_tokens: Callable[[str], int]) -> str:
+    """Longest prefix of ``text`` ending on a sentence boundary within ``max_tokens``."""
+
+    cuts = [m.start() for m in _SENTENCE_END.finditer(text)] + [len(text)]
+    lo, hi, best = 0, len(cuts) - 1, ""
+    # Prefix token counts grow with the cut position, so binary search the cut.
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        prefix = text[: cuts[mid]].rstrip()
+        if count_tokens(prefix) <= max_tokens:
+            best, lo = prefix, mid + 1
+        else:
+            hi = mid - 1
+    return best
+
+
+def pack_context(
+    docs: list[Document],
+    max_tokens: int,
+    count_tokens: Callable[[str], int] | None = None,
+) -> tuple[str, ContextStats]:
+    """Fit the best passages into ``max_tokens`` tokens of context.
+
+    Passages are taken by descending ``metadata["score"]`` (retrieval order when
+    absent). Whole passages are kept while they fit; the first one that does not is
+    cut back to a sentence boundary, and passages with no room left are dropped.
+    Tokens are counted with the chunker's tiktoken encoding.
+    """
+
+    if count_tokens is None:
+        from uae_legal_rag.ingestion.chunking import token_len
+
+        count_tokens = token_len
+
+    stats = ContextStats(passages=len(docs))
+    order = sorted(
+        range(len(docs)),
+        key=lambda i: -float((docs[i].metadata or {}).get("score", float("-inf"))),
+    )
+    blocks: list[str] = []
+    remaining = max_tokens
+    for i in order:
+        header, body = _header(docs[i]), docs[i].page_content.strip()
+        block = f"{header}\n{body}"
+        # +1 for the blank line separating blocks.
+        cost = count_tokens(block) + 1
+        if cost <= remaining:
+            blocks.append(block)
+            remaining -= cost
+            continue
+        room = remaining - count_tokens(header) - 2
+        trimmed = _trim_to_sentences(body, room, count_tokens) if room > 0 else ""
+        if trimmed and count_tokens(trimmed) >= MIN_TRIMMED_TOKENS:
+            block = f"{header}\n{trimmed}"
+            blocks.append(block)
+            remaining -= count_tokens(block) + 1
+            stats.trimmed += 1
+        else:
+            stats.dropped += 1
+
+    context = "\n\n".join(blocks)
+    stats.tokens_full = count_tokens(docs_to_context(docs))
+    stats.tokens_packed = count_tokens(context)
+    return context, stats
+
+
 def docs_to_snippets(docs: list[Document], max_items: int = 4, max_chars: int = 380) -> list[str]:
     out: list[str] = []
     for d in docs[:max_items]:
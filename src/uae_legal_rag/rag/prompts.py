@@ -78,6 +78,37 @@ Focus only on risks actually present in the document. Don't speculate about risk
     )
 
 
+def structured_prompt() -> ChatPromptTemplate:
+    """Answer and risk review in one call; the reply follows the ``StructuredAnalysis`` schema."""
+
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", SYSTEM_PERSONA),
+            (
+                "human",
+                """**Question:** {question}
+
+**Document Context:**
+{context}
+
+---
+
+Return two things:
+
+1. **answer** — A focused, professional answer to the question, formatted in Markdown as:
+   **Direct Answer**, **Key Details** (quote clauses when helpful) and **What to Watch**.
+2. **findings** — Each risk actually present in the context (liability, termination,
+   penalties and damages, data protection / PDPL, operational obligations). For each one give
+   the quoted or cited clause, the practical issue, and a severity
+   (Critical / High / Medium / Low).
+
+Return an empty findings list if the context shows no risks. Don't speculate about risks not
+evidenced in the text.""",
+            ),
+        ]
+    )
+
+
 def template_prompt() -> ChatPromptTemplate:
     return ChatPromptTemplate.from_messages(
         [
@@ -2,8 +2,177 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
 from langchain_core.vectorstores import VectorStore
 
+from uae_legal_rag.ingestion.chunking import SECTION_MATCHER, section_flag
+from uae_legal_rag.vectorstore.lexical import lexical_index
+
+RetrievalMode = Literal["dense", "hybrid"]
+RETRIEVAL_MODES: tuple[RetrievalMode, ...] = ("dense", "hybrid")
+
+
+class ScoredRetriever(BaseRetriever):
+    """Top-``k`` similarity search that records each hit's relevance in ``metadata["score"]``.
+
+    Scores are the store's normalized relevance (higher is better); the context packer
+    ranks passages by them.
+
+    With ``route_sections`` a question that names section keywords ("terminate",
+    "indemnity", "PDPL", ...) is first searched among chunks tagged with one of those
+    section types only (their ``has_<label>`` flags). If that yields fewer than ``k``
+    hits (or the chunks predate the flags), the search widens to the whole store to
+    fill the rest.
+    """
+
+    vectorstore: VectorStore
+    k: int = 4
+    route_sections: bool = False
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        sections = self._route(query)
+        hits = self._search(query, sections)
+        if sections and len(hits) < self.k:
+            hits = _widened(hits, self._search(query, []), self.k)
+        return _scored(hits)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        sections = self._route(query)
+        hits = await self._asearch(query, sections)
+        if sections and len(hits) < self.k:
+            hits = _widened(hits, await self._asearch(query, []), self.k)
+        return _scored(hits)
+
+    def _route(self, query: str) -> list[str]:
+        return route_sections(query) if self.route_sections else []
+
+    def _search(self, query: str, sections: list[str]) -> list[tuple[Document, float]]:
+        return self.vectorstore.similarity_search_with_relevance_scores(
+            query, k=self.k, **_filter(sections)
+        )
+
+    async def _asearch(self, query: str, sections: list[str]) -> list[tuple[Document, float]]:
+        return await self.vectorstore.asimilarity_search_with_relevance_scores(
+            query, k=self.k, **_filter(sections)
+        )
+
+
+def route_sections(query: str) -> list[str]:
+    """Section types a question is likely about, from the chunk tagger's lexicon."""
+
+    return SECTION_MATCHER.labels(query)
+
+
+def section_filter(sections: list[str]) -> dict | None:
+    """A ``where`` filter for chunks tagged with any of ``sections``."""
+
+    clauses = [{section_flag(s): True} for s in sections]
+    if len(clauses) > 1:
+        return {"$or": clauses}
+    return clauses[0] if clauses else None
+
+
+def _filter(sections: list[str]) -> dict:
+    where = section_filter(sections)
+    return {"filter": where} if where else {}
+
+
+def _widened(
+    routed: list[tuple[Document, float]], everything: list[tuple[Document, float]], k: int
+) -> list[tuple[Document, float]]:
+    seen = {d.id for d, _ in routed}
+    return routed + [hit for hit in everything if hit[0].id not in seen][: k - len(routed)]
+
+
+def _scored(hits: list[tuple[Document, float]]) -> list[Document]:
+    return [
+        Document(
+            id=doc.id,
+            page_content=doc.page_content,
+            metadata={**(doc.metadata or {}), "score": float(score)},
+        )
+        for doc, score in hits
+    ]
+
+
+class HybridRetriever(ScoredRetriever):
+    """Dense search fused with BM25 over the store's lexical index.
+
+    Each side returns ``fetch_k`` candidates; documents are ranked by reciprocal-rank
+    fusion, ``sum(1 / (rrf_k + rank))``, which needs no score calibration between the
+    two. ``metadata["score"]`` holds the fused score.
+    """
+
+    fetch_k: int = 20
+    rrf_k: int = 60
+
+    def _search(self, query: str, sections: list[str]) -> list[tuple[Document, float]]:
+        dense = self.vectorstore.similarity_search_with_relevance_scores(
+            query, k=self.fetch_k, **_filter(sections)
+        )
+        fused, missing = self._fuse(query, dense, sections)
+        fetched = self.vectorstore.get_by_ids(missing) if missing else []
+        return self._ranked(fused, dense, fetched)
+
+    async def _asearch(self, query: str, sections: list[str]) -> list[tuple[Document, float]]:
+        dense = await self.vectorstore.asimilarity_search_with_relevance_scores(
+            query, k=self.fetch_k, **_filter(sections)
+        )
+        fused, missing = self._fuse(query, dense, sections)
+        fetched = await self.vectorstore.aget_by_ids(missing) if missing else []
+        return self._ranked(fused, dense, fetched)
+
+    def _fuse(
+        self, query: str, dense: list[tuple[Document, float]], sections: list[str]
+    ) -> tuple[list[tuple[str, float]], list[str]]:
+        """Top-``k`` ``(id, fused score)`` plus the IDs only the lexical side found."""
+
+        # The index keeps the chunks' section flags, so routing filters its postings
+        # in memory rather than asking the store which chunks match.
+        flags = [section_flag(s) for s in sections] if sections else None
+        lexical = lexical_index(self.vectorstore).search(query, self.fetch_k, flags)
+        scores: dict[str, float] = {}
+        for ranked_ids in ([d.id for d, _ in dense], [i for i, _ in lexical]):
+            for rank, doc_id in enumerate(ranked_ids):
+                if doc_id is not None:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + 1 / (self.rrf_k + rank + 1)
+        top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[: self.k]
+        seen = {d.id for d, _ in dense}
+        return top, [i for i, _ in top if i not in seen]
+
+    @staticmethod
+    def _ranked(
+        fused: list[tuple[str, float]],
+        dense: list[tuple[Document, float]],
+        fetched: list[Document],
+    ) -> list[tuple[Document, float]]:
+        docs = {d.id: d for d, _ in dense} | {d.id: d for d in fetched}
+        return [(docs[i], score) for i, score in fused if i in docs]
+
 
-def build_retriever(vectorstore: VectorStore, k: int = 4):
-    return vectorstore.as_retriever(search_kwargs={"k": k})
+def build_retriever(
+    vectorstore: VectorStore,
+    k: int = 4,
+    mode: RetrievalMode = "dense",
+    route_sections: bool = False,
+) -> ScoredRetriever:
+    if mode == "hybrid":
+        # Attach (and fill) the lexical index now so later ingests update it in place.
+        lexical_index(vectorstore)
+        return HybridRetriever(
+            vectorstore=vectorstore, k=k, fetch_k=max(20, 4 * k), route_sections=route_sections
+        )
+    if mode != "dense":
+        raise ValueError(f"Unknown retrieval mode {mode!r}; expected one of {RETRIEVAL_MODES}")
+    return ScoredRetriever(vectorstore=vectorstore, k=k, route_sections=route_sections)
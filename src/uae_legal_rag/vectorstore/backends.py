@@ -0,0 +1,58 @@
+"""Vector store backend selection (``VECTOR_BACKEND``).
+
+- ``chroma`` (default): Chroma collections; HNSW search, multi-tenant, persists
+  every write.
+- ``numpy``: ``NumpyVectorStore``, an exact flat index for one tenant of up to
+  ~10^5 chunks; persisted by ``flush_vectorstore`` after writes.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.vectorstore.chroma_client import get_chroma, persists
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
+
+VECTOR_BACKENDS = ("chroma", "numpy")
+
+
+def numpy_store_path(persist_dir: str, collection_name: str) -> Path:
+    return Path(persist_dir) / f"{collection_name}.npstore"
+
+
+def get_vectorstore(
+    embeddings: Embeddings,
+    persist_dir: str | None,
+    collection_name: str,
+    backend: str = "chroma",
+    persist_in_streamlit: bool = False,
+) -> VectorStore:
+    """``get_chroma`` for any backend, with the same persistence rules."""
+
+    if backend == "numpy":
+        path = None
+        if persist_dir and persists(persist_dir, persist_in_streamlit):
+            path = numpy_store_path(persist_dir, collection_name)
+        return NumpyVectorStore(embeddings, path)
+    if backend != "chroma":
+        raise ValueError(f"Unknown vector backend {backend!r}; expected one of {VECTOR_BACKENDS}")
+    return get_chroma(embeddings, persist_dir, collection_name, persist_in_streamlit)
+
+
+def flush_vectorstore(vs: VectorStore | None) -> None:
+    """Persist writes for stores that don't on their own (Chroma does)."""
+
+    if isinstance(vs, NumpyVectorStore):
+        vs.save()
+
+
+def count_documents(vs: VectorStore | None) -> int:
+    if isinstance(vs, Chroma):
+        return int(vs._collection.count())
+    if isinstance(vs, NumpyVectorStore):
+        return len(vs)
+    return 0
@@ -6,10 +6,21 @@ import gc
 import os
 import shutil
 import time
+import uuid
 from pathlib import Path
 
+import chromadb
 from langchain_chroma import Chroma
+from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.vectorstore.lexical import (
+    index_documents,
+    reflag_documents,
+    unindex_documents,
+)
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
 
 
 def _is_streamlit() -> bool:
@@ -19,26 +30,24 @@ def _is_streamlit() -> bool:
     return "STREAMLIT_SERVER_RUN_ON_SAVE" in os.environ
 
 
-def get_chroma(
-    embeddings: Embeddings,
-    persist_dir: str | None,
-    collection_name: str,
-) -> Chroma:
+def persists(persist_dir: str | None, persist_in_streamlit: bool = False) -> bool:
     """
     RULES:
-    - Streamlit (local or cloud): ALWAYS in-memory Chroma
+    - Streamlit (local or cloud): in-memory Chroma, unless persist_in_streamlit
+      (CHROMA_PERSIST_STREAMLIT) opts in to a durable directory
     - Non-Streamlit usage: persistent if persist_dir is provided
     """
 
-    # ✅ Streamlit detected → force in-memory (NO persistence)
-    if _is_streamlit():
-        return Chroma(
-            collection_name=collection_name,
-            embedding_function=embeddings,
-        )
+    return bool(persist_dir) and (persist_in_streamlit or not _is_streamlit())
+
 
-    # ✅ Non-Streamlit usage → persistent allowed
-    if persist_dir:
+def get_chroma(
+    embeddings: Embeddings,
+    persist_dir: str | None,
+    collection_name: str,
+    persist_in_streamlit: bool = False,
+) -> Chroma:
+    if persist_dir and persists(persist_dir, persist_in_streamlit):
         Path(persist_dir).mkdir(parents=True, exist_ok=True)
         return Chroma(
             collection_name=collection_name,
@@ -52,13 +61,71 @@ def get_chroma(
     )
 
 
-def reset_chroma_collection(vs: Chroma | None) -> None:
+def chroma_client(
+    persist_dir: str | None, persist_in_streamlit: bool = False
+) -> chromadb.ClientAPI:
+    """A Chroma client following the ``persists`` rules."""
+
+    if persist_dir and persists(persist_dir, persist_in_streamlit):
+        Path(persist_dir).mkdir(parents=True, exist_ok=True)
+        return chromadb.PersistentClient(path=persist_dir)
+    return chromadb.EphemeralClient()
+
+
+def add_embedded_documents(
+    vs: VectorStore,
+    docs: list[Document],
+    vectors: list[list[float]],
+    ids: list[str] | None = None,
+) -> list[str]:
+    """Add documents whose embeddings were computed upstream.
+
+    Chroma and the NumPy store take the vectors as-is; other stores fall back to
+    ``add_documents`` (which embeds again).
+    """
+
+    ids = ids or [str(uuid.uuid4()) for _ in docs]
+    texts = [d.page_content for d in docs]
+    if isinstance(vs, NumpyVectorStore):
+        vs.add_embeddings(texts, vectors, [d.metadata for d in docs], ids)
+    elif isinstance(vs, Chroma):
+        vs._collection.upsert(
+            ids=ids,
+            embeddings=vectors,  # type: ignore[arg-type]
+            documents=texts,
+            metadatas=[d.metadata or None for d in docs],  # type: ignore[misc]
+        )
+    else:
+        vs.add_documents(docs, ids=ids)
+    index_documents(vs, ids, texts, [d.metadata for d in docs])
+    return ids
+
+
+def update_metadatas(vs: VectorStore, ids: list[str], metadatas: list[dict]) -> None:
+    """Replace stored metadata without re-embedding the documents."""
+
+    if isinstance(vs, Chroma):
+        vs._collection.update(ids=ids, metadatas=metadatas)  # type: ignore[arg-type]
+    elif isinstance(vs, NumpyVectorStore):
+        vs.update_metadatas(ids, metadatas)
+    else:
+        by_id = {d.id: d for d in vs.get_by_ids(ids)}
+        docs = [
+            Document(page_content=by_id[i].page_content, metadata=m)
+            for i, m in zip(ids, metadatas, strict=True)
+        ]
+        vs.add_documents(docs, ids=ids)
+    reflag_documents(vs, ids, metadatas)
+
+
+def reset_chroma_collection(vs: VectorStore | None) -> None:
     if vs is None:
         return
     try:
         result = vs.get()
         if result and result.get("ids"):
             vs.delete(ids=result["ids"])
+            unindex_documents(vs, result["ids"])
     except Exception:
         pass
 
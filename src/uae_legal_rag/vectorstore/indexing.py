@@ -0,0 +1,105 @@
+"""Deterministic chunk IDs and incremental re-indexing of changed documents.
+
+A chunk's ID is derived from its filename and a hash of its text, so re-ingesting
+a revised contract only embeds chunks whose text changed, deletes chunks that
+disappeared, and leaves the rest alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.vectorstore.chroma_client import update_metadatas
+from uae_legal_rag.vectorstore.lexical import index_documents, unindex_documents
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chunk_id(filename: str, content: str, occurrence: int = 0) -> str:
+    """Stable ID for the ``occurrence``-th chunk with this text in ``filename``."""
+
+    base = f"{_sha(filename)[:16]}-{_sha(content)[:32]}"
+    return base if occurrence == 0 else f"{base}-{occurrence}"
+
+
+@dataclass
+class SyncResult:
+    added: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+@dataclass
+class DocumentSync:
+    """Reconciles one file's freshly chunked text with what is already indexed.
+
+    Feed chunks in document order through :meth:`plan`, add the returned new
+    chunks, then call :meth:`finish` to drop stale chunks and refresh metadata
+    (e.g. page numbers) of chunks whose text did not change.
+    """
+
+    vs: VectorStore
+    filename: str
+    existing: dict[str, dict] = field(default_factory=dict)
+    result: SyncResult = field(default_factory=SyncResult)
+    _seen: set[str] = field(default_factory=set)
+    _occurrences: Counter = field(default_factory=Counter)
+    _metadata_updates: dict[str, dict] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        got = self.vs.get(where={"filename": self.filename}, include=["metadatas"])  # type: ignore[attr-defined]
+        self.existing = dict(zip(got["ids"], got["metadatas"], strict=True))
+
+    def plan(self, chunks: list[Document]) -> tuple[list[Document], list[str]]:
+        """Return the chunks (and their IDs) that are not indexed yet."""
+
+        new_docs: list[Document] = []
+        new_ids: list[str] = []
+        for d in chunks:
+            digest = _sha(d.page_content)
+            n = self._occurrences[digest]
+            self._occurrences[digest] += 1
+            cid = chunk_id(self.filename, d.page_content, n)
+            self._seen.add(cid)
+
+            if cid in self.existing:
+                self.result.unchanged += 1
+                if (self.existing[cid] or {}) != d.metadata:
+                    self._metadata_updates[cid] = d.metadata
+                continue
+            new_docs.append(d)
+            new_ids.append(cid)
+        self.result.added += len(new_docs)
+        return new_docs, new_ids
+
+    def finish(self) -> SyncResult:
+        stale = [cid for cid in self.existing if cid not in self._seen]
+        if stale:
+            self.vs.delete(ids=stale)
+            unindex_documents(self.vs, stale)
+        self.result.deleted = len(stale)
+        if self._metadata_updates:
+            update_metadatas(
+                self.vs, list(self._metadata_updates), list(self._metadata_updates.values())
+            )
+        return self.result
+
+
+def sync_document(vs: VectorStore, filename: str, chunks: list[Document]) -> SyncResult:
+    """Make the index for ``filename`` match ``chunks``, embedding only new text."""
+
+    sync = DocumentSync(vs, filename)
+    new_docs, new_ids = sync.plan(chunks)
+    if new_docs:
+        vs.add_documents(new_docs, ids=new_ids)
+        index_documents(
+            vs, new_ids, [d.page_content for d in new_docs], [d.metadata for d in new_docs]
+        )
+    return sync.finish()
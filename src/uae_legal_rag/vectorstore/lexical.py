@@ -0,0 +1,204 @@
+"""BM25 inverted index kept next to a vector store (``RETRIEVAL_MODE=hybrid``).
+
+Embeddings blur exact terms ("liquidated damages", "Clause 14.2", "PDPL"); a
+lexical index scores them directly. ``lexical_index(vs)`` attaches one in-memory
+index to a store, filled from the store's texts on first use. After that the write
+helpers (``add_embedded_documents``, ``sync_document``, ``reset_chroma_collection``)
+update it incrementally. If the store's size drifts from the index's (another
+process or an unhooked write changed it), the index is rebuilt on the next lookup.
+
+The index also keeps each document's boolean flags (metadata keys set to ``True``,
+such as the chunk tagger's ``has_<label>``), so a routed search can filter its
+postings without querying the store.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+import weakref
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+
+from langchain_core.vectorstores import VectorStore
+
+# Dotted clause numbers ("14.2", "5.1.3") stay one token; everything else splits on
+# non-word characters.
+_TOKEN = re.compile(r"\d+(?:\.\d+)+|\w+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or shall that the "
+    "this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _true_flags(metadata: Mapping | None) -> frozenset[str]:
+    return frozenset(key for key, value in (metadata or {}).items() if value is True)
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index (term -> {doc id: term frequency}).
+
+    Documents added with metadata also keep their ``True`` flags for ``search``.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._flags: dict[str, frozenset[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._lengths
+
+    def add(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        metadatas: Sequence[Mapping | None] | None = None,
+    ) -> None:
+        """Index (or re-index) documents."""
+
+        with self._lock:
+            self.remove(ids)
+            for doc_id, text in zip(ids, texts, strict=True):
+                counts = Counter(tokenize(text))
+                for term, tf in counts.items():
+                    self._postings.setdefault(term, {})[doc_id] = tf
+                length = sum(counts.values())
+                self._lengths[doc_id] = length
+                self._total_length += length
+            if metadatas is not None:
+                self.set_flags(ids, metadatas)
+
+    def set_flags(self, ids: Sequence[str], metadatas: Sequence[Mapping | None]) -> None:
+        """Replace the stored flags of indexed documents from their new metadata."""
+
+        with self._lock:
+            for doc_id, metadata in zip(ids, metadatas, strict=True):
+                flags = _true_flags(metadata)
+                if flags and doc_id in self._lengths:
+                    self._flags[doc_id] = flags
+                else:
+                    self._flags.pop(doc_id, None)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        with self._lock:
+            gone = [i for i in ids if i in self._lengths]
+            if not gone:
+                return
+            for doc_id in gone:
+                self._total_length -= self._lengths.pop(doc_id)
+                self._flags.pop(doc_id, None)
+            dropped = set(gone)
+            # A removed document's terms are not stored separately, so sweep the
+            # postings; removals are rare next to queries.
+            for term in list(self._postings):
+                postings = self._postings[term]
+                for doc_id in dropped & postings.keys():
+                    del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._lengths.clear()
+            self._flags.clear()
+            self._total_length = 0
+
+    def search(
+        self, query: str, k: int, flags: Iterable[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """Top-``k`` ``(doc id, BM25 score)`` pairs, best first.
+
+        With ``flags``, only documents having at least one of them are scored.
+        """
+
+        wanted = frozenset(flags) if flags is not None else None
+        with self._lock:
+            n = len(self._lengths)
+            if not n or k <= 0 or wanted is not None and not wanted:
+                return []
+            avg_length = self._total_length / n
+            scores: dict[str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                norm = self.k1 * (1 - self.b)
+                per_length = self.k1 * self.b / avg_length
+                for doc_id, tf in postings.items():
+                    if wanted is not None and wanted.isdisjoint(self._flags.get(doc_id, ())):
+                        continue
+                    denom = tf + norm + per_length * self._lengths[doc_id]
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / denom
+            return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+
+_indexes: weakref.WeakKeyDictionary[VectorStore, BM25Index] = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def lexical_index(vs: VectorStore) -> BM25Index:
+    """The BM25 index attached to ``vs``, built from its texts if missing or stale."""
+
+    from uae_legal_rag.vectorstore.backends import count_documents
+
+    with _indexes_lock:
+        index = _indexes.get(vs)
+        if index is None:
+            index = _indexes[vs] = BM25Index()
+            stale = True
+        else:
+            stale = False
+    with index._lock:
+        # Stores without a cheap count (0) are only read once.
+        stored = count_documents(vs)
+        if stale or (stored and stored != len(index)):
+            got = vs.get(include=["documents", "metadatas"])  # type: ignore[attr-defined]
+            index.clear()
+            index.add(got["ids"], [t or "" for t in got["documents"]], got["metadatas"])
+    return index
+
+
+def index_documents(
+    vs: VectorStore,
+    ids: Sequence[str],
+    texts: Sequence[str],
+    metadatas: Sequence[Mapping | None] | None = None,
+) -> None:
+    """Keep an attached index in step with documents just written to ``vs``."""
+
+    index = _indexes.get(vs)
+    if index is not None:
+        index.add(ids, texts, metadatas)
+
+
+def reflag_documents(
+    vs: VectorStore, ids: Sequence[str], metadatas: Sequence[Mapping | None]
+) -> None:
+    """Keep an attached index's flags in step with metadata just replaced in ``vs``."""
+
+    index = _indexes.get(vs)
+    if index is not None:
+        index.set_flags(ids, metadatas)
+
+
+def unindex_documents(vs: VectorStore, ids: Iterable[str]) -> None:
+    index = _indexes.get(vs)
+    if index is not None:
+        index.remove(ids)
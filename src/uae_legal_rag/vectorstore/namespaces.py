@@ -0,0 +1,222 @@
+"""Process-wide vector store shared by all sessions, split into namespaces.
+
+Each namespace (a tenant or workspace) is its own Chroma collection on one shared
+client, so sessions of the same workspace index a contract once and every other
+session sees it, while different workspaces never see each other's documents.
+
+Namespaces are reference counted: ``acquire`` returns a ``NamespaceLease``; the last
+``release`` (or garbage collection of the last lease, e.g. when a Streamlit session
+ends) drops an in-memory collection to free its memory. Persistent collections are
+kept on disk. ``acquire_private`` gives one holder a namespace of its own that is
+never persisted and is always dropped on release.
+
+A persistent registry opens its directory on first ``acquire``, not at startup, and
+never re-indexes: the existing collections are reopened as they are (Chroma loads a
+collection's index on its first query). All its namespaces share one
+``StoreWriter``, so writes are serialized across threads and processes.
+
+With ``backend="numpy"`` each namespace is a ``NumpyVectorStore`` instead (saved
+under ``<persist_dir>/<collection>.npstore`` by ``flush_vectorstore``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import uuid
+import weakref
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+
+import chromadb
+from langchain_chroma import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from uae_legal_rag.vectorstore.backends import VECTOR_BACKENDS, numpy_store_path
+from uae_legal_rag.vectorstore.chroma_client import chroma_client, persists
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
+from uae_legal_rag.vectorstore.persistence import StoreWriter
+
+DEFAULT_NAMESPACE = "default"
+_UNSAFE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+
+def namespace_collection(base: str, namespace: str) -> str:
+    """Chroma collection name for ``namespace``; the default namespace keeps ``base``."""
+
+    if namespace == DEFAULT_NAMESPACE:
+        return base
+    slug = _UNSAFE.sub("-", namespace).strip("-._")[:48]
+    if slug != namespace:
+        # Keep distinct namespaces distinct after sanitizing.
+        slug = f"{slug}-{hashlib.sha256(namespace.encode()).hexdigest()[:8]}".lstrip("-")
+    return f"{base}--{slug}"
+
+
+@dataclass
+class _Namespace:
+    vectorstore: VectorStore
+    write_lock: AbstractContextManager
+    refs: int = 0
+    private: bool = False
+
+
+class NamespaceLease:
+    """One holder's reference to a namespace; ``release()`` is idempotent.
+
+    Keep the lease for as long as ``vectorstore`` is used: once the last lease is gone
+    an in-memory namespace is dropped.
+
+    Hold ``write_lock`` while ingesting so concurrent uploads of the same files into
+    one namespace are embedded once (the second finds its chunks already indexed).
+    """
+
+    def __init__(self, registry: VectorStoreRegistry, namespace: str, entry: _Namespace):
+        self.namespace = namespace
+        self.vectorstore = entry.vectorstore
+        self.write_lock = entry.write_lock
+        self._finalizer = weakref.finalize(self, registry._release, namespace)
+        self._finalizer.atexit = False
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+    def release(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> NamespaceLease:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class VectorStoreRegistry:
+    """Namespaced collections of one base collection on a single shared Chroma client."""
+
+    def __init__(
+        self,
+        persist_dir: str | None,
+        collection_name: str,
+        drop_unused: bool | None = None,
+        persist_in_streamlit: bool = False,
+        backend: str = "chroma",
+    ):
+        if backend not in VECTOR_BACKENDS:
+            raise ValueError(
+                f"Unknown vector backend {backend!r}; expected one of {VECTOR_BACKENDS}"
+            )
+        self.backend = backend
+        self.persist_dir = persist_dir
+        self.persist_in_streamlit = persist_in_streamlit
+        self.persistent = persists(persist_dir, persist_in_streamlit)
+        self.collection_name = collection_name
+        # In memory nothing survives the process anyway; free it as soon as it is unused.
+        self.drop_unused = not self.persistent if drop_unused is None else drop_unused
+        self.writer = StoreWriter(persist_dir) if self.persistent and persist_dir else None
+        self._client: chromadb.ClientAPI | None = None
+        self._lock = threading.Lock()
+        self._namespaces: dict[str, _Namespace] = {}
+
+    @property
+    def client(self) -> chromadb.ClientAPI:
+        with self._lock:
+            return self._open()
+
+    def _open(self) -> chromadb.ClientAPI:
+        if self._client is None:
+            self._client = chroma_client(self.persist_dir, self.persist_in_streamlit)
+        return self._client
+
+    def interrupted(self) -> dict | None:
+        """Marker of an ingest that died mid-write in this directory (see ``StoreWriter``)."""
+
+        return self.writer.interrupted() if self.writer else None
+
+    def acquire(self, namespace: str, embeddings: Embeddings) -> NamespaceLease:
+        """Reference ``namespace``, creating its collection on first use."""
+
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            if entry is None:
+                vs = self._create(namespace_collection(self.collection_name, namespace), embeddings)
+                entry = self._namespaces[namespace] = _Namespace(
+                    vs, self.writer or threading.Lock()
+                )
+            entry.refs += 1
+            return NamespaceLease(self, namespace, entry)
+
+    def acquire_private(self, embeddings: Embeddings) -> NamespaceLease:
+        """A new namespace only this lease can reach, kept in memory until released."""
+
+        namespace = f"private-{uuid.uuid4().hex}"
+        with self._lock:
+            vs = self._create(
+                namespace_collection(self.collection_name, namespace), embeddings, private=True
+            )
+            entry = self._namespaces[namespace] = _Namespace(
+                vs, threading.Lock(), refs=1, private=True
+            )
+            return NamespaceLease(self, namespace, entry)
+
+    def _create(
+        self, collection_name: str, embeddings: Embeddings, private: bool = False
+    ) -> VectorStore:
+        persistent = self.persistent and not private
+        if self.backend == "numpy":
+            path = None
+            if persistent and self.persist_dir:
+                path = numpy_store_path(self.persist_dir, collection_name)
+            return NumpyVectorStore(embeddings, path)
+        # A private namespace of a persistent registry stays off the disk.
+        client = chroma_client(None) if private and self.persistent else self._open()
+        return Chroma(client=client, collection_name=collection_name, embedding_function=embeddings)
+
+    def _release(self, namespace: str) -> None:
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            if entry is None:
+                return
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            del self._namespaces[namespace]
+            if (self.drop_unused or entry.private) and isinstance(entry.vectorstore, Chroma):
+                entry.vectorstore.delete_collection()
+
+    def refcount(self, namespace: str) -> int:
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            return entry.refs if entry else 0
+
+    def namespaces(self) -> list[str]:
+        with self._lock:
+            return sorted(self._namespaces)
+
+
+_registries: dict[tuple[str | None, str, bool, str], VectorStoreRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_vectorstore_registry(
+    persist_dir: str | None,
+    collection_name: str,
+    persist_in_streamlit: bool = False,
+    backend: str = "chroma",
+) -> VectorStoreRegistry:
+    """The process-wide registry for this store location (one per Streamlit server)."""
+
+    key = (persist_dir, collection_name, persist_in_streamlit, backend)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = VectorStoreRegistry(
+                persist_dir,
+                collection_name,
+                persist_in_streamlit=persist_in_streamlit,
+                backend=backend,
+            )
+        return registry
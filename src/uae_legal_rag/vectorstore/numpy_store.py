@@ -0,0 +1,427 @@
+"""Exact flat vector index on NumPy (``VECTOR_BACKEND=numpy``).
+
+All embeddings live L2-normalized in one contiguous float32 matrix, so a query is a
+single matrix-vector product plus an ``argpartition`` top-k: exact results and no
+ANN index to build. Metadata filters use the Chroma ``where`` syntax and are
+evaluated on per-key columns of integer codes (built lazily, dropped on writes),
+so filtering is vectorized as well.
+
+Meant for one process and one tenant of up to ~10^5 chunks. ``get`` mirrors
+Chroma's so ``DocumentSync`` and the reset helpers work unchanged. With a ``path``
+the store is written by ``save()`` (atomically) and reopened memory-mapped; it is
+not written on every change. Processes sharing a path save in turn under the
+directory's ``StoreWriter``; ``save()`` merges in whatever another one saved first.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+RECORDS_NAME = "records.json"
+_MISSING = object()
+
+
+class NumpyVectorStore(VectorStore):
+    """Cosine search over a flat float32 matrix; ``similarity_search_with_score`` returns
+    cosine distance (lower is better), like Chroma."""
+
+    def __init__(self, embedding: Embeddings, path: str | Path | None = None):
+        self._embedding = embedding
+        self.path = Path(path) if path else None
+        self._lock = threading.RLock()
+        self._vectors = np.empty((0, 0), dtype=np.float32)  # rows beyond _size are spare
+        self._size = 0
+        self._ids: list[str] = []
+        self._texts: list[str] = []
+        self._metadatas: list[dict] = []
+        self._rows: dict[str, int] = {}
+        self._columns: dict[str, tuple[np.ndarray, dict[Any, int], np.ndarray]] = {}
+        # Writes since the last load/save, replayed onto a newer copy on disk by save().
+        self._changed: set[str] = set()
+        self._deleted: set[str] = set()
+        self._disk_version: tuple[int, int] | None = None
+        if self.path and (self.path / RECORDS_NAME).exists():
+            self._load()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dim(self) -> int:
+        return self._vectors.shape[1]
+
+    # -- writes ---------------------------------------------------------------
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        return self.add_embeddings(
+            texts, self._embedding.embed_documents(texts), metadatas=metadatas, ids=ids
+        )
+
+    def add_embeddings(
+        self,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        metadatas: Sequence[dict | None] | None = None,
+        ids: Sequence[str | None] | None = None,
+    ) -> list[str]:
+        """Upsert precomputed embeddings (existing IDs are overwritten in place)."""
+
+        if not texts:
+            return []
+        matrix = _normalized(np.asarray(vectors, dtype=np.float32))
+        metadatas = metadatas or [None] * len(texts)
+        ids = [i or str(uuid.uuid4()) for i in (ids or [None] * len(texts))]
+        with self._lock:
+            self._writable(matrix.shape[1], len(texts))
+            for text, vec, meta, id_ in zip(texts, matrix, metadatas, ids, strict=True):
+                row = self._rows.get(id_)
+                if row is None:
+                    row = self._size
+                    self._size += 1
+                    self._rows[id_] = row
+                    self._ids.append(id_)
+                    self._texts.append(text)
+                    self._metadatas.append(dict(meta or {}))
+                else:
+                    self._texts[row] = text
+                    self._metadatas[row] = dict(meta or {})
+                self._vectors[row] = vec
+            self._changed.update(ids)
+            self._deleted.difference_update(ids)
+            self._columns.clear()
+        return ids
+
+    def update_metadatas(self, ids: Sequence[str], metadatas: Sequence[dict]) -> None:
+        with self._lock:
+            for id_, meta in zip(ids, metadatas, strict=True):
+                self._metadatas[self._rows[id_]] = dict(meta)
+            self._changed.update(ids)
+            self._columns.clear()
+
+    def delete(self, ids: list[str] | None = None, **kwargs: Any) -> bool | None:
+        with self._lock:
+            for id_ in ids or []:
+                row = self._rows.pop(id_, None)
+                if row is None:
+                    continue
+                self._changed.discard(id_)
+                self._deleted.add(id_)
+                last = self._size - 1
+                if row != last:
+                    # Keep rows contiguous: move the last row into the hole.
+                    self._writable(self.dim, 0)
+                    self._vectors[row] = self._vectors[last]
+                    self._ids[row] = self._ids[last]
+                    self._texts[row] = self._texts[last]
+                    self._metadatas[row] = self._metadatas[last]
+                    self._rows[self._ids[row]] = row
+                self._ids.pop()
+                self._texts.pop()
+                self._metadatas.pop()
+                self._size = last
+            self._columns.clear()
+        return True
+
+    def _writable(self, dim: int, extra: int) -> None:
+        """Ensure an in-memory matrix (not a read-only memmap) with room for ``extra`` rows."""
+
+        if self._vectors.shape[1] not in (0, dim) and self._size:
+            raise ValueError(f"Embedding size {dim} does not match the store's {self.dim}")
+        capacity = self._vectors.shape[0]
+        needed = self._size + extra
+        if needed <= capacity and self._vectors.flags.writeable and self._vectors.shape[1] == dim:
+            return
+        grown = np.empty((max(needed, 2 * capacity, 1024), dim), dtype=np.float32)
+        if self._size:
+            grown[: self._size] = self._vectors[: self._size]
+        self._vectors = grown
+
+    # -- reads ----------------------------------------------------------------
+
+    def get_by_ids(self, ids: Sequence[str], /) -> list[Document]:
+        with self._lock:
+            rows = [self._rows[i] for i in ids if i in self._rows]
+            return [self._document(r) for r in rows]
+
+    def get(
+        self,
+        ids: Sequence[str] | None = None,
+        where: dict | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+    ) -> dict[str, Any]:
+        """Chroma-style ``get``: matching rows as ``{"ids", "documents", "metadatas"}``."""
+
+        with self._lock:
+            if ids is not None:
+                rows = np.array([self._rows[i] for i in ids if i in self._rows], dtype=np.int64)
+            else:
+                rows = np.arange(self._size)
+            mask = self._mask(where)
+            if mask is not None:
+                rows = rows[mask[rows]]
+            rows = rows[offset or 0 :]
+            if limit is not None:
+                rows = rows[:limit]
+            return {
+                "ids": [self._ids[r] for r in rows],
+                "documents": [self._texts[r] for r in rows] if "documents" in include else None,
+                "metadatas": (
+                    [dict(self._metadatas[r]) for r in rows] if "metadatas" in include else None
+                ),
+            }
+
+    def similarity_search(
+        self, query: str, k: int = 4, filter: dict | None = None, **kwargs: Any
+    ) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, filter: dict | None = None, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(
+            self._embedding.embed_query(query), k, filter
+        )
+
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 4, filter: dict | None = None, **kwargs: Any
+    ) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k, filter)]
+
+    def similarity_search_by_vector_with_score(
+        self, embedding: Sequence[float], k: int = 4, filter: dict | None = None
+    ) -> list[tuple[Document, float]]:
+        query = _normalized(np.asarray(embedding, dtype=np.float32)[None, :])[0]
+        with self._lock:
+            if not self._size:
+                return []
+            mask = self._mask(filter)
+            if mask is None:
+                rows = None
+                sims = self._vectors[: self._size] @ query
+            else:
+                rows = np.flatnonzero(mask)
+                if not len(rows):
+                    return []
+                sims = self._vectors[rows] @ query
+            top = _top_k(sims, k)
+            hits = top if rows is None else rows[top]
+            return [(self._document(r), float(1.0 - s)) for r, s in zip(hits, sims[top])]
+
+    def _select_relevance_score_fn(self):
+        return self._cosine_relevance_score_fn
+
+    def _document(self, row: int) -> Document:
+        return Document(
+            id=self._ids[row], page_content=self._texts[row], metadata=dict(self._metadatas[row])
+        )
+
+    # -- metadata filters -----------------------------------------------------
+
+    def _column(self, key: str) -> tuple[np.ndarray, dict[Any, int], np.ndarray]:
+        """Per-key integer codes (-1: missing), the value->code map and numeric values."""
+
+        column = self._columns.get(key)
+        if column is None:
+            codes_of: dict[Any, int] = {}
+            values = [m.get(key, _MISSING) for m in self._metadatas[: self._size]]
+            codes = np.fromiter(
+                (-1 if v is _MISSING else codes_of.setdefault(v, len(codes_of)) for v in values),
+                dtype=np.int32,
+                count=len(values),
+            )
+            numbers = np.fromiter((_number(v) for v in values), dtype=np.float64, count=len(values))
+            column = self._columns[key] = (codes, codes_of, numbers)
+        return column
+
+    def _mask(self, where: dict | None) -> np.ndarray | None:
+        if not where:
+            return None
+        masks = []
+        for key, cond in where.items():
+            if key in ("$and", "$or"):
+                parts = [self._mask(c) for c in cond]
+                parts = [p for p in parts if p is not None]
+                if parts:
+                    combine = np.logical_and if key == "$and" else np.logical_or
+                    masks.append(combine.reduce(parts))
+                continue
+            masks.append(self._field_mask(key, cond))
+        return np.logical_and.reduce(masks) if masks else None
+
+    def _field_mask(self, key: str, cond: Any) -> np.ndarray:
+        codes, codes_of, numbers = self._column(key)
+        if not isinstance(cond, dict):
+            cond = {"$eq": cond}
+        mask = np.ones(self._size, dtype=bool)
+        for op, value in cond.items():
+            if op in ("$eq", "$ne"):
+                hit = codes == codes_of.get(value, -2)
+                mask &= hit if op == "$eq" else (~hit & (codes >= 0))
+            elif op in ("$in", "$nin"):
+                wanted = [codes_of[v] for v in value if v in codes_of]
+                hit = np.isin(codes, wanted)
+                mask &= hit if op == "$in" else (~hit & (codes >= 0))
+            elif op in _COMPARE:
+                with np.errstate(invalid="ignore"):
+                    mask &= _COMPARE[op](numbers, float(value))
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+        return mask
+
+    # -- persistence ----------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the store to ``path`` atomically (no-op without a path).
+
+        Vectors go to a fresh ``.npy`` file; ``records.json`` is then swapped in to
+        point at it, so a crash leaves either the old or the new store, never a mix.
+
+        Call it while holding the directory's ``StoreWriter``. If another process
+        saved since this store was loaded, its copy is reloaded first and this
+        store's own writes are replayed on top, so neither side's chunks are lost.
+        """
+
+        if self.path is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            version = self._version()
+            if version is not None and version != self._disk_version:
+                self._merge_from_disk()
+            name = f"vectors-{uuid.uuid4().hex[:12]}.npy"
+            np.save(self.path / name, np.ascontiguousarray(self._vectors[: self._size]))
+            records = {
+                "vectors": name,
+                "ids": self._ids,
+                "texts": self._texts,
+                "metadatas": self._metadatas,
+            }
+            tmp = self.path / (RECORDS_NAME + ".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(records, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path / RECORDS_NAME)
+            self._disk_version = self._version()
+            self._changed.clear()
+            self._deleted.clear()
+            if isinstance(self._vectors, np.memmap):
+                # Still mapping the previous file (e.g. only metadata changed): move
+                # to the new one so the old file can be deleted.
+                self._vectors = np.load(self.path / name, mmap_mode="r")
+            for old in self.path.glob("vectors-*.npy"):
+                if old.name == name:
+                    continue
+                try:
+                    old.unlink(missing_ok=True)
+                except OSError:
+                    # Windows refuses while another store still maps the file; a
+                    # later save deletes it.
+                    pass
+
+    def _version(self) -> tuple[int, int] | None:
+        """Identity of ``records.json`` on disk (``save`` always swaps in a new file)."""
+
+        assert self.path is not None
+        try:
+            st = (self.path / RECORDS_NAME).stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+
+    def _merge_from_disk(self) -> None:
+        upserts = [self._rows[i] for i in self._changed if i in self._rows]
+        ids = [self._ids[r] for r in upserts]
+        texts = [self._texts[r] for r in upserts]
+        metadatas = [self._metadatas[r] for r in upserts]
+        vectors = np.array(self._vectors[upserts], dtype=np.float32)
+        deleted = list(self._deleted)
+        self._load()
+        self.delete(deleted)
+        self.add_embeddings(texts, vectors, metadatas, ids)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        self._disk_version = self._version()
+        records = json.loads((self.path / RECORDS_NAME).read_text(encoding="utf-8"))
+        # Read-only memmap: the OS pages vectors in on demand; the first write copies.
+        self._vectors = np.load(self.path / records["vectors"], mmap_mode="r")
+        self._ids = records["ids"]
+        self._texts = records["texts"]
+        self._metadatas = records["metadatas"]
+        self._size = len(self._ids)
+        self._rows = {id_: row for row, id_ in enumerate(self._ids)}
+        self._columns.clear()
+        if self._vectors.shape[0] != self._size:
+            raise ValueError(f"{self.path} is inconsistent: vectors and records differ in size")
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> NumpyVectorStore:
+        store = cls(embedding, path=kwargs.get("path"))
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
+
+
+_COMPARE = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return float("nan")
+
+
+def _normalized(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest scores, best first."""
+
+    if k <= 0 or not len(scores):
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        part = np.argpartition(-scores, k - 1)[:k]
+    else:
+        part = np.arange(len(scores))
+    return part[np.argsort(-scores[part], kind="stable")]
@@ -0,0 +1,122 @@
+"""Single-writer locking for a persistent Chroma directory.
+
+Chroma commits each write batch atomically (SQLite), but two processes writing one
+directory (an old and a new server during a deploy, or the ingest CLI next to the
+app) can still corrupt its index. ``StoreWriter`` makes writers take turns: a
+thread lock inside the process plus an OS file lock across processes. Readers never
+take it.
+
+While a writer holds the lock, a small marker file (written atomically) records who
+is writing. A marker that outlives its writer means that write died or failed
+mid-ingest; the chunks it did commit are intact, and re-ingesting the same files fills in the
+rest (chunk IDs are deterministic, so nothing is duplicated).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: thread lock only (one server process per directory)
+    fcntl = None  # type: ignore[assignment]
+
+LOCK_NAME = ".lexiq-writer.lock"
+MARKER_NAME = ".lexiq-writing.json"
+
+
+class StoreWriter:
+    """``with writer:`` blocks until this process and thread is the directory's only writer."""
+
+    def __init__(self, persist_dir: str, label: str = "ingest"):
+        self.dir = Path(persist_dir)
+        self.label = label
+        self._thread_lock = threading.Lock()
+        self._fd: int | None = None
+
+    @property
+    def lock_path(self) -> Path:
+        return self.dir / LOCK_NAME
+
+    @property
+    def marker_path(self) -> Path:
+        return self.dir / MARKER_NAME
+
+    def __enter__(self) -> StoreWriter:
+        self._thread_lock.acquire()
+        try:
+            self._fd = self._lock_file(blocking=True)
+            self._write_marker()
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        try:
+            # A failed write leaves its marker behind, like a crash would.
+            if exc_type is None:
+                self.marker_path.unlink(missing_ok=True)
+        finally:
+            self._release()
+
+    def interrupted(self) -> dict | None:
+        """The marker of a writer that died mid-write, or ``None``.
+
+        A marker whose writer still holds the lock is a write in progress, not an
+        interruption.
+        """
+
+        if not self.marker_path.exists() or not self._thread_lock.acquire(blocking=False):
+            return None
+        try:
+            fd = self._lock_file(blocking=False)
+        except BlockingIOError:
+            self._thread_lock.release()
+            return None
+        try:
+            return json.loads(self.marker_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        finally:
+            _unlock_file(fd)
+            self._thread_lock.release()
+
+    def _lock_file(self, blocking: bool) -> int | None:
+        if fcntl is None:
+            return None
+        self.dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    def _release(self) -> None:
+        fd, self._fd = self._fd, None
+        try:
+            _unlock_file(fd)
+        finally:
+            self._thread_lock.release()
+
+    def _write_marker(self) -> None:
+        tmp = self.marker_path.with_name(MARKER_NAME + ".tmp")
+        payload = {"pid": os.getpid(), "label": self.label, "started_at": time.time()}
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(payload, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.marker_path)
+
+
+def _unlock_file(fd: int | None) -> None:
+    if fd is None or fcntl is None:
+        return
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
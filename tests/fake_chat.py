@@ -0,0 +1,79 @@
+"""Offline chat models for tests and benchmarks."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk
+
+
+_lock = threading.Lock()
+
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+class SlowChatModel(FakeListChatModel):
+    """``FakeListChatModel`` that takes ``latency_s`` per call and counts calls.
+
+    With ``token_interval_s`` it behaves like a streaming API: ``latency_s`` before the
+    first token, then one word-sized token every ``token_interval_s``. Non-streaming
+    calls take the same total time.
+
+    ``routes`` maps a marker to a fixed reply for any prompt whose last message
+    contains it, so concurrent callers get deterministic answers; other prompts cycle
+    through ``responses``.
+
+    ``max_in_flight`` records the most calls that were running at once.
+    """
+
+    latency_s: float = 0.0
+    token_interval_s: float = 0.0
+    routes: dict[str, str] = {}
+    calls: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def _respond(self, messages: list[BaseMessage], *args: Any, **kwargs: Any) -> str:
+        self.calls += 1
+        prompt = str(messages[-1].content) if messages else ""
+        for marker, reply in self.routes.items():
+            if marker in prompt:
+                return reply
+        return super()._call(messages, *args, **kwargs)
+
+    def _enter(self) -> None:
+        with _lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _leave(self) -> None:
+        with _lock:
+            self.in_flight -= 1
+
+    def _call(self, *args: Any, **kwargs: Any) -> str:
+        self._enter()
+        try:
+            response = self._respond(*args, **kwargs)
+            time.sleep(self.latency_s + self.token_interval_s * len(_tokens(response)))
+            return response
+        finally:
+            self._leave()
+
+    def _stream(self, *args: Any, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        self._enter()
+        try:
+            response = self._respond(*args, **kwargs)
+            time.sleep(self.latency_s)
+            for token in _tokens(response):
+                time.sleep(self.token_interval_s)
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        finally:
+            self._leave()
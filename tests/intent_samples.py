@@ -0,0 +1,94 @@
+"""Labeled chat messages for evaluating intent classification.
+
+Written independently of ``uae_legal_rag.intent.SEED_EXAMPLES`` (the model's training
+phrases); used by ``tests/test_intent.py`` and ``benchmarks/bench_intent.py``.
+"""
+
+from __future__ import annotations
+
+LABELED_MESSAGES: list[tuple[str, str]] = [
+    # greeting
+    ("Hey, good to see you", "greeting"),
+    ("hello", "greeting"),
+    ("Hey there 👋", "greeting"),
+    ("Good afternoon", "greeting"),
+    ("good morning, how are you?", "greeting"),
+    ("Salam", "greeting"),
+    ("Marhaba!", "greeting"),
+    ("hiya", "greeting"),
+    ("Thanks a lot!", "greeting"),
+    ("ok thank you", "greeting"),
+    ("Hello LexiQ", "greeting"),
+    ("hey, how are you doing today?", "greeting"),
+    ("Goodbye", "greeting"),
+    ("Greetings!", "greeting"),
+    ("hi again", "greeting"),
+    ("Pleased to meet you!", "greeting"),
+    # about
+    ("Who am I talking to?", "about"),
+    ("What can you do for me?", "about"),
+    ("who built you", "about"),
+    ("Which company created you?", "about"),
+    ("Are you a real lawyer?", "about"),
+    ("Are you AI?", "about"),
+    ("What's your name?", "about"),
+    ("Introduce yourself", "about"),
+    ("How do you work under the hood?", "about"),
+    ("What model are you based on?", "about"),
+    ("What are your limitations?", "about"),
+    ("what is LexiQ", "about"),
+    ("Can you give me legal advice?", "about"),
+    ("Do you keep a copy of my files?", "about"),
+    ("What languages can you speak?", "about"),
+    ("what kind of things can I ask you", "about"),
+    # general
+    ("What's the weather like in Dubai?", "general"),
+    ("What is 15% of 240?", "general"),
+    ("Write me a haiku about the sea", "general"),
+    ("How do I reverse a string in Python?", "general"),
+    ("Who is the president of France?", "general"),
+    ("Tell me a fun fact", "general"),
+    ("Recommend a restaurant in Abu Dhabi", "general"),
+    ("How many days until Ramadan?", "general"),
+    ("Translate 'good night' to Arabic", "general"),
+    ("What's a healthy breakfast?", "general"),
+    ("Explain how black holes form", "general"),
+    ("what time is it in London", "general"),
+    ("How tall is Mount Everest?", "general"),
+    ("Can you help me plan a trip to Oman?", "general"),
+    ("What is the population of the UAE?", "general"),
+    ("Give me a recipe for hummus", "general"),
+    # document
+    ("Summarize the agreement", "document"),
+    ("What are the key risks?", "document"),
+    ("Termination clauses?", "document"),
+    ("Liability limits?", "document"),
+    ("What are the important dates?", "document"),
+    ("What notice do I need to give to leave?", "document"),
+    ("Is there an indemnity?", "document"),
+    ("Who pays if the goods arrive damaged?", "document"),
+    ("Can the employer change my salary?", "document"),
+    ("What is the governing law?", "document"),
+    ("Are disputes resolved by arbitration?", "document"),
+    ("Does the NDA survive termination?", "document"),
+    ("How long is the confidentiality period?", "document"),
+    ("What are the late payment fees?", "document"),
+    ("Is personal data shared with third parties?", "document"),
+    ("What happens if the tenant pays late?", "document"),
+    ("When does the lease end?", "document"),
+    ("Explain clause 7.2", "document"),
+    ("What are my obligations under this?", "document"),
+    ("Am I restricted from joining a competitor?", "document"),
+    ("Can I terminate early?", "document"),
+    ("What does it say about renewal?", "document"),
+    ("List all the deadlines", "document"),
+    ("Are there any red flags I should know about?", "document"),
+    ("Who owns the intellectual property?", "document"),
+    ("Is it safe to sign this?", "document"),
+    ("What are the penalties for late delivery?", "document"),
+    ("How is the price calculated?", "document"),
+    ("What is the expiry date of this contract?", "document"),
+    ("What happens if I quit?", "document"),
+    ("Does it mention force majeure?", "document"),
+    ("what does schedule 2 cover", "document"),
+]
@@ -0,0 +1,261 @@
+"""Local OpenAI-compatible HTTP stand-in for tests and benchmarks.
+
+Serves ``POST /v1/embeddings`` (deterministic vectors) and ``POST
+/v1/chat/completions`` after an injected latency. It can answer 429 (with
+``retry-after``) whenever more requests are in flight than ``rate_limit_concurrency``
+allows, or to the first ``throttle_first`` requests, and can charge ``connect_latency_s`` once per new connection to stand in for
+a TLS handshake.
+
+Chat replies are ``reply``, or ``routes[marker]`` when the last message contains
+``marker``, or ``structured_reply`` (a JSON string) when the request asks for a
+``response_format``. Each completion token costs ``token_latency_s``; ``stream=true``
+requests get server-sent events, one chunk per token. ``usage`` reports approximate
+token counts (words and punctuation), which also accumulate in ``prompt_tokens`` and
+``completion_tokens``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import re
+import time
+from array import array
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+EMBEDDING_DIM = 8
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_PIECE = re.compile(r"\s*(?:\w+|[^\w\s])|\s+$")
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog (5) drops bursts of new connections, which then
+    # retry after a second and look like server latency.
+    request_queue_size = 1024
+
+
+def approx_tokens(text: str) -> int:
+    return len(_TOKEN.findall(text))
+
+
+def stub_vector(item: str | list[int]) -> list[float]:
+    """Vector the stub returns for an input string (or token list)."""
+
+    raw = item if isinstance(item, str) else ",".join(map(str, item))
+    digest = hashlib.sha256(raw.encode("utf-8")).digest()
+    # float32-exact, so the base64 transport round-trips it unchanged.
+    return array("f", [b / 255.0 for b in digest[:EMBEDDING_DIM]]).tolist()
+
+
+class OpenAIStub:
+    """``with OpenAIStub(latency_s=0.05) as stub: OpenAIEmbeddings(base_url=stub.base_url)``"""
+
+    def __init__(
+        self,
+        latency_s: float = 0.0,
+        rate_limit_concurrency: int | None = None,
+        retry_after_s: float = 0.05,
+        connect_latency_s: float = 0.0,
+        reply: str = "Stub reply.",
+        routes: dict[str, str] | None = None,
+        structured_reply: str | None = None,
+        token_latency_s: float = 0.0,
+        throttle_first: int = 0,
+    ):
+        self.latency_s = latency_s
+        self.connect_latency_s = connect_latency_s
+        self.reply = reply
+        self.routes = routes or {}
+        self.structured_reply = structured_reply
+        self.token_latency_s = token_latency_s
+        self.connections = 0
+        self.rate_limit_concurrency = rate_limit_concurrency
+        self.retry_after_s = retry_after_s
+        self.throttle_first = throttle_first
+        self.requests = 0
+        self.throttled = 0
+        self.inputs = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self) -> OpenAIStub:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _admit(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            limit = self.rate_limit_concurrency
+            over_limit = limit is not None and self._in_flight >= limit
+            if over_limit or self.requests <= self.throttle_first:
+                self.throttled += 1
+                return False
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            return True
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this, Nagle plus
+            # delayed ACKs add ~40 ms to every response.
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def setup(self) -> None:
+                # One handler instance per connection (keep-alive reuses it).
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                time.sleep(stub.connect_latency_s)
+
+            def _send(self, status: int, payload: dict, headers: dict | None = None) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_events(self, events: Iterator[dict]) -> None:
+                self.send_response(200)
+                self.send_header("content-type", "text/event-stream")
+                self.send_header("transfer-encoding", "chunked")
+                self.end_headers()
+                for event in events:
+                    self._write_chunk(f"data: {json.dumps(event)}\n\n".encode())
+                self._write_chunk(b"data: [DONE]\n\n")
+                self._write_chunk(b"")
+
+            def _write_chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("content-length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not stub._admit():
+                    self._send(
+                        429,
+                        {"error": {"message": "Rate limit reached", "type": "requests"}},
+                        {"retry-after": str(stub.retry_after_s)},
+                    )
+                    return
+                try:
+                    time.sleep(stub.latency_s)
+                    if self.path.rstrip("/").endswith("/embeddings"):
+                        self._send(200, stub._embeddings(request))
+                    elif self.path.rstrip("/").endswith("/chat/completions"):
+                        if request.get("stream"):
+                            self._send_events(stub._chat_events(request))
+                        else:
+                            self._send(200, stub._chat(request))
+                    else:
+                        self._send(404, {"error": {"message": f"no route {self.path}"}})
+                finally:
+                    stub._leave()
+
+        return Handler
+
+    def _embeddings(self, request: dict) -> dict:
+        items = request["input"]
+        if isinstance(items, str) or (items and isinstance(items[0], int)):
+            items = [items]
+        with self._lock:
+            self.inputs += len(items)
+
+        def encode(vec: list[float]) -> list[float] | str:
+            # The openai client asks for base64 float32 unless a format is given.
+            if request.get("encoding_format") == "base64":
+                return base64.b64encode(array("f", vec).tobytes()).decode()
+            return vec
+
+        return {
+            "object": "list",
+            "model": request.get("model", "stub"),
+            "data": [
+                {"object": "embedding", "index": i, "embedding": encode(stub_vector(item))}
+                for i, item in enumerate(items)
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    def _chat_reply(self, request: dict) -> tuple[str, dict]:
+        messages = request.get("messages") or [{}]
+        last = str(messages[-1].get("content", ""))
+        reply = next((r for marker, r in self.routes.items() if marker in last), self.reply)
+        if request.get("response_format") and self.structured_reply is not None:
+            reply = self.structured_reply
+        prompt_tokens = sum(approx_tokens(str(m.get("content", ""))) for m in messages)
+        completion_tokens = approx_tokens(reply)
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return reply, usage
+
+    def _chat(self, request: dict) -> dict:
+        reply, usage = self._chat_reply(request)
+        time.sleep(self.token_latency_s * usage["completion_tokens"])
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    def _chat_events(self, request: dict) -> Iterator[dict]:
+        reply, usage = self._chat_reply(request)
+        base = {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+        }
+        for i, piece in enumerate(_PIECE.findall(reply)):
+            time.sleep(self.token_latency_s)
+            delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+            yield {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        yield {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        if (request.get("stream_options") or {}).get("include_usage"):
+            yield {**base, "choices": [], "usage": usage}
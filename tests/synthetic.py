@@ -0,0 +1,142 @@
+"""Synthetic contract text and PDFs shared by tests and benchmarks."""
+
+from __future__ import annotations
+
+import io
+import random
+
+CLAUSE_TEMPLATES = [
+    "The Supplier shall provide the Services in accordance with the Service Levels set out "
+    "in Schedule {n}.",
+    "Either party may terminate this Agreement by giving not less than {n} days written "
+    "notice to the other party.",
+    "The Client shall pay all fees within {n} days of the invoice date; a late fee of {n}% "
+    "applies to overdue amounts.",
+    "Neither party's aggregate liability under this Agreement shall exceed the fees paid in "
+    "the preceding {n} months.",
+    "Each party shall keep confidential all Confidential Information received from the "
+    "other party for {n} years.",
+    "Personal data shall be processed in accordance with the PDPL and applicable data "
+    "protection law.",
+    "This Agreement is governed by the laws of the Emirate of Dubai and the courts of the "
+    "DIFC have jurisdiction.",
+    "The Supplier shall indemnify and hold harmless the Client against all losses arising "
+    "from a breach of clause {n}.",
+    "Liquidated damages of AED {n},000 per day shall apply for each day of delay.",
+    "The Parties agree that any dispute shall be referred to arbitration under the DIAC rules.",
+]
+
+
+def clause_text(rng: random.Random, n_sentences: int = 8) -> str:
+    return " ".join(
+        rng.choice(CLAUSE_TEMPLATES).format(n=rng.randint(1, 90)) for _ in range(n_sentences)
+    )
+
+
+def synthetic_page_text(page_no: int, rng: random.Random, n_clauses: int = 6) -> str:
+    lines = [f"MASTER SERVICES AGREEMENT - PAGE {page_no}"]
+    for c in range(1, n_clauses + 1):
+        lines.append(f"{page_no}.{c} {clause_text(rng, rng.randint(2, 4))}")
+    return "\n\n".join(lines)
+
+
+HEADINGS = [
+    "DEFINITIONS",
+    "SERVICES",
+    "FEES AND PAYMENT",
+    "CONFIDENTIALITY",
+    "DATA PROTECTION",
+    "LIABILITY",
+    "TERMINATION",
+    "GOVERNING LAW",
+]
+
+
+def synthetic_contract_pages(
+    n_clauses: int, rng: random.Random, page_chars: int = 3500
+) -> list[tuple[str, list[str]]]:
+    """A numbered contract (recitals, clauses with sub-clauses, a schedule) cut into pages.
+
+    Returns ``(page_text, clause_numbers_started_on_page)`` per page.
+    """
+
+    units: list[tuple[str, str | None]] = [
+        ("WHEREAS the Client wishes to appoint the Supplier to provide the Services.", None),
+        ("WHEREAS the Supplier has agreed to provide the Services on these terms.", None),
+    ]
+    for c in range(1, n_clauses + 1):
+        units.append((f"{c}. {HEADINGS[(c - 1) % len(HEADINGS)]}", None))
+        for s in range(1, rng.randint(2, 5)):
+            units.append((f"{c}.{s} {clause_text(rng, rng.randint(1, 3))}", f"{c}.{s}"))
+            if rng.random() < 0.3:
+                for t in range(1, rng.randint(2, 3)):
+                    units.append(
+                        (f"{c}.{s}.{t} {clause_text(rng, rng.randint(1, 2))}", f"{c}.{s}.{t}")
+                    )
+    units.append(("SCHEDULE 1 SERVICE LEVELS", None))
+    units.append((clause_text(rng, 4), None))
+
+    pages: list[tuple[str, list[str]]] = []
+    lines: list[str] = []
+    numbers: list[str] = []
+    for text, number in units:
+        if lines and sum(len(x) for x in lines) + len(text) > page_chars:
+            pages.append(("\n".join(lines), numbers))
+            lines, numbers = [], []
+        lines.append(text)
+        if number:
+            numbers.append(number)
+    pages.append(("\n".join(lines), numbers))
+    return pages
+
+
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(text: str, width: int = 95) -> list[str]:
+    out: list[str] = []
+    for para in text.split("\n"):
+        line = ""
+        for word in para.split():
+            if line and len(line) + len(word) + 1 > width:
+                out.append(line)
+                line = word
+            else:
+                line = f"{line} {word}".strip()
+        out.append(line)
+    return out
+
+
+def make_synthetic_pdf(num_pages: int, seed: int = 7) -> bytes:
+    """Build a text-layered PDF of ``num_pages`` contract-like pages."""
+
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    rng = random.Random(seed)
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    font_ref = writer._add_object(font)
+    for page_no in range(1, num_pages + 1):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref})}
+        )
+        ops = ["BT", "/F1 9 Tf", "11 TL", "50 750 Td"]
+        for line in _wrap(synthetic_page_text(page_no, rng))[:64]:
+            ops.append(f"({_pdf_escape(line)}) Tj T*")
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.cache.embeddings import CachedEmbeddings
+
+
+class CountingEmbeddings(DeterministicEmbeddings):
+    def __init__(self):
+        super().__init__()
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+def test_embedding_cache_embeds_only_misses(tmp_path):
+    inner = CountingEmbeddings()
+    emb = CachedEmbeddings(inner, model="m", db_path=str(tmp_path / "e.sqlite"))
+
+    first = emb.embed_documents(["penalty clause", "pdpl data", "penalty clause"])
+    assert inner.embedded == ["penalty clause", "pdpl data"]
+
+    # A new wrapper over the same file (e.g. a new session) still hits.
+    emb2 = CachedEmbeddings(inner, model="m", db_path=str(tmp_path / "e.sqlite"))
+    again = emb2.embed_documents(["pdpl  data", "termination"])
+    assert inner.embedded[-1:] == ["termination"]
+    assert again[0] == first[1]
+    assert (emb2.stats.hits, emb2.stats.misses) == (1, 1)
+
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path):
+    inner = CountingEmbeddings()
+    emb = CachedEmbeddings(inner, model="m", db_path=str(tmp_path / "e.sqlite"), max_entries=2)
+
+    emb.embed_documents(["a"])
+    emb.embed_documents(["b"])
+    emb.embed_documents(["a"])  # refresh "a"
+    emb.embed_documents(["c"])  # evicts "b"
+
+    assert emb.entry_count() == 2
+    assert emb.stats.evictions == 1
+    inner.embedded.clear()
+    emb.embed_documents(["a", "b"])
+    assert inner.embedded == ["b"]
+
+
+def test_page_cache_skips_parsing_on_repeat(tmp_path, monkeypatch):
+    from synthetic import make_synthetic_pdf
+
+    from uae_legal_rag.cache.pages import PageTextCache
+    from uae_legal_rag.ingestion import loaders
+    from uae_legal_rag.ingestion.pdf_backends import available_backends
+
+    pdf = make_synthetic_pdf(4)
+    cache = PageTextCache(str(tmp_path / "pages.sqlite"))
+    first = loaders.load_pdf_bytes(pdf, "msa.pdf", max_workers=1, page_cache=cache)
+
+    def no_parse(*_a, **_k):
+        raise AssertionError("PDF parsed despite cache hit")
+
+    for backend in available_backends():
+        monkeypatch.setattr(type(backend), "open", no_parse)
+    again = loaders.load_pdf_bytes(pdf, "renamed.pdf", page_cache=cache)
+    n_pages, streamed = loaders.open_pdf_pages(pdf, "renamed.pdf", cache)
+
+    assert [d.page_content for d in again] == [d.page_content for d in first]
+    assert {d.metadata["filename"] for d in again} == {"renamed.pdf"}
+    assert n_pages == 4 and [d.metadata for d in streamed] == [d.metadata for d in again]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.pages_served) == (2, 1, 8)
+
+
+def test_streamed_pdf_is_hashed_in_place_and_cached_as_it_is_extracted(tmp_path):
+    import io
+
+    from synthetic import make_synthetic_pdf
+
+    from uae_legal_rag.cache import pages as page_cache
+    from uae_legal_rag.ingestion import loaders
+    from uae_legal_rag.ingestion.pdf_backends import get_backend
+
+    pdf = make_synthetic_pdf(5)
+    cache = page_cache.PageTextCache(str(tmp_path / "pages.sqlite"))
+
+    class ChunkedOnly(io.BytesIO):
+        def read(self, size=-1):
+            assert 0 <= size < len(pdf), "whole PDF read into memory"
+            return super().read(size)
+
+    stream = ChunkedOnly(pdf)
+
+    n_pages, streamed = loaders.open_pdf_pages(stream, "msa.pdf", cache, "pypdf")
+    extractor = get_backend("pypdf").extractor_id
+    key = page_cache.document_key(pdf, extractor)
+    assert n_pages == 5 and page_cache.document_key(io.BytesIO(pdf), extractor) == key
+    next(streamed)
+    streamed.close()  # abandoned halfway: nothing is kept
+    assert cache.get(key) is None
+
+    stream.seek(0)
+    _, streamed = loaders.open_pdf_pages(stream, "msa.pdf", cache, "pypdf")
+    texts = [d.page_content for d in streamed]
+    assert [t for t in cache.get(key) if t] == texts
+
+
+def test_page_writer_flushes_in_batches_and_drops_oversized_documents(tmp_path, monkeypatch):
+    from uae_legal_rag.cache import pages as page_cache
+
+    monkeypatch.setattr(page_cache, "WRITE_BATCH_PAGES", 2)
+    cache = page_cache.PageTextCache(str(tmp_path / "pages.sqlite"), max_bytes=10)
+    cache.put("a", ["old"])
+
+    writer = cache.writer("a")
+    for text in ["12", "34", "5"]:
+        writer.add(text)
+    assert writer._batch == [("a", 2, "5")]  # the first two pages are on disk already
+    assert cache.get("a") is None  # not visible until committed
+    writer.commit()
+    writer.discard()  # no-op once committed
+    assert cache.get("a") == ["12", "34", "5"]
+
+    writer = cache.writer("big")
+    for text in ["12345", "12345", "1"]:
+        writer.add(text)
+    writer.commit()
+    assert cache.get("big") is None and cache.total_bytes() == 5
+
+
+def test_page_cache_evicts_least_recently_used_documents(tmp_path):
+    from uae_legal_rag.cache.pages import PageTextCache
+
+    cache = PageTextCache(str(tmp_path / "pages.sqlite"), max_bytes=10)
+    cache.put("a", ["1234"])
+    cache.put("b", ["1234"])
+    assert cache.get("a") == ["1234"]  # refresh "a"
+    cache.put("c", ["", "1234"])  # evicts "b"
+    cache.put("huge", ["x" * 11])  # larger than the cap: not stored
+
+    assert cache.get("b") is None and cache.get("huge") is None
+    assert cache.get("a") == ["1234"] and cache.get("c") == ["", "1234"]
+    assert cache.stats.evictions == 1 and cache.total_bytes() == 8
+
+
+def test_llm_cache_answers_identical_calls_from_memory_and_disk(tmp_path):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from uae_legal_rag.cache.llm import LLMResponseCache
+
+    db = str(tmp_path / "llm.sqlite")
+    cache = LLMResponseCache(max_entries=2, db_path=db)
+    llm = FakeListChatModel(responses=["first", "second", "third"], cache=cache)
+
+    assert llm.invoke("Key risks?").content == "first"
+    assert llm.invoke("Key risks?").content == "first"
+    assert llm.invoke("Termination clauses?").content == "second"
+    assert (cache.stats.memory_hits, cache.stats.misses) == (1, 2)
+
+    # A fresh process (new memory tier) is served from SQLite.
+    restarted = LLMResponseCache(max_entries=2, db_path=db)
+    llm2 = FakeListChatModel(responses=["first", "second", "third"], cache=restarted)
+    assert llm2.invoke("Termination clauses?").content == "second"
+    assert llm2.invoke("Termination clauses?").content == "second"
+    assert (restarted.stats.disk_hits, restarted.stats.memory_hits) == (1, 1)
+    assert restarted.stats.misses == 0
+
+
+def test_llm_cache_expires_and_evicts():
+    import time
+
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from uae_legal_rag.cache.llm import LLMResponseCache
+
+    cache = LLMResponseCache(max_entries=1, ttl_s=0.05)
+    llm = FakeListChatModel(responses=["a", "b", "c", "d"], cache=cache)
+
+    assert llm.invoke("x").content == "a"
+    assert llm.invoke("y").content == "b"  # evicts "x"
+    assert llm.invoke("x").content == "c"
+    time.sleep(0.06)
+    assert llm.invoke("x").content == "d"
+    assert (cache.stats.evictions, cache.stats.expired, cache.stats.hits) == (2, 1, 0)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+from langchain_core.documents import Document
+from synthetic import synthetic_contract_pages
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.ingestion.chunking import chunk_documents, tag_sections, token_len
+from uae_legal_rag.rag.formatting import docs_to_context, pack_context, stitch_chunks
+from uae_legal_rag.rag.retriever import build_retriever, route_sections, section_filter
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
+
+
+def _passage(topic: str, n: int) -> str:
+    return " ".join(
+        f"Clause {i}: the {topic} obligations of the Supplier apply to every order."
+        for i in range(n)
+    )
+
+
+def _docs() -> list[Document]:
+    return [
+        Document(
+            page_content=_passage("payment", 20),
+            metadata={"filename": "msa.pdf", "page": 2, "score": 0.41},
+        ),
+        Document(
+            page_content=_passage("termination", 20),
+            metadata={
+                "filename": "msa.pdf",
+                "page": 7,
+                "score": 0.93,
+                "section_type": "termination",
+            },
+        ),
+        Document(
+            page_content=_passage("liability", 20),
+            metadata={"filename": "msa.pdf", "page": 9, "score": 0.62},
+        ),
+    ]
+
+
+def test_pack_context_fills_budget_by_score_and_trims_on_sentences():
+    docs = _docs()
+    per_passage = token_len(docs_to_context(docs[:1]))
+    budget = int(per_passage * 1.5)
+
+    context, stats = pack_context(docs, budget)
+
+    assert stats.tokens_packed <= budget
+    assert stats.tokens_full == token_len(docs_to_context(docs))
+    assert (stats.trimmed, stats.dropped) == (1, 1)
+    blocks = context.split("\n\n")
+    assert blocks[0].startswith("[msa.pdf | p.7] (termination)\n")
+    assert blocks[1].startswith("[msa.pdf | p.9]\n")
+    assert blocks[1].endswith("order.")
+    assert "p.2]" not in context
+
+
+def test_pack_context_keeps_everything_under_a_large_budget():
+    docs = sorted(_docs(), key=lambda d: -d.metadata["score"])
+
+    context, stats = pack_context(docs, 100_000)
+
+    assert context == docs_to_context(docs) == docs_to_context(docs, max_tokens=100_000)
+    assert stats.tokens_saved == 0 and stats.dropped == stats.trimmed == 0
+
+
+# The toy embeddings are not unit length, so Chroma's L2 relevance leaves [0, 1].
+@pytest.mark.filterwarnings("ignore:Relevance scores must be between")
+def test_retriever_records_relevance_scores():
+    vs = get_chroma(DeterministicEmbeddings(), persist_dir=None, collection_name="scored")
+    vs.add_documents(
+        [
+            Document(page_content="A penalty applies to late delivery.", metadata={"page": 1}),
+            Document(page_content="PDPL data protection applies.", metadata={"page": 2}),
+        ]
+    )
+
+    retriever = build_retriever(vs, k=2)
+    hits = retriever.invoke("penalty for late delivery")
+
+    assert [d.metadata["page"] for d in hits] == [1, 2]
+    assert hits[0].metadata["score"] > hits[1].metadata["score"]
+    assert asyncio.run(retriever.ainvoke("penalty for late delivery")) == hits
+
+
+def test_route_sections_uses_the_chunk_lexicon():
+    assert route_sections("Can we terminate early, and who indemnifies?") == [
+        "termination",
+        "liability",
+    ]
+    assert route_sections("Summarise the agreement") == []
+    assert section_filter(["payment"]) == {"has_payment": True}
+    assert section_filter([]) is None
+
+
+@pytest.mark.filterwarnings("ignore:Relevance scores must be between")
+@pytest.mark.parametrize("mode", ["dense", "hybrid"])
+def test_section_routing_prefilters_then_widens(mode):
+    vs = NumpyVectorStore(DeterministicEmbeddings())
+    chunks = [
+        Document(page_content="Termination for convenience on thirty days notice."),
+        Document(page_content="Late fees apply; we may terminate for non-payment."),
+        Document(page_content="A penalty applies to late payment of fees."),
+        Document(page_content="Penalty interest accrues on overdue invoices."),
+    ]
+    tag_sections(chunks)
+    vs.add_documents(chunks)
+    question = "When can we terminate, and what penalty applies?"
+
+    # The second chunk is primarily "termination" but counts for routing anyway.
+    routed = build_retriever(vs, k=2, mode=mode, route_sections=True).invoke(question)
+    assert all(d.metadata.get("has_termination") for d in routed)
+    assert build_retriever(vs, k=2, mode=mode).invoke(question) != routed
+
+    # Only two termination chunks exist, so k=3 widens to fill the last slot.
+    widened = build_retriever(vs, k=3, mode=mode, route_sections=True)
+    hits = widened.invoke(question)
+    assert [d.metadata.get("has_termination", False) for d in hits] == [True, True, False]
+    assert asyncio.run(widened.ainvoke(question)) == hits
+
+
+@pytest.mark.parametrize("strategy", ["recursive", "clause"])
+def test_chunks_record_page_offsets(strategy):
+    rng = random.Random(4)
+    pages = [
+        Document(page_content=text, metadata={"filename": "msa.pdf", "page": i + 1})
+        for i, (text, _) in enumerate(synthetic_contract_pages(60, rng, page_chars=12_000))
+    ]
+
+    chunks = chunk_documents(pages, strategy=strategy)
+
+    for c in chunks:
+        page = pages[c.metadata["page"] - 1].page_content
+        assert page[c.metadata["start_index"] : c.metadata["end_index"]] == c.page_content
+
+
+def test_stitch_merges_overlapping_hits_from_the_same_page():
+    rng = random.Random(4)
+    text, _ = synthetic_contract_pages(60, rng, page_chars=12_000)[0]
+    page = Document(page_content=text, metadata={"filename": "msa.pdf", "page": 1})
+    chunks = chunk_documents([page])
+    assert len(chunks) >= 3
+    a, b, c = chunks[:3]
+    a.metadata["score"], b.metadata["score"], c.metadata["score"] = 0.5, 0.9, 0.1
+    other = Document(page_content="Other page.", metadata={"filename": "msa.pdf", "page": 2})
+    other.metadata.update(start_index=0, end_index=11, score=0.7)
+
+    stitched = stitch_chunks([b, other, a])
+
+    assert len(stitched) == 2 and stitched[1] is other
+    merged = stitched[0]
+    start, end = a.metadata["start_index"], b.metadata["end_index"]
+    assert merged.page_content == text[start:end]
+    assert (merged.metadata["start_index"], merged.metadata["end_index"]) == (start, end)
+    assert merged.metadata["score"] == 0.9 and merged.metadata["stitched_chunks"] == 2
+    assert token_len(docs_to_context(stitched)) < token_len(docs_to_context([b, other, a]))
+    # a and c are not neighbours, so they stay separate.
+    assert len(stitch_chunks([a, c])) == 2
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+
+from langchain_openai import OpenAIEmbeddings
+from openai_stub import OpenAIStub, stub_vector
+
+from uae_legal_rag.embedding_scheduler import ConcurrentEmbeddings, token_batches
+
+
+def _client(stub: OpenAIStub) -> OpenAIEmbeddings:
+    return OpenAIEmbeddings(
+        model="text-embedding-3-small",
+        base_url=stub.base_url,
+        api_key="test",  # type: ignore[arg-type]
+        check_embedding_ctx_length=False,
+        max_retries=0,
+    )
+
+
+def test_token_batches_respect_limits():
+    texts = ["a" * 5, "b" * 5, "c" * 50, "d", "e", "f"]
+    batches = token_batches(texts, len, max_texts=2, max_tokens=12)
+
+    assert [list(r) for r in batches] == [[0, 1], [2], [3, 4], [5]]
+
+
+def test_concurrent_embeddings_keep_input_order():
+    texts = [f"clause {i} of the agreement" for i in range(120)]
+    with OpenAIStub(latency_s=0.02) as stub:
+        emb = ConcurrentEmbeddings(_client(stub), max_concurrency=4, batch_texts=8)
+        vectors = emb.embed_documents(texts)
+
+    assert vectors == [stub_vector(t) for t in texts]
+    assert stub.requests == emb.stats.requests == 15
+    assert stub.max_in_flight > 1
+
+
+def test_concurrent_embeddings_back_off_on_rate_limits():
+    texts = [f"indemnity clause {i}" for i in range(80)]
+    with OpenAIStub(latency_s=0.02, rate_limit_concurrency=2, retry_after_s=0.01) as stub:
+        emb = ConcurrentEmbeddings(_client(stub), max_concurrency=8, batch_texts=4)
+        vectors = emb.embed_documents(texts)
+
+    assert vectors == [stub_vector(t) for t in texts]
+    assert emb.stats.rate_limited == stub.throttled > 0
+    assert emb.stats.requests == 20
+    assert emb._limiter.limit < 8
+
+
+def test_query_embedding_retries_when_throttled():
+    with OpenAIStub(throttle_first=2, retry_after_s=0.01) as stub:
+        emb = ConcurrentEmbeddings(_client(stub))
+        vector = emb.embed_query("Can we terminate early?")
+        stub.throttle_first = stub.requests + 1
+        again = asyncio.run(emb.aembed_query("Can we terminate early?"))
+
+    assert vector == again == stub_vector("Can we terminate early?")
+    assert emb.stats.rate_limited == stub.throttled == 3
+    assert emb.stats.requests == 2
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from fake_chat import SlowChatModel
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+from langchain_openai import ChatOpenAI
+from openai_stub import OpenAIStub
+
+from uae_legal_rag.cache.llm import LLMResponseCache
+from uae_legal_rag.graph.legal_graph import (
+    LegalState,
+    astream_graph,
+    build_async_graph,
+    build_graph,
+    stream_graph,
+)
+
+DOCS = [
+    Document(
+        page_content="The Supplier shall indemnify the Buyer against all claims.",
+        metadata={"source": "msa.pdf", "page": 3},
+    )
+]
+RISK_REPLY = "The indemnity clause shifts all claims to the Supplier."
+ANSWER_REPLY = "The Supplier must indemnify the Buyer against all claims."
+
+
+# Markers from risk_prompt() / qa_prompt(); the two calls may run concurrently.
+ROUTES = {"**Analysis Request:**": RISK_REPLY, "**User Question:**": ANSWER_REPLY}
+
+
+def _llm(**kwargs) -> SlowChatModel:
+    return SlowChatModel(responses=["unused"], routes=ROUTES, **kwargs)
+
+
+def _graph(parallel: bool = True, llm: SlowChatModel | None = None, **kwargs):
+    llm = llm or _llm(**kwargs)
+    return build_graph(RunnableLambda(lambda q: DOCS), llm, parallel=parallel)
+
+
+def test_parallel_graph_matches_sequential_and_overlaps_llm_calls():
+    outputs = {}
+    for parallel in (False, True):
+        llm = _llm(latency_s=0.2)
+        raw = _graph(parallel=parallel, llm=llm).invoke(LegalState(question="Key risks?"))
+        outputs[parallel] = (LegalState.model_validate(raw), llm)
+
+    (seq, seq_llm), (par, par_llm) = outputs[False], outputs[True]
+    assert par.answer == seq.answer
+    assert par.answer.startswith(ANSWER_REPLY) and "Risk Assessment: High" in par.answer
+    assert seq_llm.calls == par_llm.calls == 2
+    assert seq_llm.max_in_flight == 1 and par_llm.max_in_flight == 2
+
+
+def test_stream_yields_risk_and_answer_tokens():
+    events = list(stream_graph(_graph(), LegalState(question="Key risks?")))
+    kinds = [kind for kind, _ in events]
+
+    assert kinds.count("risk") == 1 and kinds[-1] == "final"
+    assert dict(events)["risk"][0] == "High"
+    tokens = [payload for kind, payload in events if kind == "token"]
+    assert len(tokens) > 1
+    assert "".join(tokens) == ANSWER_REPLY
+
+    final = events[-1][1]
+    invoked = LegalState.model_validate(_graph().invoke(LegalState(question="Key risks?")))
+    assert final.answer == invoked.answer
+    assert final.answer.startswith(ANSWER_REPLY)
+
+
+def test_stream_replays_cached_answer():
+    cache = LLMResponseCache()
+    graph = _graph(cache=cache)
+    list(stream_graph(graph, LegalState(question="Key risks?")))
+    events = list(stream_graph(graph, LegalState(question="Key risks?")))
+
+    assert cache.stats.hits == 2
+    assert "".join(p for kind, p in events if kind == "token") == ANSWER_REPLY
+
+
+# openai's streamed structured parsing dumps the parsed model through a field typed None.
+@pytest.mark.filterwarnings("ignore:Pydantic serializer warnings")
+def test_structured_mode_makes_one_call_and_scores_findings():
+    reply = {
+        "answer": ANSWER_REPLY,
+        "findings": [
+            {
+                "clause": "The Supplier shall indemnify the Buyer against all claims.",
+                "issue": "Uncapped indemnity exposure for the Supplier.",
+                "severity": "High",
+            }
+        ],
+    }
+    with OpenAIStub(structured_reply=json.dumps(reply)) as stub:
+        llm = ChatOpenAI(model="gpt-stub", api_key="test-key", base_url=stub.base_url)
+        graph = build_graph(RunnableLambda(lambda q: DOCS), llm, mode="structured")
+        events = list(stream_graph(graph, LegalState(question="Key risks?")))
+        chat_calls = stub.requests
+
+    assert chat_calls == 1
+    assert [kind for kind, _ in events] == ["risk", "final"]
+    final = events[-1][1]
+    assert final.risk_level == "High" and "indemnity" in final.risk_explanation
+    assert final.analysis.startswith("- [High] The Supplier shall indemnify")
+    assert final.answer.startswith(ANSWER_REPLY) and "Risk Assessment: High" in final.answer
+
+
+def test_async_graph_serves_concurrent_questions_on_one_loop():
+    with OpenAIStub(latency_s=0.2, routes=ROUTES) as stub:
+        llm = ChatOpenAI(model="gpt-stub", api_key="test-key", base_url=stub.base_url)
+        retriever = RunnableLambda(lambda q: DOCS)
+        sync_state = LegalState.model_validate(
+            build_graph(retriever, llm).invoke(LegalState(question="Key risks?"))
+        )
+        graph = build_async_graph(retriever, llm)
+
+        async def main():
+            questions = [LegalState(question=f"Key risks {i}?") for i in range(8)]
+            results = await asyncio.gather(*(graph.ainvoke(q) for q in questions))
+            events = [e async for e in astream_graph(graph, LegalState(question="Key risks?"))]
+            return results, events
+
+        results, events = asyncio.run(main())
+
+    assert stub.requests == 2 + 16 + 2
+    # One question runs at most two calls at once; more means questions overlapped.
+    assert stub.max_in_flight > 2
+    assert all(LegalState.model_validate(r).answer == sync_state.answer for r in results)
+    assert "".join(p for kind, p in events if kind == "token") == ANSWER_REPLY
+    assert dict(events)["risk"][0] == "High" and events[-1][1].answer == sync_state.answer
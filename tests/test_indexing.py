@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from langchain_core.documents import Document
+from test_cache import CountingEmbeddings
+
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+from uae_legal_rag.vectorstore.indexing import chunk_id, sync_document
+
+
+def _docs(*texts: str) -> list[Document]:
+    return [
+        Document(page_content=t, metadata={"filename": "msa.pdf", "page": i})
+        for i, t in enumerate(texts, start=1)
+    ]
+
+
+def test_chunk_ids_are_stable_and_file_scoped():
+    assert chunk_id("a.pdf", "penalty") == chunk_id("a.pdf", "penalty")
+    assert chunk_id("a.pdf", "penalty") != chunk_id("b.pdf", "penalty")
+    assert chunk_id("a.pdf", "penalty", 1) != chunk_id("a.pdf", "penalty")
+
+
+def test_reindex_embeds_only_changed_chunks():
+    emb = CountingEmbeddings()
+    vs = get_chroma(emb, persist_dir=None, collection_name="test_reindex")
+
+    first = sync_document(vs, "msa.pdf", _docs("liability cap", "penalty clause", "pdpl data"))
+    assert (first.added, first.unchanged, first.deleted) == (3, 0, 0)
+
+    emb.embedded.clear()
+    # Amendment page inserted up front; "penalty clause" removed.
+    second = sync_document(vs, "msa.pdf", _docs("termination", "liability cap", "pdpl data"))
+
+    assert (second.added, second.unchanged, second.deleted) == (1, 2, 1)
+    assert emb.embedded == ["termination"]
+    got = vs.get(where={"filename": "msa.pdf"})
+    assert sorted(got["documents"]) == ["liability cap", "pdpl data", "termination"]
+    # Unchanged chunks pick up their new page numbers without re-embedding.
+    pages = {doc: meta["page"] for doc, meta in zip(got["documents"], got["metadatas"])}
+    assert pages["liability cap"] == 2
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+from synthetic import make_synthetic_pdf
+from test_cache import CountingEmbeddings
+
+from uae_legal_rag.cache.embeddings import CachedEmbeddings
+from uae_legal_rag.embedding_scheduler import ConcurrentEmbeddings
+from uae_legal_rag.ingestion.cli import Manifest, ingest_directory
+from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+
+def _corpus(root):
+    (root / "sub").mkdir()
+    (root / "a.pdf").write_bytes(make_synthetic_pdf(3, seed=1))
+    (root / "sub" / "b.pdf").write_bytes(make_synthetic_pdf(2, seed=2))
+    (root / "broken.pdf").write_bytes(b"not a pdf")
+    (root / "notes.txt").write_text("ignored")
+
+
+def test_ingest_directory_records_manifest_and_resumes(tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    _corpus(root)
+    emb = CountingEmbeddings()
+    vs = get_chroma(emb, persist_dir=None, collection_name="test_bulk")
+    manifest_path = tmp_path / "manifest.json"
+
+    stats = ingest_directory(
+        root, vs, Manifest(manifest_path), workers=2, batch_size=4, log=lambda _m: None
+    )
+
+    files = json.loads(manifest_path.read_text())["files"]
+    assert files["a.pdf"]["status"] == files["sub/b.pdf"]["status"] == "done"
+    assert files["broken.pdf"]["status"] == "failed"
+    assert (stats.files_found, stats.files_indexed, stats.files_failed) == (3, 2, 1)
+    assert stats.pages == 5
+    assert stats.chunks_added == vs._collection.count() == len(emb.embedded)
+    assert stats.embedding_calls == 2  # no scheduler: one call per indexed file
+
+    # Re-run: done files are skipped; only the failed one is retried.
+    (root / "sub" / "b.pdf").write_bytes(make_synthetic_pdf(2, seed=3))
+    emb.embedded.clear()
+    stats = ingest_directory(root, vs, Manifest(manifest_path), log=lambda _m: None)
+
+    assert (stats.files_skipped, stats.files_indexed, stats.files_failed) == (1, 1, 1)
+    assert stats.chunks_deleted > 0
+    assert len(emb.embedded) == stats.chunks_added
+
+
+def test_ingest_directory_reports_the_schedulers_api_requests(tmp_path):
+    root = tmp_path / "docs"
+    root.mkdir()
+    _corpus(root)
+    inner = CountingEmbeddings()
+    emb = CachedEmbeddings(
+        ConcurrentEmbeddings(inner, batch_texts=2), model="m", db_path=str(tmp_path / "e.db")
+    )
+    vs = get_chroma(emb, persist_dir=None, collection_name="test_bulk_requests")
+
+    stats = ingest_directory(root, vs, Manifest(tmp_path / "manifest.json"), log=lambda _m: None)
+
+    scheduler = emb.underlying
+    assert stats.embedding_calls == scheduler.stats.requests > stats.files_indexed
+    assert stats.texts_embedded == len(inner.embedded)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from synthetic import make_synthetic_pdf
+
+from uae_legal_rag.ingestion import loaders
+from uae_legal_rag.ingestion.loaders import load_pdf_bytes
+
+
+def test_page_ranges_cover_every_page_in_order():
+    ranges = loaders._page_ranges(103, workers=4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 103
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:], strict=False))
+
+
+def test_parallel_pdf_extraction_matches_serial(monkeypatch):
+    pdf = make_synthetic_pdf(12)
+    serial = load_pdf_bytes(pdf, "msa.pdf", max_workers=1)
+
+    monkeypatch.setattr(loaders, "PARALLEL_MIN_PAGES", 4)
+    parallel = load_pdf_bytes(pdf, "msa.pdf", max_workers=2)
+
+    assert [d.metadata["page"] for d in parallel] == list(range(1, 13))
+    assert [d.page_content for d in parallel] == [d.page_content for d in serial]
+
+
+def test_streamed_pdf_pages_come_from_the_pool_in_order(monkeypatch):
+    import io
+
+    pdf = make_synthetic_pdf(12)
+    serial = load_pdf_bytes(pdf, "msa.pdf", max_workers=1)
+    used = []
+    extract_parallel = loaders._extract_parallel
+
+    def spy(*args):
+        used.append(args[1:])
+        return extract_parallel(*args)
+
+    monkeypatch.setattr(loaders, "PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(loaders, "RANGES_PER_WORKER", 3)  # more ranges than the window
+    monkeypatch.setattr(loaders, "_extract_parallel", spy)
+    n_pages, pages = loaders.open_pdf_pages(io.BytesIO(pdf), "msa.pdf", max_workers=2)
+
+    assert [d.page_content for d in pages] == [d.page_content for d in serial]
+    assert n_pages == 12 and used == [(12, 2, "pypdf")]
+
+
+def test_ingest_stream_indexes_batches_incrementally():
+    import io
+
+    from test_smoke import DeterministicEmbeddings
+
+    from uae_legal_rag.ingestion.chunking import chunk_documents
+    from uae_legal_rag.ingestion.pipeline import ingest_stream
+    from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+    pdfs = {"a.pdf": make_synthetic_pdf(5, seed=1), "b.pdf": make_synthetic_pdf(3, seed=2)}
+    vs = get_chroma(DeterministicEmbeddings(), persist_dir=None, collection_name="test_stream")
+    seen: list[int] = []
+
+    result = ingest_stream(
+        [(name, io.BytesIO(data)) for name, data in pdfs.items()],
+        vs,
+        batch_size=4,
+        on_progress=lambda p: seen.append(p.chunks_indexed),
+    )
+
+    expected = sum(len(chunk_documents(load_pdf_bytes(d, n))) for n, d in pdfs.items())
+    assert result.pages_loaded == 8
+    assert result.chunks_indexed == expected == vs._collection.count()
+    assert seen == sorted(seen) and len(seen) > 2
+    assert result.fraction == 1.0
+
+
+def test_ingest_stream_reupload_embeds_nothing_new():
+    import io
+
+    from test_cache import CountingEmbeddings
+
+    from uae_legal_rag.ingestion.pipeline import ingest_stream
+    from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+    pdf = make_synthetic_pdf(4, seed=5)
+    emb = CountingEmbeddings()
+    vs = get_chroma(emb, persist_dir=None, collection_name="test_reupload")
+
+    first = ingest_stream([("c.pdf", io.BytesIO(pdf))], vs, batch_size=2)
+    emb.embedded.clear()
+    again = ingest_stream([("c.pdf", io.BytesIO(pdf))], vs, batch_size=2)
+
+    assert first.chunks_indexed == again.chunks_unchanged > 0
+    assert again.chunks_indexed == again.chunks_deleted == 0
+    assert emb.embedded == []
+    assert vs._collection.count() == first.chunks_indexed
+
+
+def test_ingest_stream_rejects_duplicate_filenames_before_writing():
+    import io
+
+    import pytest
+    from test_smoke import DeterministicEmbeddings
+
+    from uae_legal_rag.ingestion.pipeline import ingest_stream
+    from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+    vs = get_chroma(DeterministicEmbeddings(), persist_dir=None, collection_name="test_dupes")
+    sources = [
+        ("a.pdf", io.BytesIO(make_synthetic_pdf(3, seed=1))),
+        ("b.pdf", io.BytesIO(make_synthetic_pdf(2, seed=2))),
+        ("a.pdf", io.BytesIO(make_synthetic_pdf(3, seed=3))),
+    ]
+    with pytest.raises(ValueError, match="a.pdf"):
+        ingest_stream(sources, vs)
+    assert vs._collection.count() == 0
+
+
+def test_cached_splitter_matches_tiktoken_splitter():
+    import random
+
+    from langchain_core.documents import Document
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    from synthetic import synthetic_page_text
+
+    from uae_legal_rag.ingestion.chunking import chunk_documents, get_legal_splitter
+
+    rng = random.Random(0)
+    docs = [Document(page_content=synthetic_page_text(p, rng, 40)) for p in range(1, 4)]
+    reference = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=1300,
+        chunk_overlap=200,
+        separators=["\n\n", "\n", ". ", "; ", ": ", " ", ""],
+    ).split_documents(docs)
+
+    assert get_legal_splitter() is get_legal_splitter()
+    assert [c.page_content for c in chunk_documents(docs)] == [c.page_content for c in reference]
+
+
+def test_clause_chunker_keeps_clauses_whole_with_metadata():
+    from langchain_core.documents import Document
+
+    from uae_legal_rag.ingestion.chunking import chunk_documents, token_len
+    from uae_legal_rag.ingestion.clause_chunker import chunk_by_clause
+
+    text = (
+        "WHEREAS the parties wish to contract.\n"
+        "12. TERMINATION\n"
+        "12.1 Either party may terminate on written notice of\n"
+        "30 days to the other party.\n"
+        "12.1.1 Notice must be in writing.\n"
+        "13. GOVERNING LAW\n"
+        "13.1 The courts of the DIFC have jurisdiction.\n"
+    )
+    page = Document(page_content=text, metadata={"filename": "msa.pdf", "page": 3})
+
+    chunks = chunk_documents([page], strategy="clause")
+    by_number = {c.metadata.get("clause_number"): c for c in chunks}
+
+    assert by_number["12"].metadata["clause_numbers"] == "12,12.1,12.1.1"
+    assert "30 days to the other party" in by_number["12"].page_content
+    assert by_number["12"].metadata["clause_heading"] == "TERMINATION"
+    assert by_number["13"].metadata["section_type"] == "governing_law"
+    assert chunks[0].metadata["clause_kind"] == "recital"
+
+    tight = chunk_by_clause([page], max_tokens=20, overlap_tokens=0)
+    assert len(tight) > len(chunks)
+    assert all(token_len(c.page_content) <= 20 for c in tight)
+    assert {c.metadata["page"] for c in tight} == {3}
+
+
+def test_ingest_stream_serves_repeat_uploads_from_page_cache(tmp_path):
+    import io
+
+    from test_smoke import DeterministicEmbeddings
+
+    from uae_legal_rag.cache.pages import PageTextCache
+    from uae_legal_rag.ingestion.pipeline import ingest_stream
+    from uae_legal_rag.vectorstore.chroma_client import get_chroma
+
+    pdf = make_synthetic_pdf(3, seed=4)
+    cache = PageTextCache(str(tmp_path / "pages.sqlite"))
+    contents = []
+    for session in ("cold", "warm"):
+        vs = get_chroma(DeterministicEmbeddings(), None, f"test_page_cache_{session}")
+        ingest_stream([("a.pdf", io.BytesIO(pdf))], vs, page_cache=cache)
+        contents.append(sorted(vs.get()["documents"]))
+
+    assert contents[0] == contents[1]
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+def test_pdf_backends_return_the_same_documents(monkeypatch):
+    import difflib
+
+    import pytest
+
+    pytest.importorskip("pymupdf")
+
+    pdf = make_synthetic_pdf(6, seed=3)
+    by_backend = {b: load_pdf_bytes(pdf, "msa.pdf", backend=b) for b in ("pypdf", "pymupdf")}
+
+    assert [d.metadata for d in by_backend["pymupdf"]] == [d.metadata for d in by_backend["pypdf"]]
+    for a, b in zip(by_backend["pypdf"], by_backend["pymupdf"], strict=True):
+        # Extractors differ in glyph mapping details (e.g. ' vs ’), not in content.
+        words = difflib.SequenceMatcher(None, a.page_content.split(), b.page_content.split())
+        assert words.ratio() > 0.98
+
+    monkeypatch.setattr(loaders, "PARALLEL_MIN_PAGES", 4)
+    parallel = load_pdf_bytes(pdf, "msa.pdf", max_workers=2, backend="pymupdf")
+    assert [d.page_content for d in parallel] == [d.page_content for d in by_backend["pymupdf"]]
+
+
+def test_pdf_backend_selection_policy(monkeypatch):
+    import pytest
+
+    from uae_legal_rag.ingestion import pdf_backends
+
+    monkeypatch.setattr(pdf_backends, "pymupdf_available", lambda: True)
+    assert pdf_backends.select_backend(1024).name == "pypdf"
+    assert pdf_backends.select_backend(pdf_backends.PYMUPDF_MIN_BYTES).name == "pymupdf"
+    assert pdf_backends.select_backend(10**9, "pypdf").name == "pypdf"
+
+    monkeypatch.setattr(pdf_backends, "pymupdf_available", lambda: False)
+    assert pdf_backends.select_backend(10**9).name == "pypdf"
+    with pytest.raises(ValueError, match="PyMuPDF"):
+        pdf_backends.select_backend(0, "pymupdf")
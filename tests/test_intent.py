@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+from fake_chat import SlowChatModel
+from intent_samples import LABELED_MESSAGES
+
+from uae_legal_rag.intent import SEED_EXAMPLES, _normalize, classify_intent, resolve_intent
+
+
+def test_labeled_messages_are_not_training_phrases():
+    seeds = {phrase for phrases in SEED_EXAMPLES.values() for phrase in phrases}
+    assert [t for t, _ in LABELED_MESSAGES if _normalize(t) in seeds] == []
+
+
+def test_local_classifier_accuracy_on_labeled_messages():
+    correct = sum(classify_intent(text).intent == label for text, label in LABELED_MESSAGES)
+
+    assert correct / len(LABELED_MESSAGES) >= 0.9
+
+
+@pytest.mark.parametrize(
+    ("text", "intent"),
+    [
+        ("Hello!", "greeting"),
+        ("good morning, how are you?", "greeting"),
+        ("Who made you?", "about"),
+        ("Does the NDA survive termination?", "document"),
+        ("Is there a non-compete?", "document"),
+        # Short cues only match whole words.
+        ("Please remind me what day Monday is", "general"),
+    ],
+)
+def test_rules(text, intent):
+    assert classify_intent(text).intent == intent
+
+
+def test_llm_is_only_asked_below_min_confidence():
+    llm = SlowChatModel(responses=["Document."])
+
+    confident = resolve_intent("What are the payment terms?", llm=llm, min_confidence=0.6)
+    assert (confident.intent, confident.source, llm.calls) == ("document", "rules", 0)
+
+    unsure = classify_intent("How many days until Ramadan?")
+    assert unsure.confidence < 0.6
+    resolved = resolve_intent("How many days until Ramadan?", llm=llm, min_confidence=0.6)
+    assert (resolved.intent, resolved.source, llm.calls) == ("document", "llm", 1)
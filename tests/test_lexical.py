@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+from langchain_core.documents import Document
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.ingestion.chunking import tag_sections
+from uae_legal_rag.rag.retriever import HybridRetriever, build_retriever
+from uae_legal_rag.vectorstore.chroma_client import get_chroma, reset_chroma_collection
+from uae_legal_rag.vectorstore.indexing import sync_document
+from uae_legal_rag.vectorstore.lexical import BM25Index, lexical_index, tokenize
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
+
+CLAUSES = [
+    "Clause 14.2 Liquidated damages of 0.5% per week apply to late delivery.",
+    "Clause 14.3 The penalty cap is ten percent of the contract price.",
+    "Clause 9.1 The Supplier shall comply with the PDPL for personal data.",
+    "Clause 20.4 Either party may terminate on ninety days' notice.",
+    "Clause 11.2 Liability for indirect loss is excluded.",
+]
+
+
+def _docs(clauses=CLAUSES) -> list[Document]:
+    return [Document(page_content=c, metadata={"filename": "msa.pdf"}) for c in clauses]
+
+
+def test_bm25_ranks_exact_terms_and_keeps_clause_numbers():
+    assert tokenize("See Clause 14.2, and the PDPL.") == ["see", "clause", "14.2", "pdpl"]
+
+    index = BM25Index()
+    index.add([f"c{i}" for i in range(len(CLAUSES))], CLAUSES)
+    assert index.search("clause 14.2", k=1)[0][0] == "c0"
+    assert index.search("liquidated damages", k=5) == index.search("LIQUIDATED damages!", k=5)
+    assert [i for i, _ in index.search("liquidated damages", k=5)] == ["c0"]
+
+    index.add(["c0"], ["Clause 14.2 was deleted."])  # re-indexing replaces
+    index.remove(["c1", "missing"])
+    assert len(index) == 4 and index.search("liquidated", k=3) == []
+    assert index.search("14.3", k=3) == []
+
+
+def test_index_follows_incremental_writes_and_external_drift():
+    vs = NumpyVectorStore(DeterministicEmbeddings())
+    sync_document(vs, "msa.pdf", _docs())
+    index = lexical_index(vs)  # built from the store's texts
+    assert len(index) == len(CLAUSES)
+
+    sync_document(vs, "msa.pdf", _docs(CLAUSES[:2] + ["Clause 30.1 Arbitration in DIAC."]))
+    assert lexical_index(vs) is index and len(index) == 3
+    assert [vs.get_by_ids([i])[0].page_content for i, _ in index.search("DIAC", k=1)] == [
+        "Clause 30.1 Arbitration in DIAC."
+    ]
+
+    vs.add_texts(["Clause 40.1 Escrow of source code."])  # a write the hooks don't see
+    assert lexical_index(vs).search("escrow", k=1)
+
+    reset_chroma_collection(vs)
+    assert len(index) == 0
+
+
+@pytest.mark.filterwarnings("ignore:Relevance scores must be between")
+def test_hybrid_retriever_finds_exact_terms_dense_search_misses():
+    # The toy embeddings only know a few keywords: "liquidated damages" and "DIAC"
+    # look like every other clause to them.
+    vs = get_chroma(DeterministicEmbeddings(), None, f"test_hybrid_{uuid.uuid4().hex[:8]}")
+    sync_document(vs, "msa.pdf", _docs())
+    dense = build_retriever(vs, k=1)
+    hybrid = build_retriever(vs, k=2, mode="hybrid")
+    assert isinstance(hybrid, HybridRetriever)
+
+    sync_document(vs, "msa.pdf", _docs([*CLAUSES, "Clause 30.1 Arbitration in DIAC."]))
+    assert dense.invoke("which forum, DIAC?")[0].page_content != CLAUSES[-1]
+    hits = hybrid.invoke("which forum, DIAC?")
+    assert "DIAC" in hits[0].page_content
+    assert hits[0].metadata["score"] >= hits[1].metadata["score"] > 0
+
+    hits = hybrid.invoke("liquidated damages")
+    assert hits[0].page_content == CLAUSES[0]
+    assert asyncio.run(hybrid.ainvoke("liquidated damages")) == hits
+
+
+def test_routed_hybrid_search_filters_on_indexed_flags_not_the_store(monkeypatch):
+    vs = NumpyVectorStore(DeterministicEmbeddings())
+    docs = _docs()
+    tag_sections(docs)
+    sync_document(vs, "msa.pdf", docs)
+    index = lexical_index(vs)
+    hits = index.search("clause", k=5, flags=["has_termination", "has_payment"])
+    assert [vs.get_by_ids([i])[0].page_content for i, _ in hits] == [CLAUSES[3]]
+    assert index.search("clause", k=5, flags=[]) == []
+
+    # A metadata-only update (the clause loses its tag) reaches the index too.
+    untagged = [
+        Document(page_content=d.page_content, metadata={"filename": "msa.pdf"}) for d in docs
+    ]
+    sync_document(vs, "msa.pdf", untagged)
+    assert index.search("terminate", k=5, flags=["has_termination"]) == []
+
+    sync_document(vs, "msa.pdf", docs)
+    monkeypatch.setattr(vs, "get", lambda *a, **k: pytest.fail("store scanned per query"))
+    hybrid = build_retriever(vs, k=1, mode="hybrid", route_sections=True)
+    assert hybrid.invoke("Can either party terminate?")[0].page_content == CLAUSES[3]
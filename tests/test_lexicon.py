@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from synthetic import CLAUSE_TEMPLATES
+
+from uae_legal_rag.graph.legal_graph import RISK_MARKERS, deterministic_risk_score
+from uae_legal_rag.ingestion.chunking import SECTION_RULES, infer_section_type
+from uae_legal_rag.lexicon import LexiconMatcher
+
+
+def _reference_section_type(text: str) -> str | None:
+    t = text.lower()
+    for label, pats in SECTION_RULES.items():
+        if any(p in t for p in pats):
+            return label
+    return None
+
+
+def _reference_risk_score(text: str):
+    t = (text or "").lower()
+    hits_high = sorted({m for m in RISK_MARKERS["high"] if m in t})
+    hits_med = sorted({m for m in RISK_MARKERS["medium"] if m in t})
+    if hits_high:
+        return "High", f"High-risk markers found: {', '.join(hits_high)}."
+    if len(hits_med) >= 2:
+        return "Medium", f"Multiple moderate-risk topics: {', '.join(hits_med)}."
+    if hits_med:
+        return "Medium", f"Moderate-risk topic detected: {', '.join(hits_med)}."
+    return "Low", "No explicit high-risk markers detected by the rule layer."
+
+
+def _corpus(n: int = 400) -> list[str]:
+    rng = random.Random(42)
+    phrases = [p for ps in (*SECTION_RULES.values(), *RISK_MARKERS.values()) for p in ps]
+    filler = ["the", "Supplier", "calendar", "shall", "Termination Without Notice", "PDPL"]
+    texts = []
+    for _ in range(n):
+        words = rng.choices(phrases + filler, k=rng.randint(0, 6))
+        if rng.random() < 0.5:
+            words.append(rng.choice(CLAUSE_TEMPLATES))
+        # Glue some words together so phrases also occur inside other words.
+        texts.append("".join(w + rng.choice([" ", "", "\n"]) for w in words))
+    return texts + ["", "unlimited liability", "termination without notice", "nda"]
+
+
+def test_section_labels_unchanged():
+    for text in _corpus():
+        assert infer_section_type(text) == _reference_section_type(text)
+
+
+def test_risk_levels_unchanged():
+    for text in _corpus():
+        assert deterministic_risk_score(text) == _reference_risk_score(text)
+
+
+@pytest.mark.parametrize("engine", ["scan", "regex"])
+def test_matcher_reports_overlapping_hits_and_batches(engine):
+    lexicon = {"a": ["termination"], "b": ["termination without notice"], "c": ["nda"]}
+    m = LexiconMatcher(lexicon, engine=engine)
+
+    assert m.terms("Termination without notice") == {"termination", "termination without notice"}
+    assert m.labels("calendar; termination without notice") == ["a", "b", "c"]
+    texts = _corpus(50)
+    assert m.labels_batch(texts) == [m.labels(t) for t in texts]
+
+
+def test_engines_agree():
+    texts = _corpus()
+    for lexicon in (SECTION_RULES, RISK_MARKERS):
+        scan = LexiconMatcher(lexicon, engine="scan")
+        regex = LexiconMatcher(lexicon, engine="regex")
+        assert scan.terms_batch(texts) == regex.terms_batch(texts)
+        assert [scan.first_label(t) for t in texts] == [regex.first_label(t) for t in texts]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from openai_stub import EMBEDDING_DIM, OpenAIStub
+
+from uae_legal_rag.clients import get_client_registry, reset_client_registries
+from uae_legal_rag.config import get_settings
+from uae_legal_rag.llm import get_chat_llm, get_embeddings
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    with OpenAIStub(latency_s=0.01) as stub:
+        monkeypatch.setenv("OPENAI_BASE_URL", stub.base_url)
+        yield stub
+    reset_client_registries()
+
+
+def _settings(tmp_path, pool_size: int):
+    return dataclasses.replace(
+        get_settings(),
+        openai_api_key="test-key",
+        openai_model="gpt-stub",
+        cache_dir=str(tmp_path),
+        embedding_cache_max_entries=0,
+        llm_cache_max_entries=0,
+        http_pool_size=pool_size,
+    )
+
+
+def test_clients_are_shared_per_model_and_key(stub, tmp_path):
+    settings = _settings(tmp_path, pool_size=3)
+
+    assert get_chat_llm(settings) is get_chat_llm(settings)
+    assert get_chat_llm(settings) is not get_chat_llm(settings, api_key_override="other-key")
+    assert get_embeddings(settings) is get_embeddings(settings)
+
+    registry = get_client_registry(3)
+    assert len(registry) == 3
+    assert get_chat_llm(settings).root_client._client is registry.http_client
+
+
+def test_concurrent_sessions_reuse_pooled_connections(stub, tmp_path):
+    settings = _settings(tmp_path, pool_size=4)
+
+    def session(i: int) -> tuple[str, list[float]]:
+        # Each "session" asks for its clients the way the UI does, per message.
+        answer = get_chat_llm(settings).invoke(f"question {i}").content
+        vector = get_embeddings(settings).embed_query(f"question {i}")
+        return str(answer), vector
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(session, range(40)))
+
+    assert all(answer == stub.reply for answer, _ in results)
+    assert all(len(vector) == EMBEDDING_DIM for _, vector in results)
+    stats = get_client_registry(4).stats
+    assert stats.requests == stub.requests == 80
+    assert stats.connections_opened == stub.connections <= 4
+    assert stats.reuse_rate >= 0.9
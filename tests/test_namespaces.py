@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.documents import Document
+from test_cache import CountingEmbeddings
+
+from uae_legal_rag.vectorstore.chroma_client import chroma_client
+from uae_legal_rag.vectorstore.indexing import sync_document
+from uae_legal_rag.vectorstore.namespaces import VectorStoreRegistry, namespace_collection
+from uae_legal_rag.vectorstore.persistence import StoreWriter
+
+DOCS = [
+    Document(page_content="Penalty for late delivery.", metadata={"filename": "msa.pdf"}),
+    Document(page_content="PDPL data protection applies.", metadata={"filename": "msa.pdf"}),
+]
+
+
+def test_namespace_collection_names_are_valid_and_distinct():
+    assert namespace_collection("docs", "default") == "docs"
+    assert namespace_collection("docs", "acme") == "docs--acme"
+    odd = {namespace_collection("docs", n) for n in ("Acme Inc", "Acme/Inc", "acme")}
+    assert len(odd) == 3
+    assert all(set(n) <= set("abcdefghijklmnopqrstuvwxyzAI0123456789.-_") for n in odd)
+
+
+def test_sessions_share_a_namespace_and_tenants_are_isolated():
+    registry = VectorStoreRegistry(None, "test_ns_share")
+    emb = CountingEmbeddings()
+    first, second = registry.acquire("acme", emb), registry.acquire("acme", emb)
+    other = registry.acquire("globex", emb)
+
+    assert first.vectorstore is second.vectorstore
+    sync_document(first.vectorstore, "msa.pdf", DOCS)
+    again = sync_document(second.vectorstore, "msa.pdf", DOCS)
+
+    assert (again.added, again.unchanged) == (0, 2)
+    assert len(emb.embedded) == 2
+    hit = second.vectorstore.similarity_search("penalty", k=1)[0]
+    assert hit.page_content == DOCS[0].page_content
+    assert other.vectorstore.get()["ids"] == []
+
+
+def test_last_release_drops_the_in_memory_namespace():
+    registry = VectorStoreRegistry(None, "test_ns_release")
+    emb = CountingEmbeddings()
+    lease = registry.acquire("acme", emb)
+    sync_document(lease.vectorstore, "msa.pdf", DOCS)
+    session = registry.acquire("acme", emb)
+
+    lease.release()
+    lease.release()  # idempotent
+    assert lease.released and registry.refcount("acme") == 1
+
+    del session  # e.g. a Streamlit session being garbage collected
+    gc.collect()
+    assert registry.refcount("acme") == 0 and registry.namespaces() == []
+    fresh = registry.acquire("acme", emb)
+    assert fresh.vectorstore.get()["ids"] == []
+
+
+def test_concurrent_acquire_and_release_keeps_counts_consistent():
+    registry = VectorStoreRegistry(None, "test_ns_threads")
+    emb = CountingEmbeddings()
+    held = registry.acquire("acme", emb)
+
+    def session(i: int) -> None:
+        with registry.acquire("acme" if i % 2 else "globex", emb) as lease:
+            lease.vectorstore.get(limit=1)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(session, range(64)))
+
+    assert registry.refcount("acme") == 1 and registry.namespaces() == ["acme"]
+    held.release()
+    assert registry.namespaces() == []
+
+
+def test_persistent_streamlit_registry_reopens_without_reindexing(tmp_path, monkeypatch):
+    monkeypatch.setenv("STREAMLIT_SERVER_RUN_ON_SAVE", "false")
+    persist_dir = str(tmp_path / "chroma")
+    assert not VectorStoreRegistry(persist_dir, "test_ns_disk").persistent
+
+    registry = VectorStoreRegistry(persist_dir, "test_ns_disk", persist_in_streamlit=True)
+    with registry.acquire("acme", CountingEmbeddings()) as lease, lease.write_lock:
+        sync_document(lease.vectorstore, "msa.pdf", DOCS)
+
+    # A restarted server: nothing is opened until the first session arrives.
+    emb = CountingEmbeddings()
+    restarted = VectorStoreRegistry(persist_dir, "test_ns_disk", persist_in_streamlit=True)
+    assert restarted._client is None
+    with restarted.acquire("acme", emb) as lease:
+        hit = lease.vectorstore.similarity_search("penalty", k=1)[0]
+    assert hit.page_content == DOCS[0].page_content and emb.embedded == []
+    assert restarted.interrupted() is None
+
+
+def test_private_namespaces_are_isolated_and_never_persisted(tmp_path, monkeypatch):
+    monkeypatch.setenv("STREAMLIT_SERVER_RUN_ON_SAVE", "false")
+    registry = VectorStoreRegistry(
+        str(tmp_path / "chroma"), "test_ns_private", persist_in_streamlit=True
+    )
+    emb = CountingEmbeddings()
+    mine, theirs = registry.acquire_private(emb), registry.acquire_private(emb)
+    assert mine.namespace != theirs.namespace
+    sync_document(mine.vectorstore, "msa.pdf", DOCS)
+    assert theirs.vectorstore.get()["ids"] == []
+
+    name = mine.vectorstore._collection.name
+    mine.release()
+    assert registry.namespaces() == [theirs.namespace]
+    assert name not in [c.name for c in chroma_client(None).list_collections()]
+    assert registry.client.list_collections() == []  # nothing written to the shared disk
+
+
+def test_store_writer_is_exclusive_and_flags_failed_writes(tmp_path):
+    first, second = StoreWriter(str(tmp_path)), StoreWriter(str(tmp_path), label="other")
+    order: list[str] = []
+
+    def write_later() -> None:
+        with second:
+            order.append("second")
+
+    with first:
+        thread = threading.Thread(target=write_later)
+        thread.start()
+        time.sleep(0.1)
+        order.append("first")
+        # A write in progress is not an interruption.
+        assert second.interrupted() is None
+    thread.join()
+    assert order == ["first", "second"] and first.interrupted() is None
+
+    with pytest.raises(RuntimeError), second:
+        raise RuntimeError("embedding API down")
+    assert first.interrupted()["label"] == "other"
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from langchain_core.documents import Document
+from test_cache import CountingEmbeddings
+from test_smoke import DeterministicEmbeddings
+
+from uae_legal_rag.rag.retriever import build_retriever
+from uae_legal_rag.vectorstore.backends import count_documents, flush_vectorstore, get_vectorstore
+from uae_legal_rag.vectorstore.chroma_client import get_chroma, reset_chroma_collection
+from uae_legal_rag.vectorstore.indexing import sync_document
+from uae_legal_rag.vectorstore.namespaces import VectorStoreRegistry
+from uae_legal_rag.vectorstore.numpy_store import NumpyVectorStore
+
+TEXTS = [
+    "Penalty for late delivery.",
+    "PDPL data protection applies to personal data.",
+    "Termination for convenience on notice.",
+    "Liability is capped; indemnity for data breaches.",
+    "Penalty and liability for termination.",
+]
+METAS = [
+    {"filename": "a.pdf", "page": 1, "section_type": "payment"},
+    {"filename": "a.pdf", "page": 2, "section_type": "data_protection"},
+    {"filename": "b.pdf", "page": 1, "section_type": "termination"},
+    {"filename": "b.pdf", "page": 3, "section_type": "liability"},
+    {"filename": "c.pdf", "page": 5, "section_type": "liability"},
+]
+
+
+class RandomEmbeddings(DeterministicEmbeddings):
+    """Seeded 32-d unit vectors (so Chroma's L2 ranking equals cosine ranking)."""
+
+    def _embed(self, text: str):
+        v = np.random.default_rng(list(text.encode())).standard_normal(32)
+        return (v / np.linalg.norm(v)).tolist()
+
+
+def _store(emb=None) -> NumpyVectorStore:
+    vs = NumpyVectorStore(emb or RandomEmbeddings())
+    vs.add_texts(TEXTS, metadatas=METAS, ids=[f"id{i}" for i in range(len(TEXTS))])
+    return vs
+
+
+def test_search_matches_brute_force_and_chroma():
+    emb = RandomEmbeddings()
+    vs = _store(emb)
+    chroma = get_chroma(emb, None, "test_numpy_parity")
+    reset_chroma_collection(chroma)
+    chroma.add_texts(TEXTS, metadatas=METAS, ids=[f"id{i}" for i in range(len(TEXTS))])
+
+    for query in ("penalty", "data protection", "termination notice"):
+        q = np.asarray(emb.embed_query(query))
+        m = np.asarray(emb.embed_documents(TEXTS))
+        cos = m @ q / (np.linalg.norm(m, axis=1) * np.linalg.norm(q))
+        expected = [TEXTS[i] for i in np.argsort(-cos)[:3]]
+
+        hits = vs.similarity_search_with_score(query, k=3)
+        assert [d.page_content for d, _ in hits] == expected
+        assert [d.page_content for d in chroma.similarity_search(query, k=3)] == expected
+        np.testing.assert_allclose([s for _, s in hits], 1 - np.sort(cos)[::-1][:3], atol=1e-5)
+
+
+def test_where_filters_use_chroma_syntax():
+    vs = _store()
+
+    def ids(where):
+        return sorted(vs.get(where=where)["ids"])
+
+    assert ids({"filename": "a.pdf"}) == ["id0", "id1"]
+    assert ids({"section_type": {"$in": ["liability", "termination"]}}) == ["id2", "id3", "id4"]
+    assert ids({"$and": [{"section_type": "liability"}, {"page": {"$gte": 4}}]}) == ["id4"]
+    assert ids({"$or": [{"filename": "c.pdf"}, {"page": {"$lt": 2}}]}) == ["id0", "id2", "id4"]
+    assert ids({"section_type": {"$nin": ["liability"]}, "filename": {"$ne": "a.pdf"}}) == ["id2"]
+
+    hits = vs.similarity_search("penalty", k=5, filter={"section_type": "liability"})
+    assert {d.id for d in hits} == {"id3", "id4"}
+    assert vs.similarity_search("penalty", k=2, filter={"filename": "zzz.pdf"}) == []
+
+
+def test_sync_document_upserts_and_deletes_in_place():
+    emb = CountingEmbeddings()
+    vs = NumpyVectorStore(emb)
+    docs = [Document(page_content=t, metadata={"filename": "msa.pdf"}) for t in TEXTS[:3]]
+    sync_document(vs, "msa.pdf", docs)
+
+    result = sync_document(vs, "msa.pdf", [docs[0], docs[2]])
+    assert (result.added, result.unchanged, result.deleted) == (0, 2, 1)
+    assert count_documents(vs) == 2 and len(emb.embedded) == 3
+    assert [d.page_content for d in vs.similarity_search("termination", k=1)] == [TEXTS[2]]
+
+    vs.add_texts(["Penalty doubled."], metadatas=[{"filename": "x"}], ids=[vs.get()["ids"][0]])
+    assert count_documents(vs) == 2
+    reset_chroma_collection(vs)
+    assert count_documents(vs) == 0 and vs.similarity_search("penalty", k=1) == []
+
+
+def test_save_and_reopen_memory_mapped(tmp_path):
+    emb = RandomEmbeddings()
+    vs = get_vectorstore(emb, str(tmp_path), "docs", backend="numpy")
+    vs.add_texts(TEXTS, metadatas=METAS)
+    flush_vectorstore(vs)
+    before = [(d.page_content, s) for d, s in vs.similarity_search_with_score("liability", k=3)]
+
+    reopened = get_vectorstore(emb, str(tmp_path), "docs", backend="numpy")
+    assert isinstance(reopened._vectors, np.memmap)
+    assert [
+        (d.page_content, s) for d, s in reopened.similarity_search_with_score("liability", k=3)
+    ] == before
+
+    reopened.add_texts(["Governing law is the UAE."], metadatas=[{"filename": "d.pdf"}])
+    reopened.delete(ids=[reopened.get(where={"filename": "a.pdf"})["ids"][0]])
+    flush_vectorstore(reopened)
+    again = NumpyVectorStore(emb, tmp_path / "docs.npstore")
+    assert count_documents(again) == len(TEXTS)
+    assert len(list((tmp_path / "docs.npstore").glob("vectors-*.npy"))) == 1
+
+
+def test_build_retriever_scores_relevance():
+    vs = _store(DeterministicEmbeddings())
+    hits = build_retriever(vs, k=2).invoke("penalty liability termination")
+    assert hits[0].page_content == TEXTS[4]
+    assert 0 <= hits[1].metadata["score"] <= hits[0].metadata["score"] <= 1
+
+
+def test_registry_serves_numpy_namespaces(tmp_path, monkeypatch):
+    monkeypatch.setenv("STREAMLIT_SERVER_RUN_ON_SAVE", "false")
+    registry = VectorStoreRegistry(
+        str(tmp_path), "docs", persist_in_streamlit=True, backend="numpy"
+    )
+    with registry.acquire("acme", RandomEmbeddings()) as lease, lease.write_lock:
+        sync_document(lease.vectorstore, "msa.pdf", [Document(page_content=TEXTS[0])])
+        flush_vectorstore(lease.vectorstore)
+
+    restarted = VectorStoreRegistry(
+        str(tmp_path), "docs", persist_in_streamlit=True, backend="numpy"
+    )
+    with restarted.acquire("acme", RandomEmbeddings()) as lease:
+        assert isinstance(lease.vectorstore, NumpyVectorStore)
+        assert count_documents(lease.vectorstore) == 1
+    assert restarted._client is None  # no Chroma client was opened
+
+
+def test_empty_store_searches_return_nothing():
+    vs = NumpyVectorStore(DeterministicEmbeddings())
+    assert vs.similarity_search("penalty") == []
+    assert build_retriever(vs, k=2).invoke("penalty") == []
+    vs.add_texts(["Penalty for late delivery."], metadatas=[{"section_type": "payment"}])
+    assert vs.similarity_search("penalty", filter={"section_type": "liability"}) == []
+
+
+def test_save_merges_writes_saved_by_another_process(tmp_path):
+    emb = RandomEmbeddings()
+    path = tmp_path / "docs.npstore"
+    seed = NumpyVectorStore(emb, path)
+    seed.add_texts(TEXTS[:2], ids=["a", "b"])
+    seed.save()
+
+    # The app and lexiq-ingest each loaded the same save, then write in turn.
+    app, cli = NumpyVectorStore(emb, path), NumpyVectorStore(emb, path)
+    cli.add_texts([TEXTS[2]], ids=["cli"])
+    cli.save()
+    app.add_texts([TEXTS[3]], ids=["app"])
+    app.delete(["a"])
+    app.save()
+
+    merged = NumpyVectorStore(emb, path)
+    assert sorted(merged.get()["ids"]) == ["app", "b", "cli"]
+    assert merged.similarity_search(TEXTS[2], k=1)[0].id == "cli"
+    cli.add_texts([TEXTS[4]], ids=["cli2"])
+    cli.save()
+    assert sorted(NumpyVectorStore(emb, path).get()["ids"]) == ["app", "b", "cli", "cli2"]
+
+
+def test_save_survives_vector_files_still_mapped_elsewhere(tmp_path, monkeypatch):
+    emb = RandomEmbeddings()
+    path = tmp_path / "docs.npstore"
+    seed = NumpyVectorStore(emb, path)
+    seed.add_texts(TEXTS[:2], ids=["a", "b"])
+    seed.save()
+
+    # A metadata-only change keeps the loaded memmap; save moves it to the new file.
+    vs = NumpyVectorStore(emb, path)
+    vs.update_metadatas(["a"], [{"section_type": "payment"}])
+    vs.save()
+    (current,) = path.glob("vectors-*.npy")
+    assert Path(vs._vectors.filename).name == current.name
+
+    # Windows refuses to delete a file another process still maps.
+    real_unlink = Path.unlink
+
+    def locked(self, missing_ok=False):
+        if self.name == current.name:
+            raise PermissionError(13, "in use", str(self))
+        real_unlink(self, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", locked)
+    seed.add_texts([TEXTS[2]], ids=["c"])
+    seed.save()
+    assert len(list(path.glob("vectors-*.npy"))) == 2
+    assert sorted(NumpyVectorStore(emb, path).get()["ids"]) == ["a", "b", "c"]
+
+    monkeypatch.setattr(Path, "unlink", real_unlink)
+    seed.save()  # the leftover goes on a later save
+    assert len(list(path.glob("vectors-*.npy"))) == 1